@@ -0,0 +1,4 @@
+"""Benchmarks of castep_outputs parsers on synthetic, scalable inputs.
+
+Run with ``python -m benchmarks.run``, see ``python -m benchmarks.run --help``.
+"""
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Benchmark .castep parsing against a reference revision.
+
+Parses each file with the working tree and with ``castep_outputs`` as of a
+git revision (``--reference``, e.g. the commit before a change to section
+dispatch), each in a fresh process. The JSON dumps of both are required to
+be byte-identical.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import subprocess
+import sys
+import tarfile
+import tempfile
+from argparse import ArgumentParser
+from pathlib import Path
+
+from castep_outputs.parsers.castep_file_parser import Filters
+
+ROOT = Path(__file__).parent.parent
+DATA_FOLDER = ROOT / "test" / "data_files"
+
+# Run in a subprocess so each revision imports its own castep_outputs.
+_WORKER = """
+import io, sys, time
+from pathlib import Path
+from castep_outputs.parsers.castep_file_parser import Filters, parse_castep_file
+from castep_outputs.utilities.dumpers import get_dumpers
+from castep_outputs.utilities.utility import json_safe, normalise
+
+path, filters, repeat, out_path = Path(sys.argv[1]), sys.argv[2], int(sys.argv[3]), sys.argv[4]
+text = path.read_text(encoding="utf-8")
+
+start = time.perf_counter()
+for _ in range(repeat):
+    data = parse_castep_file(io.StringIO(text), filters=Filters[filters])
+elapsed = time.perf_counter() - start
+
+with open(out_path, "w", encoding="utf-8") as out:
+    get_dumpers("json")(normalise(data, {dict: json_safe, complex: json_safe}), out)
+sys.stdout.write(f"{elapsed}\\n")
+"""
+
+
+def _export(revision: str, dest: Path) -> None:
+    archive = subprocess.run(
+        ["git", "archive", "--format=tar", revision, "castep_outputs"],
+        cwd=ROOT, check=True, capture_output=True,
+    ).stdout
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        tar.extractall(dest, filter="data")
+
+
+def _run(source: Path, path: Path, filters: str, repeat: int, out: Path) -> tuple[float, bytes]:
+    env = {**os.environ, "PYTHONPATH": str(source)}
+    proc = subprocess.run(
+        [sys.executable, "-c", _WORKER, str(path), filters, str(repeat), str(out)],
+        cwd=source, env=env, check=True, capture_output=True, text=True,
+    )
+    return float(proc.stdout), out.read_bytes()
+
+
+def main() -> int:
+    """Run benchmark.
+
+    Returns
+    -------
+    :
+        Exit code, non-zero if any output differs.
+    """
+    argp = ArgumentParser(description=__doc__.splitlines()[0])
+    argp.add_argument("files", nargs="*", type=Path,
+                      default=sorted(DATA_FOLDER.glob("*.castep")),
+                      help="Files to benchmark (default: test corpus)")
+    argp.add_argument("-r", "--reference", required=True,
+                      help="Git revision to compare against.")
+    argp.add_argument("-n", "--repeat", type=int, default=5, help="Parses per file.")
+    argp.add_argument("--filters", default="FULL",
+                      choices=Filters.__members__,
+                      help="Filters to parse with.")
+    args = argp.parse_args()
+
+    failed = False
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        ref_source = tmp / "reference"
+        _export(args.reference, ref_source)
+
+        sys.stdout.write(f"{'File':30} {'Reference (s)':>15} {'Current (s)':>15} "
+                         f"{'Speedup':>8} Identical\n")
+        for path in args.files:
+            path = path.resolve()
+            ref_time, ref = _run(ref_source, path, args.filters, args.repeat, tmp / "ref.json")
+            new_time, new = _run(ROOT, path, args.filters, args.repeat, tmp / "new.json")
+
+            failed |= ref != new
+            sys.stdout.write(f"{path.name:30} {ref_time:15.3f} {new_time:15.3f} "
+                             f"{ref_time / new_time:8.1f} {ref == new}\n")
+
+    return int(failed)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
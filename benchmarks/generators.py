@@ -0,0 +1,432 @@
+"""Deterministic generators of large CASTEP outputs for benchmarking.
+
+Each generator writes a file whose size grows linearly with `scale`; the
+same `scale` and `seed` always give byte-identical files. Text formats are
+built from the fixtures in ``test/data_files`` so they stay in step with
+what the parsers are tested against.
+
+Default sizes (``scale=1``) are a few MB, multi-GB inputs are generated with
+e.g. ``scale=1000``.
+"""
+
+from __future__ import annotations
+
+import random
+import re
+import struct
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import BinaryIO, TextIO
+
+DATA_FOLDER = Path(__file__).parent.parent / "test" / "data_files"
+
+#: Default number of MD steps in a .castep file.
+CASTEP_MD_STEPS = 200
+#: Default number of frames in a .md/.geom file.
+MD_GEOM_FRAMES = 1000
+#: Number of atoms in each .md/.geom frame.
+MD_GEOM_ATOMS = 16
+#: Default edge of the grid of a formatted grid file.
+FMT_GRID = 50
+#: Default number of q-points of a .phonon file.
+PHONON_QPOINTS = 2000
+#: Default number of k-points of a .bands file.
+BANDS_KPOINTS = 5000
+#: Default edge of the grid of a .cst_esp file.
+CST_ESP_GRID = 64
+#: Default number of k-point pairs of an .epme_bin file.
+EPME_BIN_PAIRS = 50
+
+
+def _fortran_float(val: float) -> str:
+    """Format as Fortran ``ES`` with a three digit exponent.
+
+    Parameters
+    ----------
+    val
+        Value to format.
+
+    Returns
+    -------
+    :
+        Formatted value.
+    """
+    mantissa, exp = f"{val:.16E}".split("E")
+    return f"{mantissa}E{int(exp):+04d}"
+
+
+def _split_at(lines: list[str], pattern: str) -> int:
+    """Index of first line matching `pattern`.
+
+    Parameters
+    ----------
+    lines
+        Lines to search.
+    pattern
+        RegEx to find.
+
+    Returns
+    -------
+    :
+        Index of line.
+
+    Raises
+    ------
+    ValueError
+        No line matches.
+    """
+    for i, line in enumerate(lines):
+        if re.search(pattern, line):
+            return i
+    raise ValueError(f"{pattern!r} not found in template.")
+
+
+def _read_template(name: str) -> list[str]:
+    return (DATA_FOLDER / name).read_text(encoding="utf-8").splitlines(keepends=True)
+
+
+def gen_castep(out_file: TextIO, scale: int, rng: random.Random) -> None:
+    """Write an MD .castep file with ``CASTEP_MD_STEPS * scale`` steps.
+
+    Parameters
+    ----------
+    out_file
+        File to write.
+    scale
+        Size multiplier.
+    rng
+        Random state.
+    """
+    lines = _read_template("si8-md.castep")
+    # Last step of template is repeated
+    start = _split_at(lines, r"Starting MD iteration\s+2 ") - 1
+    end = _split_at(lines, r"finished MD iteration\s+2")
+    head, step, tail = lines[:start], "".join(lines[start:end + 1]), lines[end + 1:]
+
+    out_file.writelines(head)
+    for i in range(2, CASTEP_MD_STEPS * scale + 2):
+        time_ = f"{i * 0.002 + rng.random() * 1e-6:14.6f}"
+        out_file.write(re.sub(r"(MD iteration\s+)2", rf"\g<1>{i}",
+                              step.replace("      0.004000", time_)))
+    out_file.writelines(tail)
+
+
+def _md_geom_frame(time_: float, rng: random.Random, *, geom: bool) -> Iterable[str]:
+    """Lines of a frame of a .md or .geom file.
+
+    Parameters
+    ----------
+    time_
+        Time (or iteration) of frame.
+    rng
+        Random state.
+    geom
+        Whether frame is of a .geom file.
+
+    Yields
+    ------
+    str
+        Line of frame.
+    """
+    def row(vals: Iterable[float], tag: str, prefix: str = " " * 18) -> str:
+        fields = "".join(f"{_fortran_float(val):>27}" for val in vals)
+        return f"{prefix}{fields:<81}  <-- {tag}\n"
+
+    yield f"{_fortran_float(time_):>45}\n"
+    energy = -30.0 - rng.random()
+    yield row((energy, energy + 0.05) if geom else (energy, energy + 0.06, 0.025), "E")
+    if not geom:
+        yield row((rng.random() * 1e-3,), "T")
+        yield row((rng.random() * 1e-4,), "P")
+    for i in range(3):
+        yield row((10.26 if i == j else 0.0 for j in range(3)), "h")
+    if not geom:
+        for _ in range(3):
+            yield row((0.0, 0.0, 0.0), "hv")
+    for _ in range(3):
+        yield row((rng.uniform(-1e-4, 1e-4) for _ in range(3)), "S")
+
+    for tag in ("R", "F") if geom else ("R", "V", "F"):
+        for ind in range(1, MD_GEOM_ATOMS + 1):
+            yield row((rng.uniform(0, 10) for _ in range(3)), tag, f" {'Si':<8}{ind:>9}")
+    yield "\n"
+
+
+def _gen_md_geom(out_file: TextIO, scale: int, rng: random.Random, *, geom: bool) -> None:
+    out_file.write(" BEGIN header\n\n END header\n\n")
+    for i in range(MD_GEOM_FRAMES * scale):
+        out_file.writelines(_md_geom_frame(float(i), rng, geom=geom))
+
+
+def gen_md(out_file: TextIO, scale: int, rng: random.Random) -> None:
+    """Write a .md file with ``MD_GEOM_FRAMES * scale`` frames.
+
+    Parameters
+    ----------
+    out_file
+        File to write.
+    scale
+        Size multiplier.
+    rng
+        Random state.
+    """
+    _gen_md_geom(out_file, scale, rng, geom=False)
+
+
+def gen_geom(out_file: TextIO, scale: int, rng: random.Random) -> None:
+    """Write a .geom file with ``MD_GEOM_FRAMES * scale`` frames.
+
+    Parameters
+    ----------
+    out_file
+        File to write.
+    scale
+        Size multiplier.
+    rng
+        Random state.
+    """
+    _gen_md_geom(out_file, scale, rng, geom=True)
+
+
+def _fmt_generator(ext: str) -> Callable[[TextIO, int, random.Random], None]:
+    """Get generator of a formatted grid file.
+
+    Parameters
+    ----------
+    ext
+        Extension of grid file fixture to take header from.
+
+    Returns
+    -------
+    :
+        Generator writing a grid with ``FMT_GRID**3 * scale`` points.
+    """
+    def gen_fmt(out_file: TextIO, scale: int, rng: random.Random) -> None:
+        lines = _read_template(f"test.{ext}")
+        end = _split_at(lines, "END header") + 2
+        n_cols = len(lines[end].split()) - 3
+        grid = round(FMT_GRID * scale ** (1 / 3))
+
+        dims = f"{grid:4d}  {grid:4d}  {grid:4d}"
+        out_file.writelines(re.sub(r"^(\s*\d+){3}(?=\s+!)", dims, line) for line in lines[:end])
+
+        for k in range(1, grid + 1):
+            for j in range(1, grid + 1):
+                out_file.writelines(
+                    f"{i:6d}{j:6d}{k:6d}" + "".join(f"{rng.uniform(-5, 50):20.6f}"
+                                                    for _ in range(n_cols)) + "\n"
+                    for i in range(1, grid + 1)
+                )
+
+    gen_fmt.__doc__ = f"Write a .{ext} file with a grid of ``FMT_GRID**3 * scale`` points."
+    return gen_fmt
+
+
+def _gen_repeated_blocks(
+    out_file: TextIO,
+    template: str,
+    block: str,
+    count_re: str,
+    n_blocks: int,
+) -> None:
+    """Write a file repeating the first numbered block of a fixture.
+
+    Parameters
+    ----------
+    out_file
+        File to write.
+    template
+        Name of fixture.
+    block
+        RegEx matching start of block, with its index as the group ``ind``.
+    count_re
+        RegEx matching the number of blocks in the header (with leading whitespace).
+    n_blocks
+        Number of blocks to write.
+    """
+    lines = _read_template(template)
+    start = _split_at(lines, block)
+    end = start + 1 + _split_at(lines[start + 1:], block)
+    head, body = lines[:start], "".join(lines[start:end])
+
+    out_file.writelines(re.sub(count_re, lambda m: f" {n_blocks:>{len(m[0]) - 1}}", line)
+                        for line in head)
+
+    block_re = re.compile(block)
+    out_file.writelines(
+        block_re.sub(lambda m, i=i: m[0].replace(m["ind"], f"{i:>{len(m['ind'])}}"), body, count=1)
+        for i in range(1, n_blocks + 1)
+    )
+
+
+def gen_phonon(out_file: TextIO, scale: int, _rng: random.Random) -> None:
+    """Write a .phonon file with ``PHONON_QPOINTS * scale`` q-points.
+
+    Parameters
+    ----------
+    out_file
+        File to write.
+    scale
+        Size multiplier.
+    """
+    _gen_repeated_blocks(out_file, "test.phonon", r"q-pt=\s+(?P<ind>\d+)",
+                         r"(?<=Number of wavevectors)\s+\d+", PHONON_QPOINTS * scale)
+
+
+def gen_bands(out_file: TextIO, scale: int, _rng: random.Random) -> None:
+    """Write a .bands file with ``BANDS_KPOINTS * scale`` k-points.
+
+    Parameters
+    ----------
+    out_file
+        File to write.
+    scale
+        Size multiplier.
+    """
+    _gen_repeated_blocks(out_file, "test.bands", r"K-point\s+(?P<ind>\d+)",
+                         r"(?<=Number of k-points)\s+\d+", BANDS_KPOINTS * scale)
+
+
+def _record(out_file: BinaryIO, fmt: str, *vals: float | complex | bytes) -> None:
+    """Write a Fortran unformatted (big-endian) record.
+
+    Parameters
+    ----------
+    out_file
+        File to write.
+    fmt
+        :mod:`struct` format of data.
+    *vals
+        Data to write.
+    """
+    data = struct.pack(f">{fmt}", *vals)
+    size = struct.pack(">i", len(data))
+    out_file.write(size + data + size)
+
+
+def _complexes(rng: random.Random, n: int) -> list[float]:
+    return [rng.uniform(-1, 1) for _ in range(2 * n)]
+
+
+def gen_cst_esp(out_file: BinaryIO, scale: int, rng: random.Random) -> None:
+    """Write a .cst_esp file with ``CST_ESP_GRID**3 * scale`` points.
+
+    Parameters
+    ----------
+    out_file
+        File to write.
+    scale
+        Size multiplier.
+    rng
+        Random state.
+    """
+    grid = round(CST_ESP_GRID * scale ** (1 / 3))
+    _record(out_file, "i", 1)
+    _record(out_file, "3i", grid, grid, grid)
+    for i in range(1, grid + 1):
+        for j in range(1, grid + 1):
+            _record(out_file, f"2i{2 * grid}d", i, j, *_complexes(rng, grid))
+
+
+def gen_epme_bin(out_file: BinaryIO, scale: int, rng: random.Random) -> None:
+    """Write an .epme_bin file with ``EPME_BIN_PAIRS * scale`` k-point pairs.
+
+    Parameters
+    ----------
+    out_file
+        File to write.
+    scale
+        Size multiplier.
+    rng
+        Random state.
+    """
+    n_ions, n_bands, n_pairs = 8, 16, EPME_BIN_PAIRS * scale
+    n_modes = 3 * n_ions
+
+    for fmt, val in (("29s", b"Electron-Phonon Coupling Data"), ("i", 1),
+                     ("6s", b"HEADER"), ("i", 1), ("d", -0.007)):
+        _record(out_file, fmt, val)
+
+    _record(out_file, "4s", b"ATOM")
+    _record(out_file, "i", n_ions)
+    _record(out_file, "9d", *(5.0 if i % 4 == 0 else 0.0 for i in range(9)))
+    for ind in range(1, n_ions + 1):
+        _record(out_file, "i", ind)
+        _record(out_file, "2s", b"Si")
+        _record(out_file, "3d", *(rng.random() for _ in range(3)))
+
+    _record(out_file, "6s", b"KPOINT")
+    _record(out_file, "i", 2 * n_pairs)
+    _record(out_file, "i", n_bands)
+    for nk in range(1, 2 * n_pairs + 1):
+        for fmt, *vals in (("i", 1), ("i", nk), ("i", n_bands), ("i", 1)):
+            _record(out_file, fmt, *vals)
+        _record(out_file, f"{n_bands}d", *(rng.uniform(-1, 1) for _ in range(n_bands)))
+        _record(out_file, f"{3 * n_bands}d", *(rng.uniform(-1, 1) for _ in range(3 * n_bands)))
+
+    _record(out_file, "10s", b"EPCOUPLING")
+    _record(out_file, "i", n_pairs)
+    _record(out_file, "i", n_bands ** 2)
+    for pair in range(1, n_pairs + 1):
+        for val in (1, n_modes, n_bands):
+            _record(out_file, "i", val)
+        _record(out_file, "2i", 2 * pair - 1, 2 * pair)
+        _record(out_file, f"{n_modes}d", *(rng.uniform(0, 1000) for _ in range(n_modes)))
+        _record(out_file, f"{2 * n_modes ** 2}d", *_complexes(rng, n_modes ** 2))
+        _record(out_file, f"{2 * n_bands ** 2 * n_modes}d",
+                *_complexes(rng, n_bands ** 2 * n_modes))
+
+
+#: Generators of scalable files by parser name.
+GENERATORS: dict[str, Callable] = {
+    "castep": gen_castep,
+    "md": gen_md,
+    "geom": gen_geom,
+    "den_fmt": _fmt_generator("den_fmt"),
+    "elf_fmt": _fmt_generator("elf_fmt"),
+    "pot_fmt": _fmt_generator("pot_fmt"),
+    "chdiff_fmt": _fmt_generator("chdiff_fmt"),
+    "phonon": gen_phonon,
+    "bands": gen_bands,
+    "cst_esp": gen_cst_esp,
+    "epme_bin": gen_epme_bin,
+}
+
+#: Generators writing binary files.
+BINARY: frozenset[str] = frozenset({"cst_esp", "epme_bin"})
+
+
+def generate(name: str, directory: Path, scale: int = 1, seed: int = 0) -> Path:
+    """Generate (or reuse previously generated) benchmark input.
+
+    Parameters
+    ----------
+    name
+        Parser to generate input for.
+    directory
+        Directory to write file to.
+    scale
+        Size multiplier.
+    seed
+        Seed of random data.
+
+    Returns
+    -------
+    :
+        Path to generated file.
+    """
+    path = directory / f"bench-s{scale}-r{seed}.{name}"
+    if path.is_file():
+        return path
+
+    directory.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    rng = random.Random(seed)
+    if name in BINARY:
+        with tmp.open("wb") as out_file:
+            GENERATORS[name](out_file, scale, rng)
+    else:
+        with tmp.open("w", encoding="utf-8", newline="\n") as out_file:
+            GENERATORS[name](out_file, scale, rng)
+    tmp.replace(path)
+    return path
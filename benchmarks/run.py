@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""Benchmark every castep_outputs parser on synthetic inputs.
+
+Each parser in :data:`~castep_outputs.parsers.PARSERS` and
+:data:`~castep_outputs.bin_parsers.PARSERS` is run in a fresh process on a
+generated input (see :mod:`benchmarks.generators`), or on its test fixture
+where no generator exists. Throughput (lines and bytes per second, best of
+``--repeat``) and peak RSS are recorded.
+
+Results can be saved as baselines (``--save``) and later runs checked
+against them (``--compare``), failing if throughput drops or peak RSS grows
+by more than ``--threshold``. Baselines are only comparable on the same
+machine and at the same ``--scale`` and ``--seed``.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import multiprocessing
+import platform
+import sys
+import tempfile
+import time
+from argparse import ArgumentParser
+from collections import ChainMap
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from benchmarks.generators import DATA_FOLDER, GENERATORS, generate
+from castep_outputs.bin_parsers import PARSERS as BIN_PARSERS
+from castep_outputs.parsers import PARSERS
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+ALL_PARSERS = ChainMap(PARSERS, BIN_PARSERS)
+
+#: Default baselines file.
+BASELINES = Path(__file__).parent / "baselines.json"
+
+#: Minimum duration (s) of each timing.
+MIN_TIME = 0.2
+
+#: Metrics where a higher value is better.
+THROUGHPUT = ("lines_per_s", "bytes_per_s")
+
+
+def _peak_rss_mib() -> float | None:
+    """Peak resident set size of this process.
+
+    Returns
+    -------
+    :
+        Peak RSS in MiB or ``None`` if unavailable.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kiB, macOS bytes
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def _count_lines(path: Path) -> int:
+    with path.open("rb") as in_file:
+        return sum(chunk.count(b"\n") for chunk in iter(lambda: in_file.read(1 << 20), b""))
+
+
+def _measure(name: str, path: Path, repeat: int) -> dict[str, Any]:
+    """Benchmark a parser, to be run in a fresh process.
+
+    Parameters
+    ----------
+    name
+        Parser to run.
+    path
+        File to parse.
+    repeat
+        Number of timings, the fastest is reported.
+
+    Returns
+    -------
+    :
+        Measurements.
+
+    Notes
+    -----
+    A first, untimed, parse warms caches (e.g. compiled RegExes). Small
+    inputs are parsed repeatedly in each timing to last at least
+    ``MIN_TIME``.
+    """
+    parser = ALL_PARSERS[name]
+    base_rss = _peak_rss_mib()
+
+    start = time.perf_counter()
+    parser(path)
+    number = max(1, math.ceil(MIN_TIME / (time.perf_counter() - start)))
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            parser(path)
+        best = min(best, (time.perf_counter() - start) / number)
+
+    size = path.stat().st_size
+    lines = None if name in BIN_PARSERS else _count_lines(path)
+
+    return {
+        "file": path.name,
+        "bytes": size,
+        "lines": lines,
+        "seconds": best,
+        "bytes_per_s": size / best,
+        "lines_per_s": None if lines is None else lines / best,
+        "base_rss_mib": base_rss,
+        "peak_rss_mib": _peak_rss_mib(),
+    }
+
+
+def run_benchmarks(
+    names: list[str],
+    directory: Path,
+    *,
+    scale: int = 1,
+    seed: int = 0,
+    repeat: int = 3,
+) -> dict[str, dict[str, Any]]:
+    """Run benchmarks, each in a separate process.
+
+    Parameters
+    ----------
+    names
+        Parsers to benchmark.
+    directory
+        Directory for generated inputs.
+    scale
+        Size multiplier of generated inputs.
+    seed
+        Seed of generated inputs.
+    repeat
+        Number of parses of each input.
+
+    Returns
+    -------
+    :
+        Measurements by parser.
+    """
+    context = multiprocessing.get_context("spawn")
+    results = {}
+    for name in names:
+        if name in GENERATORS:
+            path = generate(name, directory, scale, seed)
+        else:
+            path = DATA_FOLDER / f"test.{name}"
+
+        # New process per benchmark so peak RSS is not shared
+        with ProcessPoolExecutor(1, mp_context=context) as pool:
+            results[name] = pool.submit(_measure, name, path, repeat).result()
+
+    return results
+
+
+def compare(
+    results: dict[str, dict[str, Any]],
+    baseline: dict[str, dict[str, Any]],
+    threshold: float,
+) -> list[str]:
+    """Find regressions against a baseline.
+
+    Parameters
+    ----------
+    results
+        Measurements by parser.
+    baseline
+        Baseline measurements by parser.
+    threshold
+        Fractional change allowed before a regression is reported.
+
+    Returns
+    -------
+    :
+        Description of each regression.
+    """
+    regressions = []
+    for name, result in results.items():
+        if (base := baseline.get(name)) is None:
+            continue
+
+        regressions.extend(
+            f"{name}: {key} {result[key]:.4g} < {base[key]:.4g}"
+            for key in THROUGHPUT
+            if result[key] is not None and result[key] < base[key] * (1 - threshold)
+        )
+
+        if (result["peak_rss_mib"] is not None and base["peak_rss_mib"] is not None
+                and result["peak_rss_mib"] > base["peak_rss_mib"] * (1 + threshold)):
+            regressions.append(f"{name}: peak_rss_mib {result['peak_rss_mib']:.1f} "
+                               f"> {base['peak_rss_mib']:.1f}")
+
+    return regressions
+
+
+def _format(results: dict[str, dict[str, Any]], baseline: dict[str, dict[str, Any]]) -> str:
+    def rel(name: str, key: str) -> str:
+        if (base := baseline.get(name)) is None or not base[key]:
+            return ""
+        return f"{results[name][key] / base[key] - 1:+.0%}"
+
+    rows = [(f"{'Parser':12} {'Size (MB)':>10} {'klines/s':>9} {'MB/s':>8} {'vs base':>8} "
+             f"{'Peak RSS (MiB)':>15} {'vs base':>8}")]
+    for name, res in results.items():
+        klines = "" if res["lines_per_s"] is None else f"{res['lines_per_s'] / 1e3:9.1f}"
+        rss = "" if res["peak_rss_mib"] is None else f"{res['peak_rss_mib']:15.1f}"
+        rows.append(f"{name:12} {res['bytes'] / 1e6:10.2f} {klines:>9} "
+                    f"{res['bytes_per_s'] / 1e6:8.2f} {rel(name, 'bytes_per_s'):>8} "
+                    f"{rss:>15} {rel(name, 'peak_rss_mib'):>8}")
+    return "\n".join(rows) + "\n"
+
+
+def main() -> int:
+    """Run benchmarks from the command line.
+
+    Returns
+    -------
+    :
+        Exit code, non-zero if any regression is found.
+    """
+    argp = ArgumentParser(description=__doc__.splitlines()[0])
+    argp.add_argument("parsers", nargs="*", default=list(ALL_PARSERS),
+                      help=f"Parsers to benchmark (default: all of {', '.join(ALL_PARSERS)})")
+    argp.add_argument("-s", "--scale", type=int, default=1,
+                      help="Size multiplier of generated inputs.")
+    argp.add_argument("--seed", type=int, default=0, help="Seed of generated inputs.")
+    argp.add_argument("-n", "--repeat", type=int, default=3, help="Parses per input.")
+    argp.add_argument("-d", "--data-dir", type=Path,
+                      default=Path(tempfile.gettempdir()) / "castep_outputs_bench",
+                      help="Directory to generate (and reuse) inputs in.")
+    argp.add_argument("--save", type=Path, nargs="?", const=BASELINES, default=None,
+                      help=f"Save results as baseline (default: {BASELINES.name}).")
+    argp.add_argument("--compare", type=Path, nargs="?", const=BASELINES, default=None,
+                      help=f"Compare results to baseline (default: {BASELINES.name}).")
+    argp.add_argument("-t", "--threshold", type=float, default=0.25,
+                      help="Fractional change allowed before a regression is reported.")
+    args = argp.parse_args()
+
+    if unknown := set(args.parsers) - set(ALL_PARSERS):
+        argp.error(f"Unknown parsers: {', '.join(sorted(unknown))}")
+
+    baseline = {}
+    if args.compare:
+        saved = json.loads(args.compare.read_text(encoding="utf-8"))
+        if (saved["scale"], saved["seed"]) != (args.scale, args.seed):
+            sys.stderr.write(f"Baseline is for scale {saved['scale']}, seed {saved['seed']}.\n")
+            return 2
+        baseline = saved["results"]
+
+    results = run_benchmarks(args.parsers, args.data_dir,
+                             scale=args.scale, seed=args.seed, repeat=args.repeat)
+    sys.stdout.write(_format(results, baseline))
+
+    if args.save:
+        args.save.write_text(json.dumps({
+            "scale": args.scale,
+            "seed": args.seed,
+            "machine": platform.platform(),
+            "python": platform.python_version(),
+            "results": results,
+        }, indent=2) + "\n", encoding="utf-8")
+
+    regressions = compare(results, baseline, args.threshold)
+    for regression in regressions:
+        sys.stderr.write(f"Regression: {regression}\n")
+
+    return int(bool(regressions))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
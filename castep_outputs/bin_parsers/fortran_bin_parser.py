@@ -5,6 +5,7 @@ from itertools import count
 from os import SEEK_CUR
 from typing import BinaryIO, TypeVar, overload
 
+from castep_outputs.utilities.compression import decompress_stream
 from castep_outputs.utilities.type_conv import ToTypeTuple, parse_bytes
 
 T = TypeVar("T")
@@ -17,7 +18,8 @@ class FortranBinaryReader:
     Parameters
     ----------
     file
-        Open file to get binary data from.
+        Open file to get binary data from, decompressed as it is read
+        if compressed.
 
     Yields
     ------
@@ -42,7 +44,7 @@ class FortranBinaryReader:
     """
 
     def __init__(self, file: BinaryIO) -> None:
-        self.file = file
+        self.file = decompress_stream(file)
 
     def __iter__(self) -> Iterator[bytes]:
         return self
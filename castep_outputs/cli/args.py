@@ -9,6 +9,7 @@ from castep_outputs import __version__
 from castep_outputs.bin_parsers import CASTEP_FILE_FORMATS as BIN_FORMATS
 from castep_outputs.bin_parsers import CASTEP_OUTPUT_NAMES as BIN_NAMES
 from castep_outputs.parsers import CASTEP_FILE_FORMATS, CASTEP_OUTPUT_NAMES
+from castep_outputs.utilities.compression import COMPRESSED_SUFFIXES, uncompressed_name
 from castep_outputs.utilities.dumpers import SUPPORTED_FORMATS
 
 # pylint: disable=line-too-long
@@ -29,6 +30,7 @@ def get_parser() -> argparse.ArgumentParser:
         description=f"""\
         Attempts to find all files for seedname, filtered by `inc` args (default: all).
         Explicit files can be passed using longname arguments.
+        Files may be compressed ({', '.join(sorted(COMPRESSED_SUFFIXES))}).
         castep_outputs can parse most castep outputs including: {', '.join(ALL_FORMATS)}""",
     )
 
@@ -45,6 +47,9 @@ def get_parser() -> argparse.ArgumentParser:
     arg_parser.add_argument("-t", "--testing", action="store_true",
                             help="Set testing mode to produce flat outputs")
 
+    arg_parser.add_argument("--profile", action="store_true",
+                            help="Print per-section statistics of .castep parsing to stderr")
+
     arg_parser.add_argument("-A", "--inc-all", action="store_true",
                             help="Extract all available information")
 
@@ -60,6 +65,27 @@ def get_parser() -> argparse.ArgumentParser:
     return arg_parser
 
 
+def _find_output(path: Path) -> Path | None:
+    """
+    Find output file, which may be compressed.
+
+    Parameters
+    ----------
+    path
+        Uncompressed name of file.
+
+    Returns
+    -------
+    :
+        `path` or compressed file with its name if either exists, otherwise ``None``.
+    """
+    for trial in (path, *(path.with_name(path.name + suffix)
+                          for suffix in sorted(COMPRESSED_SUFFIXES))):
+        if trial.is_file():
+            return trial
+    return None
+
+
 def parse_args(to_parse: Sequence[str] = ()) -> argparse.Namespace:
     """
     Parse all arguments and add those caught by flags.
@@ -94,13 +120,13 @@ def parse_args(to_parse: Sequence[str] = ()) -> argparse.Namespace:
     # Add seeded files into parse list if to be included
     for seed in args.seedname:
         seed = Path(seed)
-        if seed.is_file() and (ext := seed.suffix[1:]) in ALL_NAMES:
+        if seed.is_file() and (ext := uncompressed_name(seed).suffix[1:]) in ALL_NAMES:
             getattr(args, ext).append(str(seed))
         else:
             for typ in ALL_NAMES:
                 trial = seed.with_suffix(f".{typ}")
-                if getattr(args, f"inc_{typ}") and trial.is_file():
-                    getattr(args, typ).append(str(trial))
+                if getattr(args, f"inc_{typ}") and (found := _find_output(trial)):
+                    getattr(args, typ).append(str(found))
 
             if args.inc_err and (err_files := seed.parent.glob(f"{seed}.*.err")):
                 args.err.extend(map(str, err_files))
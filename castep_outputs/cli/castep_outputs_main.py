@@ -6,13 +6,16 @@ import logging
 import sys
 from collections import ChainMap
 from collections.abc import Callable, Sequence
+from contextlib import nullcontext
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, TextIO
 
 from castep_outputs.bin_parsers import PARSERS as BIN_PARSERS
 from castep_outputs.parsers import PARSERS
 from castep_outputs.parsers.castep_file_parser import Filters
+from castep_outputs.utilities.compression import uncompressed_name
 from castep_outputs.utilities.dumpers import get_dumpers
+from castep_outputs.utilities.profiling import profile_parse
 from castep_outputs.utilities.utility import flatten_dict, json_safe, normalise
 
 from .args import extract_parsables, parse_args
@@ -39,7 +42,8 @@ def parse_single(in_file: str | Path | TextIO,
     in_file
         Input file to parse.
     parser
-        Castep parser to use. If `None` will be determined from extension.
+        Castep parser to use. If `None` will be determined from extension,
+        ignoring any compression suffix (e.g. ``.gz``).
     out_format
         Format to dump as.
     loglevel
@@ -66,7 +70,7 @@ def parse_single(in_file: str | Path | TextIO,
         parser = PARSERS.get(parser)
 
     if parser is None and isinstance(in_file, Path):
-        ext = in_file.suffix.strip(".")
+        ext = uncompressed_name(in_file).suffix.strip(".")
 
         if ext not in ALL_PARSERS:
             raise ValueError(f"Parser for file {in_file} (assumed type: {ext}) not found")
@@ -150,11 +154,15 @@ def run(args: argparse.Namespace) -> None:
     """
     dict_args = extract_parsables(args)
 
-    parse_all(output=args.output,
-              loglevel=getattr(logging, args.log.upper()),
-              testing=args.testing,
-              out_format=args.out_format,
-              **dict_args)
+    with profile_parse() if args.profile else nullcontext() as profile:
+        parse_all(output=args.output,
+                  loglevel=getattr(logging, args.log.upper()),
+                  testing=args.testing,
+                  out_format=args.out_format,
+                  **dict_args)
+
+    if profile is not None:
+        sys.stderr.write(profile.report())
 
 
 def main() -> None:
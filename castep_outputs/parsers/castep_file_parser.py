@@ -8,12 +8,19 @@ Port of extract_results.pl
 
 from __future__ import annotations
 
+import functools
+import io
 import itertools
+import mmap
 import re
+import time
 from collections import defaultdict
-from collections.abc import Callable, Iterator
+from collections.abc import Callable, Collection, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from copy import copy
 from enum import Flag, auto
-from typing import Any, TextIO, cast
+from pathlib import Path
+from typing import Any, BinaryIO, NamedTuple, TextIO, TypeVar, cast
 
 from castep_outputs.parsers.bands_file_parser import parse_bands_file
 from castep_outputs.parsers.cell_param_file_parser import (
@@ -33,6 +40,7 @@ from castep_outputs.parsers.phonon_dos_file_parser import parse_phonon_dos_file
 from castep_outputs.parsers.xrd_sf_file_parser import parse_xrd_sf_file
 from castep_outputs.utilities import castep_res as REs
 from castep_outputs.utilities.castep_res import gen_table_re, get_numbers, labelled_floats
+from castep_outputs.utilities.compression import open_compressed
 from castep_outputs.utilities.constants import SHELLS
 from castep_outputs.utilities.datatypes import (
     AtomIndex,
@@ -72,7 +80,13 @@ from castep_outputs.utilities.datatypes import (
     ThreeVector,
     WvfnLineMin,
 )
-from castep_outputs.utilities.filewrapper import Block, FileWrapper
+from castep_outputs.utilities.filewrapper import (
+    Block,
+    FileWrapper,
+    MappedFileWrapper,
+    skip_block,
+)
+from castep_outputs.utilities.profiling import ParseProfile, active_profile, suspend_profile
 from castep_outputs.utilities.type_conv import (
     determine_type,
     fix_data_types,
@@ -85,12 +99,15 @@ from castep_outputs.utilities.utility import (
     atreg_to_index,
     file_or_path,
     get_only,
+    is_tracing,
     log_factory,
     normalise_key,
     normalise_string,
     stack_dict,
 )
 
+T = TypeVar("T")
+
 # Reduced set of parsers needed for .castep test extras
 PARSERS: dict[str, Callable] = {
     "bands": parse_bands_file,
@@ -164,9 +181,161 @@ class Filters(Flag):
                THERMODYNAMICS | TSS)
 
 
+#: Handler called with the matched section data (a :class:`Block` or :class:`re.Match`
+#: for single-line sections), the current run and the parse state.
+SectionHandler = Callable[[Any, dict[str, Any], "_ParseState"], None]
+
+
+class _Section(NamedTuple):
+    """Top-level section of a .castep file."""
+
+    #: Name of section.
+    name: str
+    #: Literals (case-insensitive), at least one of which must appear in a line
+    #: for `start` to be able to match it.
+    triggers: tuple[str, ...]
+    #: RegEx matched against a line to see if it starts the section.
+    start: re.Pattern
+    #: RegEx to verify if block has ended or ``None`` for single-line sections.
+    end: re.Pattern | None
+    #: Number of times `end` must match before block is returned.
+    n_end: int
+    #: Whether it is possible block is ended by EOF.
+    eof_possible: bool
+    #: Filters (any of) required to process section or ``None`` if always processed.
+    filters: Filters | None
+    #: Whether section marks the start of a new run.
+    new_run: bool
+    #: Function processing the section.
+    handler: SectionHandler
+    #: Keys of run written by section or ``None`` if not known in advance.
+    keys: frozenset[str] | None
+
+    def wanted(self, filters: Filters, keys: frozenset[str] | None = None) -> bool:
+        """
+        Whether section is processed with `filters`.
+
+        Parameters
+        ----------
+        filters
+            Filters of parse.
+        keys
+            Keys requested from parse or ``None`` for all keys.
+
+        Returns
+        -------
+        :
+            Whether section is to be processed.
+        """
+        if self.filters is not None and not self.filters & filters:
+            return False
+        return keys is None or self.keys is None or not self.keys.isdisjoint(keys)
+
+
+class _ParseState(NamedTuple):
+    """State shared by section handlers."""
+
+    #: File being parsed.
+    file: FileWrapper | Block
+    #: Sections to process.
+    filters: Filters
+    #: Logger for file.
+    logger: Logger
+    #: Keys to parse or ``None`` for all keys.
+    keys: frozenset[str] | None = None
+    #: Statistics to collect or ``None`` if not profiling.
+    profile: ParseProfile | None = None
+
+
+#: Registered sections in order of precedence.
+_SECTIONS: list[_Section] = []
+
+
+def _section(
+    *triggers: str,
+    name: str | None = None,
+    n_end: int = 1,
+    eof_possible: bool = False,
+    filters: Filters | None = None,
+    new_run: bool = False,
+    keys: Sequence[str] | None = (),
+    bounds: REs.SectionRE | None = None,
+) -> Callable[[SectionHandler], SectionHandler]:
+    """Register a handler for a top-level section of a .castep file.
+
+    Sections are tried in order of registration and the first to match
+    a line consumes it.
+
+    Parameters
+    ----------
+    *triggers
+        Literals (case-insensitive), one of which must be in any line starting the section.
+    name
+        Name of section in :data:`~castep_outputs.utilities.castep_res.CASTEP_SECTION_RES`
+        if not the name of the handler.
+    n_end
+        Number of times `end` must match before block is returned.
+    eof_possible
+        Whether it is possible block is ended by EOF.
+    filters
+        Filters (any of) required to process section or ``None`` to always process.
+    new_run
+        Whether section marks the start of a new run.
+    keys
+        Keys of run written by handler, ``None`` if not known in advance.
+        Default is the name of the section.
+    bounds
+        Bounds of section if not given by
+        :data:`~castep_outputs.utilities.castep_res.CASTEP_SECTION_RES`.
+
+    Returns
+    -------
+    :
+        Decorator registering handler.
+    """
+    def register(handler: SectionHandler) -> SectionHandler:
+        section_name = name or handler.__name__.removeprefix("_handle_")
+        section_bounds = bounds or REs.CASTEP_SECTION_RES[section_name]
+        _SECTIONS.append(_Section(
+            name=section_name,
+            triggers=triggers,
+            start=section_bounds.start,
+            end=section_bounds.end,
+            n_end=n_end,
+            eof_possible=eof_possible,
+            filters=filters,
+            new_run=new_run,
+            handler=handler,
+            keys=None if keys is None else frozenset(keys or (section_name,)),
+        ))
+        return handler
+
+    return register
+
+
+#: Run selection for :func:`parse_castep_file`.
+RunSelection = int | Sequence[int] | slice
+
+#: Keys of run needed to build a requested key.
+_KEY_DEPENDENCIES: dict[str, tuple[str, ...]] = {
+    # First geometry iteration is built from the initial data of the run
+    "geom_opt": ("enthalpy", "initial_cell", "initial_positions",
+                 "scf", "forces", "stresses", "minimisation"),
+}
+
+#: Start of a run as bytes, for indexing runs without decoding the file.
+_RUN_START_RE = re.compile(REs.CASTEP_SECTION_RES["build_info"].start.pattern.encode())
+
+
 @file_or_path(mode="r")
-def parse_castep_file(castep_file_in: TextIO | FileWrapper | Block,
-                      filters: Filters = Filters.HIGH) -> list[dict[str, Any]]:
+def parse_castep_file(
+    castep_file_in: TextIO | FileWrapper | Block,
+    filters: Filters = Filters.HIGH,
+    *,
+    runs: RunSelection | None = None,
+    workers: int | None = None,
+    keys: Collection[str] | None = None,
+) -> list[dict[str, Any]]:
     """
     Parse castep file into lists of dicts ready to JSONise.
 
@@ -176,1225 +345,1924 @@ def parse_castep_file(castep_file_in: TextIO | FileWrapper | Block,
         File to parse.
     filters
         Parameters to parse.
+    runs
+        Indices (or slice) of runs to parse, ``None`` to parse all runs.
+    workers
+        Number of processes to parse runs with, ``None`` to parse serially.
+    keys
+        Keys of runs to return, ``None`` to return all parsed keys.
 
     Returns
     -------
     :
         Parsed data.
 
-    Raises
-    ------
-    ValueError
-        On invalid top-level blocks.
+    See Also
+    --------
+    index_runs : Offsets of runs in file.
+
+    Notes
+    -----
+    Each line is classified once against the literal triggers of all
+    registered sections, only sections which may match are attempted.
+
+    Blocks of sections excluded by `filters` are skipped without being stored.
+
+    If `runs` is given for a file on disk, only the selected runs are read.
+    Each run starts at a ``Compiled for`` header, any preamble before
+    the first header is treated as part of the first run.
+    Runs are indexed by header, as by :func:`index_runs`, including runs
+    with no data under `filters`. As with a full parse, such runs are
+    omitted from the result, so where any are present in the file, runs
+    selected by index can differ from indexing the result of a full parse.
+
+    If `workers` is given for a file on disk, its runs are parsed in
+    parallel and returned in order.
+
+    If `keys` is given, blocks of sections which cannot contribute to any
+    of `keys` are skipped as if excluded by `filters`. Keys must still be
+    enabled by `filters` to be parsed. Runs containing none of `keys` are
+    omitted.
+
+    Examples
+    --------
+    .. code-block:: python
+
+       runs = parse_castep_file("seedname.castep", Filters.HIGH,
+                                keys={"energies", "forces", "stresses"})
     """
-    runs: list[dict[str, Any]] = []
-    curr_run: dict[str, Any] = defaultdict(list)
+    if keys is None:
+        return _parse_selected(castep_file_in, filters, runs, workers)
+
+    needed = frozenset(itertools.chain(keys, *(_KEY_DEPENDENCIES.get(key, ()) for key in keys)))
+    parsed = _parse_selected(castep_file_in, filters, runs, workers, needed)
+    return [proj for run in parsed if (proj := {key: run[key] for key in keys if key in run})]
+
+
+def _parse_selected(
+    castep_file_in: TextIO | FileWrapper | Block,
+    filters: Filters,
+    runs: RunSelection | None,
+    workers: int | None,
+    keys: frozenset[str] | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Parse selected runs of castep file.
+
+    Parameters
+    ----------
+    castep_file_in
+        File to parse.
+    filters
+        Parameters to parse.
+    runs
+        Indices (or slice) of runs to parse, ``None`` to parse all runs.
+    workers
+        Number of processes to parse runs with, ``None`` to parse serially.
+    keys
+        Keys to parse, ``None`` to parse all keys.
+
+    Returns
+    -------
+    :
+        Parsed data.
+    """
+    binary = getattr(castep_file_in, "buffer", None)
+    if binary is None or not binary.seekable():
+        if runs is None:
+            return _parse_runs(castep_file_in, filters, keys=keys)
+        data = _parse_runs(castep_file_in, filters, keys=keys, keep_empty=True)
+        return [run for run in _select(data, runs) if run]
+
+    if runs is None and (workers is None or workers <= 1):
+        if castep_file_in.tell() != 0 or (buffer := _map_file(binary)) is None:
+            return _parse_runs(castep_file_in, filters, keys=keys)
+
+        mapped = MappedFileWrapper(buffer, castep_file_in.name, castep_file_in.encoding)
+        try:
+            return _parse_runs(mapped, filters, keys=keys)
+        finally:
+            mapped.close()
+
+    offsets = index_runs(binary)
+    binary.seek(0, io.SEEK_END)
+    file_end = binary.tell()
+    bounds = list(itertools.pairwise((*offsets, file_end)))
+    if runs is not None:
+        bounds = _select(bounds, runs)
+
+    encoding = castep_file_in.encoding
+    at_eof = [end == file_end for _, end in bounds]
+    path = getattr(castep_file_in, "name", None)
+
+    if workers is not None and workers > 1 and isinstance(path, str) and len(bounds) > 1:
+        chunks = [_RunChunk(path, start, end, encoding, last)
+                  for (start, end), last in zip(bounds, at_eof, strict=True)]
+        with ProcessPoolExecutor(workers) as pool:
+            parsed = pool.map(functools.partial(_parse_run_chunk, filters=filters, keys=keys),
+                              chunks)
+            return list(itertools.chain.from_iterable(parsed))
+
+    parsed = []
+    for (start, end), last in zip(bounds, at_eof, strict=True):
+        chunk = _read_run_chunk(binary, start, end, encoding)
+        parsed.extend(_parse_runs(chunk, filters, at_eof=last, keys=keys))
+
+    return parsed
+
+
+def _read_run_chunk(binary: BinaryIO, start: int, end: int, encoding: str) -> Block:
+    """
+    Read a range of runs from a file.
+
+    Parameters
+    ----------
+    binary
+        File to read, opened in binary mode.
+    start
+        Offset of start of first run.
+    end
+        Offset of end of last run.
+    encoding
+        Encoding of file.
+
+    Returns
+    -------
+    :
+        Lines of runs.
+    """
+    binary.seek(start)
+    text = binary.read(end - start).decode(encoding)
+    # Split lines as text-mode file would
+    return Block.from_iterable(io.StringIO(text, newline=None).readlines(), binary)
+
+
+class _RunChunk(NamedTuple):
+    """Range of runs in a file to parse in a worker process."""
+
+    #: File to parse.
+    path: str
+    #: Offset of start of first run.
+    start: int
+    #: Offset of end of last run.
+    end: int
+    #: Encoding of file.
+    encoding: str
+    #: Whether range ends at end of file.
+    at_eof: bool
+
+
+def _parse_run_chunk(
+    chunk: _RunChunk,
+    filters: Filters,
+    keys: frozenset[str] | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Parse a range of runs of a file in a worker process.
+
+    Parameters
+    ----------
+    chunk
+        Range of runs to parse.
+    filters
+        Parameters to parse.
+    keys
+        Keys to parse, ``None`` to parse all keys.
+
+    Returns
+    -------
+    :
+        Parsed data.
+    """
+    with open_compressed(Path(chunk.path)) as binary:
+        block = _read_run_chunk(binary, chunk.start, chunk.end, chunk.encoding)
+    return _parse_runs(block, filters, at_eof=chunk.at_eof, keys=keys)
+
+
+class CastepEvent(NamedTuple):
+    """Data parsed from a section of a .castep file."""
+
+    #: Index of run containing section.
+    run: int
+    #: Key of data in run.
+    key: str
+    #: Data added to run by section.
+    value: Any
+
+
+@file_or_path(mode="r")
+def iter_castep_file(
+    castep_file_in: TextIO | FileWrapper | Block,
+    filters: Filters = Filters.HIGH,
+    *,
+    keys: Collection[str] | None = None,
+) -> Iterator[CastepEvent]:
+    """
+    Parse castep file, yielding data as each section is parsed.
+
+    Parameters
+    ----------
+    castep_file_in
+        File to parse.
+    filters
+        Parameters to parse.
+    keys
+        Keys of data to yield, ``None`` to yield all parsed keys.
+
+    Yields
+    ------
+    CastepEvent
+        Run index, key and value of data of each section.
+
+    See Also
+    --------
+    parse_castep_file : Parse full file into runs.
+
+    Notes
+    -----
+    Each section is processed as if into an empty run, so `value` is only
+    the data added by that section (e.g. a single MD step as a one-item list
+    under ``"md"``). Data is not accumulated between sections, so memory use
+    is bounded by the largest section.
 
-    to_parse = filters
+    Examples
+    --------
+    .. code-block:: python
 
+       for run, key, value in iter_castep_file("seedname.castep", Filters.MD):
+           if key == "md":
+               process_step(value[0])
+    """
     if not isinstance(castep_file_in, (FileWrapper, Block)):
         castep_file = FileWrapper(castep_file_in)
     else:
         castep_file = castep_file_in
 
-    logger = log_factory(castep_file)
+    needed = None
+    if keys is not None:
+        keys = frozenset(keys)
+        needed = keys.union(*(_KEY_DEPENDENCIES.get(key, ()) for key in keys))
+
+    state = _ParseState(castep_file, filters, log_factory(castep_file), needed)
+    # Data of run before first geometry iteration, which it is built from
+    carry = _GEOM_ITERATION.wanted(filters, needed)
+    context: dict[str, Any] = {}
+    geom_started = False
+
+    run = 0
+    run_started = False
+
+    for section, data in _iter_sections(state):
+        if section.new_run:
+            if run_started:
+                run += 1
+            run_started = False
+            context = {}
+            geom_started = False
+
+        if not section.wanted(filters, needed):
+            continue
 
-    for line in castep_file:
-        logger("%s", line, level="debug")
-        # Build Info
-        if block := Block.from_re(line, castep_file,
-                                  r"^\s*Compiled for",
-                                  REs.EMPTY):
+        section_data: dict[str, Any] = defaultdict(list)
+        if section is _GEOM_ITERATION:
+            if geom_started:
+                section_data["geom_opt"] = defaultdict(list, iterations=[])
+            else:
+                section_data.update(context)
+            geom_started = True
+            context = {}
 
-            if curr_run:
-                runs.append(curr_run)
-            logger("Found run %s", len(runs) + 1)
-            curr_run = defaultdict(list)
+        section.handler(data, section_data, state)
+        run_started |= bool(section_data)
 
-            if Filters.SYS_INFO not in to_parse:
+        for key, value in section_data.items():
+            if ((keys is not None and key not in keys)
+                    or context.get(key) is value):  # Carried, not new
                 continue
+            if value or not isinstance(value, (list, dict)):
+                yield CastepEvent(run, key, value)
 
-            logger("Found build info")
-            curr_run["build_info"] = _process_buildinfo(block)
+        if carry and not geom_started:
+            _merge_run(context, {key: val for key, val in section_data.items()
+                                 if key in _KEY_DEPENDENCIES["geom_opt"]})
 
-        elif "Run started" in line:
 
-            if Filters.SYS_INFO not in to_parse:
-                continue
+def _merge_run(run: dict[str, Any], data: Mapping[str, Any]) -> None:
+    """
+    Add data of a section to a run, as if the section were handled into it.
 
-            curr_run["time_started"] = normalise_string(line.split(":", 1)[1])
+    Parameters
+    ----------
+    run
+        Run to add to, modified in place.
+    data
+        Data added by section.
 
-        # Finalisation
-        elif block := Block.from_re(line, castep_file, "Initialisation time", f"{REs.EMPTY}|<",
-                                    eof_possible=True):
+    Examples
+    --------
+    >>> run = {"enthalpy": [1.0], "forces": {"non_descript": [{}]}}
+    >>> _merge_run(run, {"enthalpy": [2.0], "forces": {"constrained": [{}]}})
+    >>> run
+    {'enthalpy': [1.0, 2.0], 'forces': {'non_descript': [{}], 'constrained': [{}]}}
+    """
+    for key, value in data.items():
+        if isinstance(value, list) and isinstance(run.get(key), list):
+            run[key] = [*run[key], *value]
+        elif isinstance(value, dict) and isinstance(run.get(key), dict):
+            merged = copy(run[key])
+            _merge_run(merged, value)
+            run[key] = merged
+        else:
+            run[key] = value
 
-            # External files present
-            if "<" in block[-1]:
-                block.remove_bounds(0, 1)
-                castep_file.rewind()
 
-            if Filters.SYS_INFO not in to_parse:
-                continue
+def parse_castep_chunk(
+    castep_file: Block,
+    runs: list[dict[str, Any]],
+    curr_run: dict[str, Any],
+    filters: Filters = Filters.HIGH,
+    *,
+    final: bool = True,
+) -> tuple[dict[str, Any], int]:
+    """
+    Continue parsing runs of a castep file with a further chunk of it.
 
-            logger("Found finalisation")
-            curr_run.update(_process_finalisation(block))
+    Parameters
+    ----------
+    castep_file
+        Lines of the file following those already parsed.
+    runs
+        Completed runs, appended to as new runs start.
+    curr_run
+        Run being parsed, as returned by the previous call
+        (``defaultdict(list)`` at the start of the file).
+    filters
+        Parameters to parse.
+    final
+        Whether `castep_file` ends at the end of the full file. If not,
+        parsing stops before any section which may be incomplete.
 
-        elif line.startswith("Overall parallel efficiency rating"):
+    Returns
+    -------
+    dict[str, Any]
+        Run being parsed at the end of the chunk.
+    int
+        Number of lines of `castep_file` in completely parsed sections.
 
-            if Filters.SYS_INFO not in to_parse:
-                continue
+    Raises
+    ------
+    OSError
+        Section incomplete and `final`.
+    StopIteration
+        Section incomplete and `final`.
 
-            logger("Found parallel efficiency")
+    See Also
+    --------
+    finalise_run : Get run with accumulated values converted.
+    """
+    state = _ParseState(castep_file, filters, log_factory(castep_file))
+
+    done = 0
+    try:
+        for section, data in _iter_sections(state):
+            if (not final and section.eof_possible and isinstance(data, Block)
+                    and castep_file.lineno + 1 >= len(castep_file)
+                    and not section.end.search(data[-1])):  # Ended by end of chunk
+                break
+            curr_run = _add_section(section, data, runs, curr_run, state)
+            done = castep_file.lineno + 1
+        else:
+            done = len(castep_file)
+    except (OSError, StopIteration):  # Section not yet completely written
+        if final:
+            raise
+        state.logger("Incomplete section, waiting for more data", level="debug")
 
-            curr_run["parallel_efficiency"] = float(get_numbers(line)[0])
+    return curr_run, done
 
-        # Continuation
-        elif line.startswith("Reading continuation data"):
 
-            if Filters.SYS_INFO not in to_parse:
-                continue
+def finalise_run(run: dict[str, Any]) -> dict[str, Any]:
+    """
+    Get final run as returned by :func:`parse_castep_file`.
 
-            logger("Found continuation block")
+    Parameters
+    ----------
+    run
+        Run accumulated by :func:`parse_castep_chunk`.
 
-            curr_run["continuation"] = line.split()[-1]
+    Returns
+    -------
+    :
+        Shallow copy of `run` with accumulated values converted to their final types.
+    """
+    run = copy(run)
+    _fix_run_types(run)
+    return run
 
-        # Warnings
-        elif block := Block.from_re(line, castep_file,
-                                    gen_table_re("", r"\?+"),
-                                    gen_table_re("", r"\?+")):
 
-            if Filters.SYS_INFO not in to_parse:
-                continue
+def index_runs(castep_file: BinaryIO) -> tuple[int, ...]:
+    r"""
+    Find the byte offsets of the runs in a .castep file.
 
-            logger("Found warning")
+    Parameters
+    ----------
+    castep_file
+        File to index, opened in binary mode.
 
-            block.remove_bounds(1, 1)
-            curr_run["warning"].append(" ".join(x.strip() for x in block))
+    Returns
+    -------
+    :
+        Offset of the start of each run, the first run (including
+        any preamble) always starts at 0.
 
-        elif match := re.match(r"(?:\s*[^:]+:)?(\s*)warning", line, re.IGNORECASE):
+    Examples
+    --------
+    >>> from io import BytesIO
+    >>> index_runs(BytesIO(b"Banner\n Compiled for x\n\n Compiled for y\n"))
+    (0, 24)
+    """
+    castep_file.seek(0)
+    headers = []
+    pos = 0
 
-            if Filters.SYS_INFO not in to_parse:
-                continue
+    for line in castep_file:
+        if b"Compiled for" in line and _RUN_START_RE.search(line):
+            headers.append(pos)
+        pos += len(line)
 
-            logger("Found warning")
+    # Preamble belongs to first run
+    return (0, *headers[1:])
 
-            warn = line.strip()
 
-            for tst, line in enumerate(castep_file):
-                if not line.strip() or not re.match(match.group(1) + r"\s+", line):
-                    if tst:
-                        castep_file.rewind()
-                    break
-                warn += " " + line.strip()
+def index_sections(castep_file: BinaryIO) -> tuple[int, ...]:
+    r"""
+    Find the byte offsets of the lines of a .castep file which may start a section.
 
-            curr_run["warning"].append(warn)
+    Parameters
+    ----------
+    castep_file
+        File to index, opened in binary mode.
 
-        # Memory estimate
-        elif block := Block.from_re(line, castep_file,
-                                    gen_table_re(r"MEMORY AND SCRATCH[\w\s]+", "[+-]+"),
-                                    gen_table_re("", "[+-]+")):
+    Returns
+    -------
+    :
+        Offset of the start of each line containing the trigger of a section.
 
-            if Filters.SYS_INFO not in to_parse:
-                continue
+    See Also
+    --------
+    index_runs : Offsets of runs in file.
 
-            logger("Found memory estimate")
+    Notes
+    -----
+    The file is memory-mapped where possible and scanned without decoding
+    or iterating over its lines.
 
-            curr_run["memory_estimate"].append(_process_memory_est(block))
+    Examples
+    --------
+    >>> from io import BytesIO
+    >>> index_sections(BytesIO(b"Banner\n Final energy = 1\n 2 3\n"))
+    (7,)
+    """
+    if (buffer := _map_file(castep_file)) is None:
+        castep_file.seek(0)
+        return tuple(_locate_sections(castep_file.read()))
 
-        # Title
-        elif re.match(gen_table_re("Title", r"\*+"), line):
+    with buffer:
+        return tuple(_locate_sections(buffer))
 
-            if Filters.PARAMETERS not in to_parse:
-                continue
 
-            logger("Found title")
+def _map_file(binary: BinaryIO) -> mmap.mmap | None:
+    """
+    Memory-map a file for reading.
 
-            curr_run["title"] = next(castep_file).strip()
+    Parameters
+    ----------
+    binary
+        File to map, opened in binary mode.
 
-        # Parameters
-        elif block := Block.from_re(line, castep_file,
-                                    gen_table_re("[^*]+ Parameters", r"\*+"),
-                                    gen_table_re("", r"\*+")):
+    Returns
+    -------
+    :
+        Mapped file or ``None`` if file cannot be mapped (e.g. in memory or empty).
+    """
+    if not isinstance(binary, (io.BufferedReader, io.BufferedRandom, io.FileIO)):
+        return None  # e.g. decompressing stream, whose fileno is of the compressed file
 
-            if Filters.PARAMETERS not in to_parse:
-                continue
+    try:
+        return mmap.mmap(binary.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
 
-            logger("Found options")
 
-            curr_run["options"] = _process_params(block)
+def _locate_sections(buffer: bytes | mmap.mmap, chunk_size: int = 1 << 24) -> Iterator[int]:
+    """
+    Find offsets of the lines of a buffer containing triggers of sections.
 
-        # Quantisation axis
-        elif "Quantisation axis" in line:
+    Parameters
+    ----------
+    buffer
+        Encoded data of file.
+    chunk_size
+        Approximate size in bytes of chunks to scan.
 
-            if Filters.SPECIES_PROPS not in to_parse:
-                continue
+    Yields
+    ------
+    int
+        Offset of start of line.
+    """
+    size = len(buffer)
+    start = 0
 
-            logger("Found Quantisation axis")
+    while start < size:
+        # Chunks end at a line end so lines are never split
+        end = buffer.find(b"\n", min(start + chunk_size, size) - 1) + 1 or size
+        chunk = buffer[start:end].lower()
 
-            curr_run["quantisation_axis"] = to_type(get_numbers(line), float)
+        pos = 0
+        while match := _TRIGGER_BYTES_RE.search(chunk, pos):
+            line_start = chunk.rfind(b"\n", 0, match.start()) + 1
+            yield start + line_start
+            pos = chunk.find(b"\n", match.end()) + 1 or len(chunk)
 
-        # Pseudo-atomic energy
-        elif block := Block.from_re(line, castep_file, REs.PS_SHELL_RE, REs.EMPTY, n_end=2):
+        start = end
 
-            if Filters.SPECIES_PROPS not in to_parse:
-                continue
 
-            logger("Found pseudo-atomic energy")
+def _jump_lines(castep_file: MappedFileWrapper) -> Iterator[str]:
+    """
+    Read only the lines of a file which may start a section.
 
-            key, val = _process_ps_energy(block)
+    Parameters
+    ----------
+    castep_file
+        File to read.
 
-            curr_run.setdefault("species_properties", defaultdict(dict))
+    Yields
+    ------
+    str
+        Line containing a trigger of a section.
+
+    Notes
+    -----
+    Lines consumed by the reader between yields are not yielded again.
+    """
+    for offset in _locate_sections(castep_file.file):
+        if offset < castep_file.tell():
+            continue
+        castep_file.seek(offset)
+        yield next(castep_file)
 
-            curr_run["species_properties"][key].update(val)
 
-        # Mass
-        elif block := Block.from_re(line, castep_file, r"Mass of species in AMU", REs.EMPTY):
+def _select(items: Sequence[T], selection: RunSelection) -> list[T]:
+    """
+    Select items by index or slice.
 
-            if Filters.SPECIES_PROPS not in to_parse:
-                continue
+    Parameters
+    ----------
+    items
+        Items to select from.
+    selection
+        Index, indices or slice to select.
 
-            logger("Found mass")
+    Returns
+    -------
+    :
+        Selected items in order of `selection`.
+    """
+    if isinstance(selection, slice):
+        return list(items[selection])
+    if isinstance(selection, int):
+        selection = (selection,)
+    return [items[ind] for ind in selection]
+
+
+def _parse_runs(
+    castep_file_in: TextIO | FileWrapper | Block,
+    filters: Filters,
+    *,
+    at_eof: bool = True,
+    keys: frozenset[str] | None = None,
+    keep_empty: bool = False,
+) -> list[dict[str, Any]]:
+    """
+    Parse runs of castep file.
 
-            curr_run.setdefault("species_properties", defaultdict(dict))
+    Parameters
+    ----------
+    castep_file_in
+        File to parse.
+    filters
+        Parameters to parse.
+    at_eof
+        Whether `castep_file_in` ends at the end of the full file.
+    keys
+        Keys to parse, ``None`` to parse all keys.
+    keep_empty
+        Whether to keep runs with no data under `filters` and `keys`, so
+        that runs are counted as by :func:`index_runs`.
 
-            for key, val in _process_spec_prop(block):
-                curr_run["species_properties"][key]["mass"] = float(val)
+    Returns
+    -------
+    :
+        Parsed data.
+    """
+    runs: list[dict[str, Any]] = []
+    curr_run: dict[str, Any] = defaultdict(list)
 
-        # Electric Quadrupole Moment
-        elif block := Block.from_re(line, castep_file,
-                                    r"Electric Quadrupole Moment",
-                                    rf"({REs.EMPTY}|^\s*x+$)"):
-            if Filters.SPECIES_PROPS not in to_parse:
-                continue
+    if not isinstance(castep_file_in, (FileWrapper, Block)):
+        castep_file = FileWrapper(castep_file_in)
+    else:
+        castep_file = castep_file_in
 
-            logger("Found electric quadrupole moment")
+    logger = log_factory(castep_file)
+    state = _ParseState(castep_file, filters, logger, keys, active_profile())
 
-            curr_run.setdefault("species_properties", defaultdict(dict))
+    started = False
+    for section, data in _iter_sections(state):
+        if section.new_run:
+            if keep_empty and started and not curr_run:
+                runs.append(curr_run)
+            started = True
+        curr_run = _add_section(section, data, runs, curr_run, state)
 
-            for key, val, *_ in _process_spec_prop(block):
-                curr_run["species_properties"][key]["electric_quadrupole_moment"] = float(val)
+    if curr_run or (keep_empty and started):
+        if at_eof:
+            _fix_run_types(curr_run)
+        runs.append(curr_run)
+    return runs
 
-        # Pseudopots
-        elif block := Block.from_re(line, castep_file,
-                                    r"Files used for pseudopotentials", REs.EMPTY):
 
-            if Filters.SPECIES_PROPS not in to_parse:
-                continue
+def _iter_sections(state: _ParseState) -> Iterator[tuple[_Section, Any]]:
+    """
+    Find the top-level sections of a castep file.
 
-            logger("Found pseudopotentials")
+    Parameters
+    ----------
+    state
+        Parse state containing file to read.
 
-            curr_run.setdefault("species_properties", defaultdict(dict))
+    Yields
+    ------
+    _Section
+        Section found.
+    Any
+        Data of section (:class:`Block` or :class:`re.Match`), or ``True``
+        if skipped by filters.
+
+    Notes
+    -----
+    Handlers may read further from the file between sections.
+    """
+    castep_file, filters, logger, keys, profile = state
+    tracing = is_tracing()
+
+    # Jump between sections unless every line must be traced
+    lines = castep_file
+    if isinstance(castep_file, MappedFileWrapper) and not tracing:
+        lines = _jump_lines(castep_file)
+
+    for line in lines:
+        if tracing:
+            logger("%s", line, level="debug")
+
+        if profile is not None:
+            start_time = time.perf_counter()
+            start_line = castep_file.lineno
+            tell = getattr(castep_file, "tell", None)
+            start_pos = tell() - len(line.encode()) if tell else 0
+
+        for section in _candidate_sections(line):
+            if profile is not None:
+                profile.sections[section.name].attempts += 1
+
+            if section.end is None:
+                data = section.start.search(line)
+            elif section.wanted(filters, keys):
+                data = Block.from_re(line, castep_file, section.start, section.end,
+                                     n_end=section.n_end, eof_possible=section.eof_possible)
+            else:  # Filtered out, don't store block
+                data = skip_block(line, castep_file, section.start, section.end,
+                                  n_end=section.n_end, eof_possible=section.eof_possible)
+
+            if not data:
+                continue
+
+            if profile is None:
+                yield section, data
+                break
+
+            stats = profile.sections[section.name]
+            stats.hits += 1
+            stats.read_time += time.perf_counter() - start_time
+            yield section, data
+            # Resumed after section handled
+            stats.lines += castep_file.lineno - start_line + 1
+            stats.bytes += tell() - start_pos if tell else 0
+            break
+        else:
+            if profile is not None:
+                profile.dispatch_lines += 1
+                profile.dispatch_time += time.perf_counter() - start_time
+
+
+def _add_section(
+    section: _Section,
+    data: Any,
+    runs: list[dict[str, Any]],
+    curr_run: dict[str, Any],
+    state: _ParseState,
+) -> dict[str, Any]:
+    """
+    Add data of a section to the runs.
 
-            for key, val in _process_spec_prop(block):
-                if Filters.PSPOT in to_parse and "|" in val:
-                    val = _parse_pspot_string(val)
+    Parameters
+    ----------
+    section
+        Section found.
+    data
+        Data of section.
+    runs
+        Completed runs, appended to if `section` starts a new run.
+    curr_run
+        Current run.
+    state
+        Parse state.
 
-                curr_run["species_properties"][key]["pseudopot"] = val
+    Returns
+    -------
+    :
+        Current run after section.
+    """
+    if section.new_run:
+        if curr_run:
+            runs.append(curr_run)
+        state.logger("Found run %s", len(runs) + 1)
+        curr_run = defaultdict(list)
 
-        elif block := Block.from_re(line, castep_file,
-                                    gen_table_re("Pseudopotential Report[^|]+", r"\|"),
-                                    gen_table_re("", "=+")):
+    if not section.wanted(state.filters, state.keys):
+        return curr_run
 
-            if Filters.PSPOT not in to_parse:
-                continue
+    if state.profile is None:
+        section.handler(data, curr_run, state)
+        return curr_run
 
-            logger("Found pseudopotential report")
+    start_time = time.perf_counter()
+    with suspend_profile():  # Nested parses count towards this section
+        section.handler(data, curr_run, state)
+    state.profile.sections[section.name].process_time += time.perf_counter() - start_time
 
-            curr_run["pspot_detail"].append(_process_pspot_report(block))
+    return curr_run
 
-        elif match := re.match(r"\s*(?P<type>AE|PS) eigenvalue nl (?P<nl>\d+) =" +
-                               labelled_floats(("eigenvalue",)), line):
 
-            if Filters.PSPOT not in to_parse:
-                continue
+def _fix_run_types(run: dict[str, Any]) -> None:
+    """
+    Convert accumulated values of the final run to their final types.
 
-            logger("Found PSPot debug for %s at %s", match["type"], match["nl"])
+    Parameters
+    ----------
+    run
+        Run to fix.
+    """
+    fix_data_types(run, {"energies": float,
+                         "solvation": float})
 
-            val = match.groupdict()
-            fix_data_types(val, {"nl": int, "eigenvalue": float})
 
-            curr_run["pspot_debug"].append(val)
+def _candidate_sections(line: str) -> tuple[_Section, ...]:
+    """Get the sections which may start at `line` in order of precedence.
 
-        # Pair Params
-        elif block := Block.from_re(line, castep_file,
-                                    gen_table_re("PairParams", r"\*+", pre=r"\w*"),
-                                    REs.EMPTY):
+    Parameters
+    ----------
+    line
+        Line to classify.
 
-            if Filters.PARAMETERS not in to_parse:
-                continue
+    Returns
+    -------
+    :
+        Sections whose triggers appear in `line`.
+    """
+    lower = line.lower()
 
-            logger("Found pair params")
+    if not _TRIGGER_RE.search(lower):
+        return ()
 
-            curr_run["pair_params"].append(_process_pair_params(block))
+    return _sections_for(frozenset(trig for trig in _TRIGGERS if trig in lower))
 
-        # DFTD
-        elif block := Block.from_re(line, castep_file,
-                                    "DFT-D parameters",
-                                    r"^\s*$", n_end=3):
 
-            if Filters.PARAMETERS not in to_parse:
-                continue
+@functools.cache
+def _sections_for(triggers: frozenset[str]) -> tuple[_Section, ...]:
+    """Get sections associated with a set of triggers.
 
-            logger("Found DFTD block")
+    Parameters
+    ----------
+    triggers
+        Triggers found in line.
 
-            curr_run["dftd"] = _process_dftd(block)
+    Returns
+    -------
+    :
+        Sections in order of precedence.
+    """
+    return tuple(_SECTIONS[i] for i in sorted({i for trig in triggers for i in _TRIGGERS[trig]}))
 
-        # SCF
-        elif block := Block.from_re(line, castep_file, "SCF loop", "^-+ <-- SCF", n_end=2):
 
-            if Filters.SCF not in to_parse:
-                continue
+# --- Section handlers (in order of precedence)
 
-            logger("Found SCF")
+# Build Info
+@_section("Compiled for", filters=Filters.SYS_INFO, new_run=True)
+def _handle_build_info(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found build info")
+    curr_run["build_info"] = _process_buildinfo(block)
 
-            curr_run["scf"].append(_process_scf(block))
 
-        # SCF Line min
-        elif block := Block.from_re(line, castep_file,
-                                    gen_table_re("WAVEFUNCTION LINE MINIMISATION", "[+-]+",
-                                                 post="<- line"),
-                                    gen_table_re("", "[+-]+", post="<- line"), n_end=2):
+@_section("Run started", filters=Filters.SYS_INFO)
+def _handle_time_started(match: re.Match, curr_run: dict[str, Any], _state: _ParseState) -> None:
+    curr_run["time_started"] = normalise_string(match.string.split(":", 1)[1])
 
-            if Filters.SCF not in to_parse:
-                continue
 
-            logger("Found wvfn line min")
+# Finalisation
+@_section("Initialisation time", eof_possible=True, keys=None)
+def _handle_finalisation(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    # External files present
+    if "<" in block[-1]:
+        block.remove_bounds(0, 1)
+        state.file.rewind()
 
-            curr_run["wvfn_line_min"].append(_process_wvfn_line_min(block))
+    if Filters.SYS_INFO not in state.filters:
+        return
 
-        # SCF Occupancy
-        elif block := Block.from_re(line, castep_file,
-                                    gen_table_re("Occupancy", r"\|",
-                                                 post="<- occ", whole_line=False),
-                                    r"Have a nice day\."):
+    state.logger("Found finalisation")
+    curr_run.update(_process_finalisation(block))
 
-            if Filters.SCF not in to_parse:
-                continue
 
-            logger("Found occupancies")
+@_section("Overall parallel efficiency rating", filters=Filters.SYS_INFO)
+def _handle_parallel_efficiency(
+    match: re.Match, curr_run: dict[str, Any], state: _ParseState,
+) -> None:
+    state.logger("Found parallel efficiency")
 
-            curr_run["occupancies"].append(_process_occupancies(block))
+    curr_run["parallel_efficiency"] = float(get_numbers(match.string)[0])
 
-        # SCF Basis set
-        elif match := re.search(r" with +(\d) +cut-off energies.", line):
 
-            if Filters.SCF not in to_parse:
-                continue
+# Continuation
+@_section("Reading continuation data", filters=Filters.SYS_INFO)
+def _handle_continuation(match: re.Match, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found continuation block")
 
-            ncut = int(match.group(1))
-            line = ""
-            next(castep_file)
-            block = Block.from_re(line, castep_file,
-                                  "",
-                                  "^-+ <-- SCF", n_end=ncut * 3)
-            data = get_only(parse_castep_file(block, Filters.HIGH | Filters.SCF))
+    curr_run["continuation"] = match.string.split()[-1]
 
-            scf = data.pop("scf")
-            curr_run["bsc_energies"] = data.pop("energies")
 
-            curr_run["scf"], curr_run["bsc_scf"] = scf[-1], scf[:-1]
+# Warnings
+@_section("?", filters=Filters.SYS_INFO, keys=("warning",))
+def _handle_warning_block(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found warning")
 
-            curr_run.update(data)
+    block.remove_bounds(1, 1)
+    curr_run["warning"].append(" ".join(x.strip() for x in block))
 
-        # Energies
-        elif line.startswith("Final energy"):
 
-            logger("Found energy")
+@_section("warning", filters=Filters.SYS_INFO)
+def _handle_warning(match: re.Match, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found warning")
 
-            curr_run.setdefault("energies", defaultdict(list))
+    warn = match.string.strip()
 
-            curr_run["energies"]["final_energy"].append(to_type(get_numbers(line)[-1], float))
+    for tst, line in enumerate(state.file):
+        if not line.strip() or not re.match(match.group(1) + r"\s+", line):
+            if tst:
+                state.file.rewind()
+            break
+        warn += " " + line.strip()
 
-        elif "Total energy corrected for finite basis set" in line:
+    curr_run["warning"].append(warn)
 
-            logger("Found energy")
 
-            if "energies" not in curr_run:
-                curr_run["energies"] = defaultdict(list)
+# Memory estimate
+@_section("MEMORY AND SCRATCH",
+          filters=Filters.SYS_INFO)
+def _handle_memory_estimate(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found memory estimate")
 
-            curr_run["energies"]["final_basis_set_corrected"].append(
-                to_type(get_numbers(line)[-1], float))
+    curr_run["memory_estimate"].append(_process_memory_est(block))
 
-        elif "0K energy (E-0.5TS)" in line:
 
-            logger("Found estimated 0K energy")
+# Title
+@_section("Title", filters=Filters.PARAMETERS)
+def _handle_title(_match: re.Match, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found title")
 
-            curr_run.setdefault("energies", defaultdict(list))
+    curr_run["title"] = next(state.file).strip()
 
-            curr_run["energies"]["est_0K"].append(to_type(get_numbers(line)[-1], float))
 
-        elif line.startswith("(SEDC) Total Energy"):
+# Parameters
+@_section("Parameters",
+          filters=Filters.PARAMETERS)
+def _handle_options(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found options")
 
-            logger("Found SEDC energy correction")
+    curr_run["options"] = _process_params(block)
 
-            curr_run.setdefault("energies", defaultdict(list))
 
-            curr_run["energies"]["sedc_correction"].append(to_type(get_numbers(line)[-1], float))
+# Quantisation axis
+@_section("Quantisation axis", filters=Filters.SPECIES_PROPS)
+def _handle_quantisation_axis(
+    match: re.Match, curr_run: dict[str, Any], state: _ParseState,
+) -> None:
+    state.logger("Found Quantisation axis")
 
-        elif line.startswith("Dispersion corrected final energy"):
+    curr_run["quantisation_axis"] = to_type(get_numbers(match.string), float)
 
-            logger("Found SEDC final energy")
 
-            curr_run.setdefault("energies", defaultdict(list))
+# Pseudo-atomic energy
+@_section("Pseudo atomic calculation performed for",
+          n_end=2,
+          filters=Filters.SPECIES_PROPS,
+          keys=("species_properties",))
+def _handle_ps_energy(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found pseudo-atomic energy")
 
-            curr_run["energies"]["disperson_corrected"].append(
-                to_type(get_numbers(line)[-1], float))
+    key, val = _process_ps_energy(block)
 
-        # Free energies
-        elif re.match(rf"Final free energy \(E-TS\) += +({REs.EXPFNUMBER_RE})", line):
+    curr_run.setdefault("species_properties", defaultdict(dict))
 
-            logger("Found free energy (E-TS)")
+    curr_run["species_properties"][key].update(val)
 
-            curr_run.setdefault("energies", defaultdict(list))
 
-            curr_run["energies"]["free_energy"].append(to_type(get_numbers(line)[-1], float))
+# Mass
+@_section("Mass of species in AMU", filters=Filters.SPECIES_PROPS, keys=("species_properties",))
+def _handle_mass(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found mass")
 
-        # Solvation energy
-        elif line.startswith(" Free energy of solvation"):
+    curr_run.setdefault("species_properties", defaultdict(dict))
 
-            if Filters.SOLVATION not in to_parse:
-                continue
+    for key, val in _process_spec_prop(block):
+        curr_run["species_properties"][key]["mass"] = float(val)
 
-            logger("Found solvation energy")
 
-            curr_run.setdefault("energies", defaultdict(list))
+# Electric Quadrupole Moment
+@_section("Electric Quadrupole Moment",
+          filters=Filters.SPECIES_PROPS,
+          keys=("species_properties",))
+def _handle_electric_quadrupole_moment(
+    block: Block, curr_run: dict[str, Any], state: _ParseState,
+) -> None:
+    state.logger("Found electric quadrupole moment")
 
-            curr_run["energies"]["solvation"].append(*to_type(get_numbers(line), float))
+    curr_run.setdefault("species_properties", defaultdict(dict))
 
-        # Spin densities
-        elif match := REs.INTEGRATED_SPIN_DENSITY_RE.match(line):
+    for key, val, *_ in _process_spec_prop(block):
+        curr_run["species_properties"][key]["electric_quadrupole_moment"] = float(val)
 
-            if Filters.SCF not in to_parse and Filters.SPIN not in to_parse:
-                continue
 
-            logger("Found spin")
+# Pseudopots
+@_section("Files used for pseudopotentials", filters=Filters.SPECIES_PROPS,
+          keys=("species_properties",))
+def _handle_pseudopots(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found pseudopotentials")
 
-            val = match["val"] if len(match["val"].split()) == 1 else match["val"].split()
+    curr_run.setdefault("species_properties", defaultdict(dict))
 
-            if "|" in line:
-                curr_run["modspin"].append(to_type(val, float))
-            else:
-                curr_run["spin"].append(to_type(val, float))
+    for key, val in _process_spec_prop(block):
+        if Filters.PSPOT in state.filters and "|" in val:
+            val = _parse_pspot_string(val)
 
-        # Initial cell
-        elif block := Block.from_re(line, castep_file,
-                                    gen_table_re("Unit Cell"), REs.EMPTY, n_end=3):
+        curr_run["species_properties"][key]["pseudopot"] = val
 
-            if Filters.CELL not in to_parse:
-                continue
 
-            logger("Found cell")
+@_section("Pseudopotential Report",
+          filters=Filters.PSPOT)
+def _handle_pspot_detail(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found pseudopotential report")
 
-            curr_run["initial_cell"] = _process_unit_cell(block)
+    curr_run["pspot_detail"].append(_process_pspot_report(block))
 
-        # Cell Symmetry and contstraints
-        elif block := Block.from_re(line, castep_file,
-                                    gen_table_re("Symmetry and Constraints"),
-                                    "Cell constraints are"):
 
-            if Filters.SYMMETRIES not in to_parse:
-                continue
+@_section("eigenvalue nl",
+          filters=Filters.PSPOT)
+def _handle_pspot_debug(match: re.Match, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found PSPot debug for %s at %s", match["type"], match["nl"])
 
-            logger("Found symmetries")
+    val = match.groupdict()
+    fix_data_types(val, {"nl": int, "eigenvalue": float})
 
-            curr_run["symmetries"], curr_run["constraints"] = _process_symmetry(block)
+    curr_run["pspot_debug"].append(val)
 
-        # TSS (must be ahead of initial pos)
-        elif block := Block.from_re(line, castep_file,
-                                    gen_table_re("(Reactant|Product)", "x"),
-                                    gen_table_re("", "x+"), n_end=2):
 
-            if Filters.TSS not in to_parse or Filters.POSITION not in to_parse:
-                continue
+# Pair Params
+@_section("PairParams",
+          filters=Filters.PARAMETERS)
+def _handle_pair_params(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found pair params")
 
-            mode = "reactant" if "Reactant" in line else "product"
+    curr_run["pair_params"].append(_process_pair_params(block))
 
-            logger("Found %s initial states", mode)
 
-            curr_run[mode] = _process_atreg_block(block)
+# DFTD
+@_section("DFT-D parameters", n_end=3,
+          filters=Filters.PARAMETERS)
+def _handle_dftd(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found DFTD block")
 
-        # Initial pos
-        elif block := Block.from_re(line, castep_file,  # Labelled
-                                    r"Fractional coordinates of atoms\s+User-defined",
-                                    gen_table_re("", "x+")):
+    curr_run["dftd"] = _process_dftd(block)
 
-            if Filters.POSITION not in to_parse:
-                continue
 
-            curr_run.setdefault("labels", defaultdict(dict))
+# SCF
+@_section("SCF loop", n_end=2, filters=Filters.SCF)
+def _handle_scf(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found SCF")
 
-            logger("Found initial positions")
+    curr_run["scf"].append(_process_scf(block))
 
-            curr_run["initial_positions"] = {}
-            for line in block:
-                if match := REs.LABELLED_POS_RE.search(line):
-                    ind = atreg_to_index(match)
 
-                    if lab := match["label"].strip():
-                        curr_run["labels"][ind] = lab
-                        ind = (f"{ind[0]} [{lab}]", ind[1])
-                    else:
-                        curr_run["labels"][ind] = "NULL"
+# SCF Line min
+@_section("WAVEFUNCTION LINE MINIMISATION",
+          n_end=2,
+          filters=Filters.SCF)
+def _handle_wvfn_line_min(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found wvfn line min")
 
-                    curr_run["initial_positions"][ind] = to_type(match.group("x", "y", "z"), float)
+    curr_run["wvfn_line_min"].append(_process_wvfn_line_min(block))
 
-        elif block := Block.from_re(line, castep_file,  # Mixture
-                                    r"Mixture\s+Fractional coordinates of atoms",
-                                    gen_table_re("", "x+")):
 
-            if Filters.POSITION not in to_parse:
-                continue
+# SCF Occupancy
+@_section("Occupancy",
+          filters=Filters.SCF)
+def _handle_occupancies(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found occupancies")
 
-            logger("Found initial positions")
+    curr_run["occupancies"].append(_process_occupancies(block))
 
-            curr_run["initial_positions"] = {}
-            for line in block:
-                if match := REs.MIXTURE_LINE_1_RE.search(line):
-                    val = match.groupdict()
-                    spec, idx = atreg_to_index(match)
-                    pos = to_type(match.group("x", "y", "z"), float)
-                    weight = float(match["weight"])
 
-                    curr_run["initial_positions"][spec, idx] = {"pos": pos, "weight": weight}
+# SCF Basis set
+@_section("cut-off energies", filters=Filters.SCF, keys=None)
+def _handle_bsc(match: re.Match, curr_run: dict[str, Any], state: _ParseState) -> None:
+    ncut = int(match.group(1))
+    next(state.file)
+    scf_re = REs.CASTEP_SECTION_RES["bsc.scf"]
+    block = Block.from_re("", state.file, scf_re.start, scf_re.end, n_end=ncut * 3)
+    data = get_only(parse_castep_file(block, Filters.HIGH | Filters.SCF))
 
-                elif match := REs.MIXTURE_LINE_2_RE.search(line):
-                    spec = match["spec"].strip()
-                    weight = float(match["weight"])
+    scf = data.pop("scf")
+    curr_run["bsc_energies"] = data.pop("energies")
 
-                    curr_run["initial_positions"][spec, idx] = {"pos": pos, "weight": weight}
+    curr_run["scf"], curr_run["bsc_scf"] = scf[-1], scf[:-1]
 
-        elif block := Block.from_re(line, castep_file,
-                                    "Fractional coordinates of atoms",
-                                    gen_table_re("", "x+")):
+    curr_run.update(data)
 
-            if Filters.POSITION not in to_parse:
-                continue
 
-            logger("Found initial positions")
+# Energies
+def _add_energy(curr_run: dict[str, Any], key: str, line: str) -> None:
+    curr_run.setdefault("energies", defaultdict(list))
 
-            curr_run["initial_positions"] = _process_atreg_block(block)
+    curr_run["energies"][key].append(to_type(get_numbers(line)[-1], float))
 
-        elif "Supercell generated" in line:
-            accum = iter(get_numbers(line))
-            curr_run["supercell"] = tuple(to_type([next(accum) for _ in range(3)], float)
-                                          for _ in range(3))
 
-        # Initial vel
-        elif block := Block.from_re(line, castep_file,
-                                    "User Supplied Ionic Velocities",
-                                    gen_table_re("", "x+")):
+@_section("Final energy", keys=("energies",))
+def _handle_final_energy(match: re.Match, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found energy")
 
-            if Filters.POSITION not in to_parse:
-                continue
+    _add_energy(curr_run, "final_energy", match.string)
 
-            logger("Found initial velocities")
 
-            curr_run["initial_velocities"] = _process_atreg_block(block)
+@_section("Total energy corrected for finite basis set", keys=("energies",))
+def _handle_final_basis_set_corrected(
+    match: re.Match, curr_run: dict[str, Any], state: _ParseState,
+) -> None:
+    state.logger("Found energy")
 
-        # Initial spins
-        elif block := Block.from_re(line, castep_file,
-                                    "Initial magnetic",
-                                    gen_table_re("", "x+")):
+    _add_energy(curr_run, "final_basis_set_corrected", match.string)
 
-            if Filters.PARAMETERS not in to_parse:
-                continue
 
-            logger("Found initial spins")
+@_section("0K energy (E-0.5TS)", keys=("energies",))
+def _handle_est_0k(match: re.Match, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found estimated 0K energy")
 
-            curr_run["initial_spins"] = _process_initial_spins(block)
+    _add_energy(curr_run, "est_0K", match.string)
 
-        # Target Stress
-        elif block := Block.from_re(line, castep_file, "External pressure/stress", "", n_end=3):
 
-            if Filters.PARAMETERS not in to_parse:
-                continue
+@_section("(SEDC) Total Energy", keys=("energies",))
+def _handle_sedc_correction(
+    match: re.Match, curr_run: dict[str, Any], state: _ParseState,
+) -> None:
+    state.logger("Found SEDC energy correction")
 
-            logger("Found target stress")
+    _add_energy(curr_run, "sedc_correction", match.string)
 
-            accum = [to_type(number, float)
-                     for line in block
-                     for number in get_numbers(line)]
 
-            curr_run["target_stress"].append(accum)
+@_section("Dispersion corrected final energy", keys=("energies",))
+def _handle_dispersion_corrected(
+    match: re.Match, curr_run: dict[str, Any], state: _ParseState,
+) -> None:
+    state.logger("Found SEDC final energy")
 
-        # Finite basis correction parameter
-        elif match := re.search(rf"finite basis dEtot\/dlog\(Ecut\) = +({REs.FNUMBER_RE})", line):
+    _add_energy(curr_run, "disperson_corrected", match.string)
 
-            logger("Found dE/dlog(E)")
-            curr_run["dedlne"] = to_type(match.group(1), float)
 
-        # K-Points
-        elif block := Block.from_re(line, castep_file, "k-Points For BZ Sampling", REs.EMPTY):
+# Free energies
+@_section("Final free energy (E-TS)", keys=("energies",))
+def _handle_free_energy(match: re.Match, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found free energy (E-TS)")
 
-            if Filters.PARAMETERS not in to_parse:
-                continue
+    _add_energy(curr_run, "free_energy", match.string)
 
-            logger("Found k-points")
 
-            curr_run["k-points"] = _process_kpoint_blocks(block, implicit_kpoints=True)
+# Solvation energy
+@_section("Free energy of solvation", filters=Filters.SOLVATION, keys=("energies",))
+def _handle_solvation(match: re.Match, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found solvation energy")
 
-        elif block := Block.from_re(line, castep_file,
-                                    gen_table_re("Number +Fractional coordinates +Weight", r"\+"),
-                                    gen_table_re("", r"\++")):
+    curr_run.setdefault("energies", defaultdict(list))
 
-            if Filters.PARAMETERS not in to_parse:
-                continue
+    curr_run["energies"]["solvation"].append(*to_type(get_numbers(match.string), float))
 
-            logger("Found k-points list")
 
-            curr_run["k-points"] = _process_kpoint_blocks(block, implicit_kpoints=False)
+# Spin densities
+@_section("Spin Density", filters=Filters.SCF | Filters.SPIN, keys=("spin", "modspin"))
+def _handle_spin(match: re.Match, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found spin")
 
-        elif "Applied Electric Field" in line:
+    val = match["val"] if len(match["val"].split()) == 1 else match["val"].split()
 
-            if Filters.PARAMETERS not in to_parse:
-                continue
+    if "|" in match.string:
+        curr_run["modspin"].append(to_type(val, float))
+    else:
+        curr_run["spin"].append(to_type(val, float))
 
-            logger("Found electric field")
-            line = next(castep_file)
-            curr_run["applied_field"] = to_type(get_numbers(line), float)
 
-        # Forces blocks
-        elif block := Block.from_re(line, castep_file, REs.FORCES_BLOCK_RE, r"^\s*\*+$"):
+# Initial cell
+@_section("Unit Cell", n_end=3,
+          filters=Filters.CELL)
+def _handle_initial_cell(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found cell")
 
-            if Filters.FORCE not in to_parse:
-                continue
+    curr_run["initial_cell"] = _process_unit_cell(block)
 
-            curr_run.setdefault("forces", defaultdict(list))
 
-            key, val = _process_forces(block)
+# Cell Symmetry and contstraints
+@_section("Symmetry and Constraints",
+          filters=Filters.SYMMETRIES,
+          keys=("symmetries", "constraints"))
+def _handle_symmetries(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found symmetries")
 
-            logger("Found %s forces", key)
+    curr_run["symmetries"], curr_run["constraints"] = _process_symmetry(block)
 
-            curr_run["forces"][key].append(val)
 
-        elif block := Block.from_re(line, castep_file,
-                                    "firstd_calculate: removing force on centre of mass",
-                                    r"^\s*$"):
+# TSS (must be ahead of initial pos)
+@_section("Reactant", "Product",
+          n_end=2,
+          filters=Filters.TSS,
+          keys=("reactant", "product"))
+def _handle_tss(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    if Filters.POSITION not in state.filters:
+        return
 
-            if Filters.FORCE not in to_parse:
-                continue
+    mode = "reactant" if "Reactant" in block[0] else "product"
 
-            curr_run.setdefault("forces", defaultdict(list))
+    state.logger("Found %s initial states", mode)
 
-            key = "com_force_removal"
-            val = to_type([get_numbers(line)[0] for line in block if line.startswith(" dF")], float)
+    curr_run[mode] = _process_atreg_block(block)
 
-            logger("Found %s forces", key)
 
-            curr_run["forces"][key].append(val)
+# Initial pos
+@_section("User-defined",  # Labelled
+          filters=Filters.POSITION,
+          keys=("initial_positions", "labels"))
+def _handle_labelled_positions(
+    block: Block, curr_run: dict[str, Any], state: _ParseState,
+) -> None:
+    curr_run.setdefault("labels", defaultdict(dict))
 
-        # Stress tensor block
-        elif block := Block.from_re(line, castep_file, REs.STRESSES_BLOCK_RE, r"^\s*\*+$"):
-            if Filters.STRESS not in to_parse:
-                continue
+    state.logger("Found initial positions")
+
+    curr_run["initial_positions"] = {}
+    for line in block:
+        if match := REs.LABELLED_POS_RE.search(line):
+            ind = atreg_to_index(match)
 
-            if "stresses" not in curr_run:
-                curr_run["stresses"] = defaultdict(list)
+            if lab := match["label"].strip():
+                curr_run["labels"][ind] = lab
+                ind = (f"{ind[0]} [{lab}]", ind[1])
+            else:
+                curr_run["labels"][ind] = "NULL"
 
-            key, val = _process_stresses(block)
+            curr_run["initial_positions"][ind] = to_type(match.group("x", "y", "z"), float)
 
-            logger("Found %s stress", key)
 
-            curr_run["stresses"][key].append(val)
+@_section("Mixture",  # Mixture
+          filters=Filters.POSITION,
+          keys=("initial_positions",))
+def _handle_mixture_positions(
+    block: Block, curr_run: dict[str, Any], state: _ParseState,
+) -> None:
+    state.logger("Found initial positions")
 
-            # Phonon block
-        elif block := Block.from_re(line, castep_file,
-                                    "Vibrational Frequencies",
-                                    gen_table_re("", "=+")):
+    curr_run["initial_positions"] = {}
+    for line in block:
+        if match := REs.MIXTURE_LINE_1_RE.search(line):
+            spec, idx = atreg_to_index(match)
+            pos = to_type(match.group("x", "y", "z"), float)
+            weight = float(match["weight"])
 
-            if Filters.PHONON not in to_parse:
-                continue
+            curr_run["initial_positions"][spec, idx] = {"pos": pos, "weight": weight}
 
-            logger("Found phonon")
+        elif match := REs.MIXTURE_LINE_2_RE.search(line):
+            spec = match["spec"].strip()
+            weight = float(match["weight"])
 
-            curr_run["phonons"] = _process_phonon(block, logger)
+            curr_run["initial_positions"][spec, idx] = {"pos": pos, "weight": weight}
 
-            logger("Found %d phonon samples", len(curr_run["phonons"]))
 
-        # Phonon Symmetry
-        elif block := Block.from_re(line, castep_file,
-                                    "Phonon Symmetry Analysis", REs.EMPTY):
+@_section("Fractional coordinates of atoms",
+          filters=Filters.POSITION)
+def _handle_initial_positions(
+    block: Block, curr_run: dict[str, Any], state: _ParseState,
+) -> None:
+    state.logger("Found initial positions")
 
-            if Filters.PHONON not in to_parse:
-                continue
+    curr_run["initial_positions"] = _process_atreg_block(block)
 
-            logger("Found phonon symmetry analysis")
 
-            val = _process_phonon_sym_analysis(block)
-            curr_run["phonon_symmetry_analysis"].append(val)
+@_section("Supercell generated")
+def _handle_supercell(match: re.Match, curr_run: dict[str, Any], _state: _ParseState) -> None:
+    accum = iter(get_numbers(match.string))
+    curr_run["supercell"] = tuple(to_type([next(accum) for _ in range(3)], float)
+                                  for _ in range(3))
 
-        # Dynamical Matrix
-        elif block := Block.from_re(line, castep_file,
-                                    gen_table_re("Dynamical matrix"),
-                                    gen_table_re("", "-+")):
 
-            if Filters.PHONON not in to_parse:
-                continue
+# Initial vel
+@_section("User Supplied Ionic Velocities",
+          filters=Filters.POSITION)
+def _handle_initial_velocities(
+    block: Block, curr_run: dict[str, Any], state: _ParseState,
+) -> None:
+    state.logger("Found initial velocities")
 
-            logger("Found dynamical matrix")
+    curr_run["initial_velocities"] = _process_atreg_block(block)
 
-            val = _process_dynamical_matrix(block)
-            curr_run["dynamical_matrix"] = val
 
-        # Raman tensors
-        elif block := Block.from_re(line, castep_file,
-                                    gen_table_re("Raman Susceptibility Tensors[^+]*", r"\+"),
-                                    REs.EMPTY):
+# Initial spins
+@_section("Initial magnetic", filters=Filters.PARAMETERS)
+def _handle_initial_spins(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found initial spins")
 
-            if Filters.PHONON not in to_parse:
-                continue
+    curr_run["initial_spins"] = _process_initial_spins(block)
 
-            logger("Found Raman")
 
-            curr_run["raman"].append(_process_raman(block))
+# Target Stress
+@_section("External pressure/stress", n_end=3,
+          filters=Filters.PARAMETERS)
+def _handle_target_stress(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found target stress")
 
-        # Solvation
-        elif block := Block.from_re(line, castep_file,
-                                    gen_table_re("AUTOSOLVATION CALCULATION RESULTS", r"\*+"),
-                                    r"^\s*\*+\s*$"):
+    accum = [to_type(number, float)
+             for line in block
+             for number in get_numbers(line)]
 
-            if Filters.SOLVATION not in to_parse:
-                continue
+    curr_run["target_stress"].append(accum)
 
-            logger("Found autosolvation")
 
-            curr_run["autosolvation"] = _process_autosolvation(block)
+# Finite basis correction parameter
+@_section("finite basis dEtot/dlog(Ecut) =")
+def _handle_dedlne(match: re.Match, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found dE/dlog(E)")
+    curr_run["dedlne"] = to_type(match.group(1), float)
 
-        # Permittivity and NLO Susceptibility
-        elif block := Block.from_re(line, castep_file,
-                                    r"^\s+Optical Permittivity", r"^ =+$"):
 
-            if Filters.OPTICS not in to_parse:
-                continue
+# K-Points
+@_section("k-Points For BZ Sampling", filters=Filters.PARAMETERS, keys=("k-points",))
+def _handle_kpoints(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found k-points")
 
-            logger("Found optical permittivity")
+    curr_run["k-points"] = _process_kpoint_blocks(block, implicit_kpoints=True)
 
-            val = _process_3_6_matrix(block, split=True)
-            curr_run["optical_permittivity"] = val[0]
-            if val[1]:
-                curr_run["dc_permittivity"] = val[1]
 
-        # Polarisability
-        elif block := Block.from_re(line, castep_file, r"^\s+Polarisabilit(y|ies)", r"^ =+$"):
+@_section("Weight",
+          filters=Filters.PARAMETERS,
+          keys=("k-points",))
+def _handle_kpoints_list(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found k-points list")
 
-            if Filters.OPTICS not in to_parse:
-                continue
+    curr_run["k-points"] = _process_kpoint_blocks(block, implicit_kpoints=False)
 
-            logger("Found polarisability")
 
-            val = _process_3_6_matrix(block, split=True)
-            curr_run["optical_polarisability"] = val[0]
-            if val[1]:
-                curr_run["static_polarisability"] = val[1]
+@_section("Applied Electric Field", filters=Filters.PARAMETERS)
+def _handle_applied_field(_match: re.Match, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found electric field")
+    line = next(state.file)
+    curr_run["applied_field"] = to_type(get_numbers(line), float)
 
-        # Non-linear
-        elif block := Block.from_re(line, castep_file,
-                                    r"^\s+Nonlinear Optical Susceptibility", r"^ =+$"):
 
-            if Filters.OPTICS not in to_parse:
-                continue
+# Forces blocks
+@_section("Forces", filters=Filters.FORCE)
+def _handle_forces(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    curr_run.setdefault("forces", defaultdict(list))
 
-            logger("Found NLO")
+    key, val = _process_forces(block)
 
-            curr_run["nlo"], _ = _process_3_6_matrix(block, split=False)
+    state.logger("Found %s forces", key)
 
-        # Atomic displacements
-        elif block := Block.from_re(line, castep_file,
-                                    gen_table_re(r"Atomic Displacement Parameters \(A\*\*2\)"),
-                                    gen_table_re("", "-+"), n_end=3):
+    curr_run["forces"][key].append(val)
 
-            if Filters.THERMODYNAMICS not in to_parse:
-                continue
 
-            logger("Found atomic displacements")
+@_section("firstd_calculate: removing force on centre of mass",
+          filters=Filters.FORCE,
+          keys=("forces",))
+def _handle_com_force_removal(
+    block: Block, curr_run: dict[str, Any], state: _ParseState,
+) -> None:
+    curr_run.setdefault("forces", defaultdict(list))
 
-            accum = _process_atom_disp(block)
-            curr_run["atomic_displacements"] = accum
+    key = "com_force_removal"
+    val = to_type([get_numbers(line)[0] for line in block if line.startswith(" dF")], float)
 
-        # Thermodynamics
-        elif block := Block.from_re(line, castep_file,
-                                    gen_table_re("Thermodynamics"),
-                                    gen_table_re("", "-+"), n_end=3):
+    state.logger("Found %s forces", key)
 
-            if Filters.THERMODYNAMICS not in to_parse:
-                continue
+    curr_run["forces"][key].append(val)
 
-            logger("Found thermodynamics")
 
-            accum = _process_thermodynamics(block)
-            curr_run["thermodynamics"] = accum
+# Stress tensor block
+@_section("Stress Tensor", filters=Filters.STRESS)
+def _handle_stresses(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    if "stresses" not in curr_run:
+        curr_run["stresses"] = defaultdict(list)
 
-        # Mulliken Population Analysis
-        elif block := Block.from_re(line, castep_file,
-                                    gen_table_re(r"Atomic Populations \(Mulliken\)"),
-                                    gen_table_re("", "=+"), n_end=2):
+    key, val = _process_stresses(block)
 
-            if Filters.POPN_ANALYSIS not in to_parse:
-                continue
+    state.logger("Found %s stress", key)
 
-            logger("Found Mulliken")
+    curr_run["stresses"][key].append(val)
 
-            curr_run["mulliken_popn"] = _process_mulliken(block)
 
-        # Born charges
-        elif block := Block.from_re(line, castep_file,
-                                    gen_table_re("Born Effective Charges"),
-                                    gen_table_re("", "=+")):
+# Phonon block
+@_section("Vibrational Frequencies", filters=Filters.PHONON)
+def _handle_phonons(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found phonon")
 
-            if Filters.POPN_ANALYSIS not in to_parse:
-                continue
+    curr_run["phonons"] = _process_phonon(block, state.logger)
 
-            logger("Found Born")
+    state.logger("Found %d phonon samples", len(curr_run["phonons"]))
 
-            curr_run["born"].append(_process_born(block))
 
-        # Orbital populations
-        elif block := Block.from_re(line, castep_file,
-                                    gen_table_re("Orbital Populations"),
-                                    gen_table_re("", "-+"), n_end=3):
+# Phonon Symmetry
+@_section("Phonon Symmetry Analysis", filters=Filters.PHONON)
+def _handle_phonon_symmetry_analysis(
+    block: Block, curr_run: dict[str, Any], state: _ParseState,
+) -> None:
+    state.logger("Found phonon symmetry analysis")
 
-            if Filters.POPN_ANALYSIS not in to_parse:
-                continue
+    val = _process_phonon_sym_analysis(block)
+    curr_run["phonon_symmetry_analysis"].append(val)
 
-            logger("Found Orbital populations")
 
-            curr_run["orbital_popn"] = _process_orbital_populations(block)
+# Dynamical Matrix
+@_section("Dynamical matrix", filters=Filters.PHONON)
+def _handle_dynamical_matrix(
+    block: Block, curr_run: dict[str, Any], state: _ParseState,
+) -> None:
+    state.logger("Found dynamical matrix")
 
-        # Bond analysis
-        elif block := Block.from_re(line, castep_file,
-                                    r"Bond\s+Population(?:\s+Spin)?\s+Length",
-                                    gen_table_re("", "=+"), n_end=2):
+    val = _process_dynamical_matrix(block)
+    curr_run["dynamical_matrix"] = val
 
-            if Filters.POPN_ANALYSIS not in to_parse:
-                continue
 
-            logger("Found bond info")
+# Raman tensors
+@_section("Raman Susceptibility Tensors",
+          filters=Filters.PHONON)
+def _handle_raman(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found Raman")
 
-            curr_run["bonds"] = _process_bond_analysis(block)
+    curr_run["raman"].append(_process_raman(block))
 
-        # Hirshfeld Population Analysis
-        elif block := Block.from_re(line, castep_file,
-                                    gen_table_re("Hirshfeld Analysis"),
-                                    gen_table_re("", "=+"), n_end=2):
 
-            if Filters.POPN_ANALYSIS not in to_parse:
-                continue
+# Solvation
+@_section("AUTOSOLVATION CALCULATION RESULTS",
+          filters=Filters.SOLVATION)
+def _handle_autosolvation(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found autosolvation")
 
-            logger("Found Hirshfeld")
+    curr_run["autosolvation"] = _process_autosolvation(block)
 
-            curr_run["hirshfeld"] = _process_hirshfeld(block)
 
-        # ELF
-        elif block := Block.from_re(line, castep_file,
-                                    gen_table_re("ELF grid sample"),
-                                    gen_table_re("", "-+"), n_end=2):
+# Permittivity and NLO Susceptibility
+@_section("Optical Permittivity", filters=Filters.OPTICS,
+          keys=("optical_permittivity", "dc_permittivity"))
+def _handle_optical_permittivity(
+    block: Block, curr_run: dict[str, Any], state: _ParseState,
+) -> None:
+    state.logger("Found optical permittivity")
 
-            if Filters.ELF not in to_parse:
-                continue
+    val = _process_3_6_matrix(block, split=True)
+    curr_run["optical_permittivity"] = val[0]
+    if val[1]:
+        curr_run["dc_permittivity"] = val[1]
 
-            logger("Found ELF")
-
-            curr_run["elf"] = _process_elf(block)
-
-        # MD Block
-        elif (
-            block := Block.from_re(
-                line,
-                castep_file,  # Capture general MD step
-                "Starting MD iteration",
-                "(finished MD iteration|Finished MD$)",
-            )
-        ) or (
-            block := Block.from_re(
-                line,
-                castep_file,  # Capture 0th iteration
-                "Starting MD",
-                gen_table_re("", "=+"),
-            )
-        ):
-            if Filters.MD not in to_parse:
-                continue
 
-            logger("Found MD Block (step %d)", len(curr_run["md"]))
+# Polarisability
+@_section("Polarisabilit", filters=Filters.OPTICS,
+          keys=("optical_polarisability", "static_polarisability"))
+def _handle_optical_polarisability(
+    block: Block, curr_run: dict[str, Any], state: _ParseState,
+) -> None:
+    state.logger("Found polarisability")
 
-            # Avoid infinite recursion
-            next(block)
-            data = get_only(parse_castep_file(block))
-            add_aliases(data, {"initial_positions": "positions",
-                               "initial_cell": "cell"},
-                        replace=True)
+    val = _process_3_6_matrix(block, split=True)
+    curr_run["optical_polarisability"] = val[0]
+    if val[1]:
+        curr_run["static_polarisability"] = val[1]
 
-            # Put memory estimate to top level
-            if "memory_estimate" in data:
-                curr_run["memory_estimate"] = data.pop("memory_estimate")
 
-            curr_run["md"].append(data)
+# Non-linear
+@_section("Nonlinear Optical Susceptibility",
+          filters=Filters.OPTICS)
+def _handle_nlo(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found NLO")
 
-        elif block := Block.from_re(line, castep_file,
-                                    gen_table_re("MD Data:", "x"),
-                                    gen_table_re("", "x+")):
+    curr_run["nlo"], _ = _process_3_6_matrix(block, split=False)
 
-            if Filters.MD not in to_parse and Filters.MD_SUMMARY not in to_parse:
-                continue
 
-            curr_run.update(_process_md_block(block))
+# Atomic displacements
+@_section("Atomic Displacement Parameters (A**2)",
+          n_end=3,
+          filters=Filters.THERMODYNAMICS)
+def _handle_atomic_displacements(
+    block: Block, curr_run: dict[str, Any], state: _ParseState,
+) -> None:
+    state.logger("Found atomic displacements")
 
-        # GeomOpt
-        elif block := Block.from_re(
-            line,
-            castep_file,
-            "Final Configuration",
-            rf"\s*{REs.MINIMISERS_RE}\s*: Final",
-        ):
-            if Filters.GEOM_OPT not in to_parse and Filters.FINAL_CONFIG not in to_parse:
-                continue
+    accum = _process_atom_disp(block)
+    curr_run["atomic_displacements"] = accum
 
-            logger("Found final geom configuration")
 
-            curr_run["geom_opt"]["final_configuration"] = _process_final_config_block(block)
+# Thermodynamics
+@_section("Thermodynamics", n_end=3,
+          filters=Filters.THERMODYNAMICS)
+def _handle_thermodynamics(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found thermodynamics")
 
-        elif block := Block.from_re(line, castep_file,
-                                    rf"Starting {REs.MINIMISERS_RE} iteration\s*\d+\s*\.{{3}}",
-                                    rf"^=+$|^\s*Finished\s+{REs.MINIMISERS_RE}\s*$", n_end=2):
+    accum = _process_thermodynamics(block)
+    curr_run["thermodynamics"] = accum
 
-            if Filters.GEOM_OPT not in to_parse:
-                continue
 
-            curr_run.setdefault("geom_opt", defaultdict(list))
+# Mulliken Population Analysis
+@_section("Atomic Populations (Mulliken)",
+          n_end=2,
+          filters=Filters.POPN_ANALYSIS)
+def _handle_mulliken_popn(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found Mulliken")
 
-            if not curr_run["geom_opt"]["iterations"]:
-                data = {key: val for key, val in curr_run.items()
-                        if key in {"enthalpy", "initial_cell", "initial_positions",
-                                   "scf", "forces", "stresses", "minimisation"}}
+    curr_run["mulliken_popn"] = _process_mulliken(block)
 
-                for key in ("enthalpy", "scf", "forces", "stresses", "minimisation"):
-                    if key in curr_run:
-                        del curr_run[key]
 
-                add_aliases(data, {"initial_positions": "positions",
-                                   "initial_cell": "cell"},
-                            replace=True)
+# Born charges
+@_section("Born Effective Charges", filters=Filters.POPN_ANALYSIS)
+def _handle_born(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found Born")
 
-                curr_run["geom_opt"]["iterations"] = [data]
+    curr_run["born"].append(_process_born(block))
 
-            logger("Found geom block (iteration %d)", len(curr_run["geom_opt"]["iterations"]) + 1)
-            # Avoid infinite recursion
-            next(block)
-            data = get_only(parse_castep_file(block))
 
-            add_aliases(data, {"initial_positions": "positions",
-                               "initial_cell": "cell"},
-                        replace=True)
-            curr_run["geom_opt"]["iterations"].append(data)
+# Orbital populations
+@_section("Orbital Populations", n_end=3,
+          filters=Filters.POPN_ANALYSIS)
+def _handle_orbital_popn(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found Orbital populations")
 
-        elif match := re.search(f"(?P<minim>{REs.MINIMISERS_RE}):"
-                                r" finished iteration\s*\d+\s*with enthalpy", line):
+    curr_run["orbital_popn"] = _process_orbital_populations(block)
 
-            if Filters.GEOM_OPT not in to_parse:
-                continue
 
-            curr_run.setdefault("geom_opt", defaultdict(list))
+# Bond analysis
+@_section("Bond", n_end=2,
+          filters=Filters.POPN_ANALYSIS)
+def _handle_bonds(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found bond info")
 
-            minim = match["minim"]
+    curr_run["bonds"] = _process_bond_analysis(block)
 
-            logger("Found %s energy", minim)
 
-            curr_run["enthalpy"].append(to_type(get_numbers(line)[-1], float))
+# Hirshfeld Population Analysis
+@_section("Hirshfeld Analysis", n_end=2,
+          filters=Filters.POPN_ANALYSIS)
+def _handle_hirshfeld(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found Hirshfeld")
 
-        elif match := re.search(rf"trial guess \(lambda=\s*({REs.EXPFNUMBER_RE})\)", line):
+    curr_run["hirshfeld"] = _process_hirshfeld(block)
 
-            curr_run.setdefault("geom_opt", defaultdict(list))
 
-            curr_run["geom_opt"]["trial"].append(float(match.group(1)))
+# ELF
+@_section("ELF grid sample", n_end=2,
+          filters=Filters.ELF)
+def _handle_elf(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found ELF")
 
-        elif match := re.match(rf"^\s*(?:{REs.MINIMISERS_RE}):\s*"
-                               r"(?P<key>Final [^=]+)=\s*"
-                               f"(?P<value>{REs.EXPFNUMBER_RE}).*",
-                               line, re.IGNORECASE):
+    curr_run["elf"] = _process_elf(block)
 
-            if Filters.GEOM_OPT not in to_parse:
-                continue
 
-            key, val = normalise_string(match["key"]).lower(), to_type(match["value"], float)
-            key = "_".join(key.split())
-            logger("Found geomopt %s", key)
-            curr_run["geom_opt"]["final_configuration"][key] = val
+# MD Block
+@_section("Starting MD",  # Capture general MD step
+          filters=Filters.MD,
+          keys=("md", "memory_estimate"))
+def _handle_md(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found MD Block (step %d)", len(curr_run["md"]))
 
-        elif block := Block.from_re(line, castep_file,
-                                    f"<--( min)? {REs.MINIMISERS_RE}$",
-                                    r"\+(?:-+\+){4,5}", n_end=2):
+    # Avoid infinite recursion
+    next(block)
+    data = get_only(parse_castep_file(block))
+    add_aliases(data, {"initial_positions": "positions",
+                       "initial_cell": "cell"},
+                replace=True)
 
-            if Filters.GEOM_OPT not in to_parse:
-                continue
+    # Put memory estimate to top level
+    if "memory_estimate" in data:
+        curr_run["memory_estimate"] = data.pop("memory_estimate")
 
-            if not (match := re.search(REs.MINIMISERS_RE, line)):
-                raise ValueError("Invalid Geom block")
+    curr_run["md"].append(data)
 
-            typ = match.group(0)
 
-            logger("Found %s geom_block", typ)
+_section("Starting MD",  # Capture 0th iteration
+         name="md_initial",
+         filters=Filters.MD,
+         keys=("md", "memory_estimate"))(_handle_md)
 
-            curr_run["minimisation"].append(_process_geom_table(block))
 
-        # GeomOpt Deloc
+@_section("MD Data:", filters=Filters.MD | Filters.MD_SUMMARY, keys=None)
+def _handle_md_summary(block: Block, curr_run: dict[str, Any], _state: _ParseState) -> None:
+    curr_run.update(_process_md_block(block))
 
-        elif block := Block.from_re(line, castep_file,
-                                    "INTERNAL CONSTRAINTS", REs.EMPTY, n_end=2):
 
-            if Filters.GEOM_OPT not in to_parse:
-                continue
+# GeomOpt
+@_section("Final Configuration",
+          filters=Filters.GEOM_OPT | Filters.FINAL_CONFIG,
+          keys=("geom_opt",))
+def _handle_final_configuration(
+    block: Block, curr_run: dict[str, Any], state: _ParseState,
+) -> None:
+    state.logger("Found final geom configuration")
 
-            curr_run["internal_constraints"] = _process_internal_constraints(block)
+    curr_run.setdefault("geom_opt", defaultdict(list))
+    curr_run["geom_opt"]["final_configuration"] = _process_final_config_block(block)
 
-        elif block := Block.from_re(line, castep_file,
-                                    "Message: Generating deloc", "Message: Generation of deloc"):
 
-            if Filters.GEOM_OPT not in to_parse:
-                continue
+@_section("iteration",
+          n_end=2,
+          filters=Filters.GEOM_OPT,
+          keys=("geom_opt", "enthalpy", "scf", "forces", "stresses", "minimisation"))
+def _handle_geom_iteration(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    curr_run.setdefault("geom_opt", defaultdict(list))
 
-            logger("Found Delocalisaed GeomOpt Table")
+    if "iterations" not in curr_run["geom_opt"]:
+        data = {key: val for key, val in curr_run.items()
+                if key in {"enthalpy", "initial_cell", "initial_positions",
+                           "scf", "forces", "stresses", "minimisation"}}
 
-            curr_run.setdefault("delocalised_internal", {})
-            curr_run["delocalised_internal"].update(_process_deloc_table(block))
+        for key in ("enthalpy", "scf", "forces", "stresses", "minimisation"):
+            curr_run.pop(key, None)
 
-        elif block := Block.from_re(line, castep_file,
-                                    "The size of active space", REs.EMPTY):
+        add_aliases(data, {"initial_positions": "positions",
+                           "initial_cell": "cell"},
+                    replace=True)
 
-            if Filters.GEOM_OPT not in to_parse:
-                continue
+        curr_run["geom_opt"]["iterations"] = [data]
 
-            logger("Found Delocalisaed GeomOpt")
+    state.logger("Found geom block (iteration %d)", len(curr_run["geom_opt"]["iterations"]) + 1)
+    # Avoid infinite recursion
+    next(block)
+    data = get_only(parse_castep_file(block))
 
-            curr_run.setdefault("delocalised_internal", {})
-            curr_run["delocalised_internal"].update(_process_deloc_act_space_table(block))
+    add_aliases(data, {"initial_positions": "positions",
+                       "initial_cell": "cell"},
+                replace=True)
+    curr_run["geom_opt"]["iterations"].append(data)
 
-        # TDDFT
-        elif block := Block.from_re(line, castep_file,
-                                    gen_table_re("TDDFT excitation energies", r"\+", post="TDDFT"),
-                                    gen_table_re("=+", r"\+", post="TDDFT"), n_end=2):
 
-            if Filters.TDDFT not in to_parse:
-                continue
+#: Section of geometry iterations, the first built from the data of the run before it.
+_GEOM_ITERATION = next(sec for sec in _SECTIONS if sec.handler is _handle_geom_iteration)
 
-            logger("Found TDDFT excitations")
 
-            curr_run["tddft"] = _process_tddft(block)
+@_section("finished iteration",
+          filters=Filters.GEOM_OPT,
+          keys=("enthalpy", "geom_opt"))
+def _handle_enthalpy(match: re.Match, curr_run: dict[str, Any], state: _ParseState) -> None:
+    curr_run.setdefault("geom_opt", defaultdict(list))
 
-        # Band structure
-        elif block := Block.from_re(line, castep_file,
-                                    gen_table_re("(B A N D|Band Structure Calculation)[^+]+",
-                                                 r"\+"),
-                                    gen_table_re("", "=+")):
+    minim = match["minim"]
 
-            if Filters.BS not in to_parse:
-                continue
+    state.logger("Found %s energy", minim)
 
-            logger("Found band-structure")
+    curr_run["enthalpy"].append(to_type(get_numbers(match.string)[-1], float))
 
-            curr_run["bs"] = _process_band_structure(block)
 
-        # Molecular Dipole
-        elif block := Block.from_re(line, castep_file,
-                                    gen_table_re("D I P O L E   O F   M O L E C U L E"
-                                                 "   I N   S U P E R C E L L",
-                                                 r"\+"),
-                                    gen_table_re("", "=+")):
+@_section("trial guess (lambda=", keys=("geom_opt",))
+def _handle_trial(match: re.Match, curr_run: dict[str, Any], _state: _ParseState) -> None:
+    curr_run.setdefault("geom_opt", defaultdict(list))
 
-            if Filters.DIPOLE not in to_parse:
-                continue
+    curr_run["geom_opt"]["trial"].append(float(match.group(1)))
 
-            logger("Found molecular dipole")
 
-            curr_run["molecular_dipole"] = _process_dipole(block)
+@_section("final",
+          filters=Filters.GEOM_OPT,
+          keys=("geom_opt",))
+def _handle_geom_opt_final(match: re.Match, curr_run: dict[str, Any], state: _ParseState) -> None:
+    key, val = normalise_string(match["key"]).lower(), to_type(match["value"], float)
+    key = "_".join(key.split())
+    state.logger("Found geomopt %s", key)
+    curr_run.setdefault("geom_opt", defaultdict(list))
+    curr_run["geom_opt"].setdefault("final_configuration", {})[key] = val
 
-        # Chemical shielding
-        elif block := Block.from_re(line, castep_file,
-                                    gen_table_re("Chemical Shielding Tensor", r"\|"),
-                                    gen_table_re("", "=+")):
 
-            if Filters.CHEM_SHIELDING not in to_parse:
-                continue
+@_section("<--", n_end=2,
+          filters=Filters.GEOM_OPT)
+def _handle_minimisation(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    if not (match := re.search(REs.MINIMISERS_RE, block[0])):
+        raise ValueError("Invalid Geom block")
 
-            logger("Found Chemical Shielding Tensor")
+    typ = match.group(0)
 
-            val = _parse_magres_block(0, block)
-            curr_run["magres"].append(val)
+    state.logger("Found %s geom_block", typ)
 
-        elif block := Block.from_re(line, castep_file,
-                                    gen_table_re("Chemical Shielding and "
-                                                 "Electric Field Gradient Tensors", r"\|"),
-                                    gen_table_re("", "=+")):
+    curr_run["minimisation"].append(_process_geom_table(block))
 
-            if Filters.CHEM_SHIELDING not in to_parse:
-                continue
 
-            logger("Found Chemical Shielding + EField Tensor")
+# GeomOpt Deloc
+@_section("INTERNAL CONSTRAINTS", n_end=2,
+          filters=Filters.GEOM_OPT)
+def _handle_internal_constraints(
+    block: Block, curr_run: dict[str, Any], _state: _ParseState,
+) -> None:
+    curr_run["internal_constraints"] = _process_internal_constraints(block)
 
-            val = _parse_magres_block(1, block)
-            curr_run["magres"].append(val)
 
-        elif block := Block.from_re(line, castep_file,
-                                    gen_table_re("Electric Field Gradient Tensor", r"\|"),
-                                    gen_table_re("", "=+")):
+@_section("Message: Generating deloc", filters=Filters.GEOM_OPT, keys=("delocalised_internal",))
+def _handle_deloc_table(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found Delocalisaed GeomOpt Table")
 
-            if Filters.CHEM_SHIELDING not in to_parse:
-                continue
+    curr_run.setdefault("delocalised_internal", {})
+    curr_run["delocalised_internal"].update(_process_deloc_table(block))
 
-            logger("Found EField Tensor")
 
-            val = _parse_magres_block(2, block)
-            curr_run["magres"].append(val)
+@_section("The size of active space", filters=Filters.GEOM_OPT, keys=("delocalised_internal",))
+def _handle_deloc_act_space(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found Delocalisaed GeomOpt")
 
-        elif block := Block.from_re(line, castep_file,
-                                    gen_table_re("(?:I|Ani)sotropic J-coupling", r"\|"),
-                                    gen_table_re("", "=+")):
+    curr_run.setdefault("delocalised_internal", {})
+    curr_run["delocalised_internal"].update(_process_deloc_act_space_table(block))
 
-            if Filters.CHEM_SHIELDING not in to_parse:
-                continue
 
-            logger("Found J-coupling")
+# TDDFT
+@_section("TDDFT excitation energies",
+          n_end=2,
+          filters=Filters.TDDFT)
+def _handle_tddft(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found TDDFT excitations")
 
-            val = _parse_magres_block(3, block)
-            curr_run["magres"].append(val)
+    curr_run["tddft"] = _process_tddft(block)
 
-        elif block := Block.from_re(line, castep_file,
-                                    gen_table_re("Hyperfine Tensor", r"\|"),
-                                    gen_table_re("", "=+")):
 
-            if Filters.CHEM_SHIELDING not in to_parse:
-                continue
+# Band structure
+@_section("B A N D", "Band Structure Calculation",
+          filters=Filters.BS)
+def _handle_bs(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found band-structure")
 
-            logger("Found Hyperfine tensor")
+    curr_run["bs"] = _process_band_structure(block)
 
-            val = _parse_magres_block(4, block)
-            curr_run["magres"].append(val)
 
-        # Elastic
-        elif block := Block.from_re(line, castep_file,
-                                    gen_table_re(r"Elastic Constants Tensor \(GPa\)"),
-                                    gen_table_re("", "=+")):
+# Molecular Dipole
+@_section("D I P O L E",
+          filters=Filters.DIPOLE)
+def _handle_molecular_dipole(
+    block: Block, curr_run: dict[str, Any], state: _ParseState,
+) -> None:
+    state.logger("Found molecular dipole")
 
-            if Filters.ELASTIC not in to_parse:
-                continue
+    curr_run["molecular_dipole"] = _process_dipole(block)
 
-            logger("Found elastic constants tensor")
 
-            curr_run.setdefault("elastic", {})
+# Chemical shielding
+@_section("Chemical Shielding Tensor",
+          filters=Filters.CHEM_SHIELDING,
+          keys=("magres",))
+def _handle_chemical_shielding(
+    block: Block, curr_run: dict[str, Any], state: _ParseState,
+) -> None:
+    state.logger("Found Chemical Shielding Tensor")
 
-            val, _ = _process_3_6_matrix(block, split=False)
-            curr_run["elastic"]["elastic_constants"] = val
+    val = _parse_magres_block(0, block)
+    curr_run["magres"].append(val)
 
-        elif block := Block.from_re(line, castep_file,
-                                    gen_table_re(r"Compliance Matrix \(GPa\^-1\)"),
-                                    gen_table_re("", "=+")):
 
-            if Filters.ELASTIC not in to_parse:
-                continue
+@_section("Chemical Shielding and Electric Field Gradient Tensors",
+          filters=Filters.CHEM_SHIELDING,
+          keys=("magres",))
+def _handle_chemical_shielding_efg(
+    block: Block, curr_run: dict[str, Any], state: _ParseState,
+) -> None:
+    state.logger("Found Chemical Shielding + EField Tensor")
 
-            logger("Found compliance matrix")
+    val = _parse_magres_block(1, block)
+    curr_run["magres"].append(val)
 
-            curr_run.setdefault("elastic", {})
 
-            val, _ = _process_3_6_matrix(block, split=False)
-            curr_run["elastic"]["compliance_matrix"] = val
+@_section("Electric Field Gradient Tensor",
+          filters=Filters.CHEM_SHIELDING,
+          keys=("magres",))
+def _handle_efg(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found EField Tensor")
 
-        elif block := Block.from_re(line, castep_file, "Contribution ::", REs.EMPTY):
+    val = _parse_magres_block(2, block)
+    curr_run["magres"].append(val)
 
-            if not (match := re.match(r"(?P<type>.* Contribution)", line)):
-                raise ValueError("Invalid elastic block")
 
-            typ = match.group("type")
-            next(block)
+@_section("sotropic J-coupling",
+          filters=Filters.CHEM_SHIELDING,
+          keys=("magres",))
+def _handle_j_coupling(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found J-coupling")
 
-            if Filters.ELASTIC not in to_parse:
-                continue
+    val = _parse_magres_block(3, block)
+    curr_run["magres"].append(val)
 
-            logger("Found elastic %s contribution", typ)
 
-            curr_run.setdefault("elastic", {})
+@_section("Hyperfine Tensor",
+          filters=Filters.CHEM_SHIELDING,
+          keys=("magres",))
+def _handle_hyperfine(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found Hyperfine tensor")
 
-            val, _ = _process_3_6_matrix(block, split=False)
-            curr_run["elastic"][typ] = val
+    val = _parse_magres_block(4, block)
+    curr_run["magres"].append(val)
 
-        elif block := Block.from_re(line, castep_file,
-                                    gen_table_re("Elastic Properties"),
-                                    gen_table_re("", "=+")):
 
-            if Filters.ELASTIC not in to_parse:
-                continue
+# Elastic
+@_section("Elastic Constants Tensor (GPa)",
+          filters=Filters.ELASTIC,
+          keys=("elastic",))
+def _handle_elastic_constants(
+    block: Block, curr_run: dict[str, Any], state: _ParseState,
+) -> None:
+    state.logger("Found elastic constants tensor")
 
-            logger("Found elastic properties")
+    curr_run.setdefault("elastic", {})
 
-            curr_run.setdefault("elastic", {})
+    val, _ = _process_3_6_matrix(block, split=False)
+    curr_run["elastic"]["elastic_constants"] = val
 
-            curr_run["elastic"].update(_process_elastic_properties(block))
 
-        # Berry phase polarisation
+@_section("Compliance Matrix (GPa^-1)",
+          filters=Filters.ELASTIC,
+          keys=("elastic",))
+def _handle_compliance_matrix(
+    block: Block, curr_run: dict[str, Any], state: _ParseState,
+) -> None:
+    state.logger("Found compliance matrix")
 
-        elif block := Block.from_re(line, castep_file,  # Polarisation verbose
-                                    r"^\s*Ionic contribution to polarisation", "=+", n_end=14):
+    curr_run.setdefault("elastic", {})
 
-            if Filters.POLARISATION not in to_parse:
-                continue
+    val, _ = _process_3_6_matrix(block, split=False)
+    curr_run["elastic"]["compliance_matrix"] = val
 
-            logger("Found verbose berry phase polarisation")
 
-            curr_run.setdefault("berry_phase", {})
+@_section("Contribution ::", filters=Filters.ELASTIC, keys=("elastic",))
+def _handle_elastic_contribution(
+    block: Block, curr_run: dict[str, Any], state: _ParseState,
+) -> None:
+    if not (match := re.match(r"(?P<type>.* Contribution)", block[0])):
+        raise ValueError("Invalid elastic block")
 
-            curr_run["berry_phase"].update(_process_berry_phase(block))
+    typ = match.group("type")
+    next(block)
 
-        elif block := Block.from_re(line, castep_file,  # Polarisation
-                                    r"^\s*Polarisation", "=+", n_end=6):
+    state.logger("Found elastic %s contribution", typ)
 
-            if Filters.POLARISATION not in to_parse:
-                continue
+    curr_run.setdefault("elastic", {})
 
-            logger("Found berry phase polarisation")
+    val, _ = _process_3_6_matrix(block, split=False)
+    curr_run["elastic"][typ] = val
 
-            curr_run.setdefault("berry_phase", {})
 
-            curr_run["berry_phase"].update(_process_berry_phase(block))
+@_section("Elastic Properties", filters=Filters.ELASTIC, keys=("elastic",))
+def _handle_elastic_properties(
+    block: Block, curr_run: dict[str, Any], state: _ParseState,
+) -> None:
+    state.logger("Found elastic properties")
 
-        # DeltaSCF
+    curr_run.setdefault("elastic", {})
 
-        elif block := Block.from_re(line, castep_file,
-                                    "Calculating MODOS weights", r"^\s*$"):
+    curr_run["elastic"].update(_process_elastic_properties(block))
 
-            if Filters.DELTA_SCF not in to_parse:
-                continue
 
-            logger("Found delta SCF data")
+# Berry phase polarisation
+@_section("Ionic contribution to polarisation",  # Polarisation verbose
+          n_end=14,
+          filters=Filters.POLARISATION,
+          keys=("berry_phase",))
+def _handle_berry_phase_verbose(
+    block: Block, curr_run: dict[str, Any], state: _ParseState,
+) -> None:
+    state.logger("Found verbose berry phase polarisation")
 
-            curr_run["delta_scf"] = _process_delta_scf(block)
+    curr_run.setdefault("berry_phase", {})
 
-        # --- Extra blocks for testing
+    curr_run["berry_phase"].update(_process_berry_phase(block))
 
-        elif block := Block.from_re(
-            line,
-            castep_file,
-            f"<BEGIN ({'|'.join(PARSERS)})>",
-            f"<END ({'|'.join(PARSERS)})>",
-        ):
 
-            if Filters.TEST_EXTRA_DATA not in to_parse:
-                continue
+@_section("Polarisation",  # Polarisation
+          n_end=6,
+          filters=Filters.POLARISATION)
+def _handle_berry_phase(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found berry phase polarisation")
 
-            key = re.search(r"BEGIN (\w+)", line).group(1)
+    curr_run.setdefault("berry_phase", {})
 
-            logger("Found %s block", key)
+    curr_run["berry_phase"].update(_process_berry_phase(block))
 
-            curr_run.setdefault("external_files", {})
 
-            block.remove_bounds(1, 1)
+# DeltaSCF
+@_section("Calculating MODOS weights", filters=Filters.DELTA_SCF)
+def _handle_delta_scf(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    state.logger("Found delta SCF data")
 
-            val = PARSERS[key](block)
-            curr_run["external_files"][key] = val
+    curr_run["delta_scf"] = _process_delta_scf(block)
 
-    if curr_run:
-        fix_data_types(curr_run, {"energies": float,
-                                  "solvation": float})
-        runs.append(curr_run)
-    return runs
+
+# --- Extra blocks for testing
+@_section("<BEGIN ",
+          filters=Filters.TEST_EXTRA_DATA,
+          bounds=REs.SectionRE.from_bounds(f"<BEGIN ({'|'.join(PARSERS)})>",
+                                           f"<END ({'|'.join(PARSERS)})>"))
+def _handle_external_files(block: Block, curr_run: dict[str, Any], state: _ParseState) -> None:
+    key = re.search(r"BEGIN (\w+)", block[0]).group(1)
+    state.logger("Found %s block", key)
+
+    curr_run.setdefault("external_files", {})
+
+    block.remove_bounds(1, 1)
+
+    val = PARSERS[key](block)
+    curr_run["external_files"][key] = val
+
+
+def _build_trigger_table(
+    sections: Sequence[_Section],
+) -> tuple[re.Pattern, dict[str, tuple[int, ...]]]:
+    """Build classifier for lines from the triggers of `sections`.
+
+    Parameters
+    ----------
+    sections
+        Sections to classify.
+
+    Returns
+    -------
+    re.Pattern
+        Pattern matching any (lower-cased) trigger.
+    dict[str, tuple[int, ...]]
+        Mapping of (lower-cased) trigger to indices of sections it may start.
+    """
+    table: dict[str, list[int]] = defaultdict(list)
+    for i, section in enumerate(sections):
+        for trig in section.triggers:
+            table[trig.lower()].append(i)
+
+    # Longest first to avoid prefixes shadowing longer triggers
+    trigger_re = re.compile("|".join(map(re.escape, sorted(table, key=len, reverse=True))))
+    return trigger_re, {trig: tuple(ids) for trig, ids in table.items()}
+
+
+def _build_trigger_bytes_re(triggers: Iterable[str]) -> re.Pattern:
+    """Build pattern matching any of `triggers` in lower-cased encoded data.
+
+    Parameters
+    ----------
+    triggers
+        Lower-cased triggers to match.
+
+    Returns
+    -------
+    :
+        Pattern matching any trigger.
+
+    Notes
+    -----
+    Triggers are factored into a trie, which is much faster to search than
+    a flat alternation of literals.
+    """
+    trie: dict = {}
+    for trig in triggers:
+        node = trie
+        for char in trig.encode():
+            node = node.setdefault(char, {})
+        node[None] = {}
+
+    def to_re(node: dict) -> bytes:
+        if None in node:  # Shorter trigger already matched
+            return b""
+        alts = [re.escape(bytes((char,))) + to_re(child) for char, child in sorted(node.items())]
+        return alts[0] if len(alts) == 1 else b"(?:" + b"|".join(alts) + b")"
+
+    return re.compile(to_re(trie))
+
+
+_TRIGGER_RE, _TRIGGERS = _build_trigger_table(_SECTIONS)
+_TRIGGER_BYTES_RE = _build_trigger_bytes_re(_TRIGGERS)
 
 
 def _process_ps_energy(block: Block) -> tuple[str, PSPotEnergy]:
@@ -1627,8 +2495,10 @@ def _process_params(block: Block) -> dict[str, dict[str, str | tuple[Any, ...]]]
     key: str | list[str]
     val: Any
 
+    devel_code_re = REs.CASTEP_SECTION_RES["options.devel_code"]
+
     for line in block:
-        if dev_block := Block.from_re(line, block, "Developer Code", gen_table_re("", r"\*+")):
+        if dev_block := Block.from_re(line, block, devel_code_re.start, devel_code_re.end):
 
             dev_block.remove_bounds(1, 1)
             opt["devel_code"] = _parse_devel_code_block(dev_block)
@@ -2127,6 +2997,8 @@ def _process_symmetry(block: Block) -> tuple[SymmetryReport, ConstraintsReport]:
     con: ConstraintsReport = {}
     val: Any
 
+    cons_re = REs.CASTEP_SECTION_RES["symmetries.ionic_constraints"]
+
     for line in block:
         if "=" in line:
             key, val = line.split("=")
@@ -2190,7 +3062,7 @@ def _process_symmetry(block: Block) -> tuple[SymmetryReport, ConstraintsReport]:
         elif "Centre of mass" in line:
             con["com_constrained"] = "NOT" not in line
 
-        elif cons_block := Block.from_re(line, block, r"constraints\.{5}", r"\s*x+\.{4}\s*"):
+        elif cons_block := Block.from_re(line, block, cons_re.start, cons_re.end):
             con["ionic_constraints"] = defaultdict(list)
             for match in re.finditer(rf"{REs.ATOM_RE}\s*[xyz]\s*" +
                                      labelled_floats(("pos",), counts=(3,)),
@@ -2361,6 +3233,8 @@ def _process_phonon(block: Block, logger: Logger) -> list[QData]:
     qdata: dict[str, Any] = defaultdict(list)
     accum: list[QData] = []
 
+    char_table_re = REs.CASTEP_SECTION_RES["phonon_symmetry_analysis.character_table"]
+
     for line in block:
         if match := REs.PHONON_RE.match(line):
             if qdata["qpt"] and qdata["qpt"] not in (phonon["qpt"]
@@ -2378,8 +3252,7 @@ def _process_phonon(block: Block, logger: Logger) -> list[QData]:
             # ==By prop
             stack_dict(qdata, match.groupdict())
 
-        elif char_table := Block.from_re(line, block,
-                                         r"Rep\s+Mul", gen_table_re("[-=]+", r"\+"),
+        elif char_table := Block.from_re(line, block, char_table_re.start, char_table_re.end,
                                          eof_possible=True):
             headers = next(char_table).split()[4:]
 
@@ -2448,9 +3321,12 @@ def _process_dipole(block: Block) -> DipoleTable:
 def _process_pair_params(block_in: Block) -> dict[str, dict[str, dict | str]]:
 
     accum: dict[str, Any] = {}
+    two_body_re = REs.CASTEP_SECTION_RES["pair_params.two_body"]
+    three_body_re = REs.CASTEP_SECTION_RES["pair_params.three_body"]
+
     for line in block_in:
         # Two-body
-        if block := Block.from_re(line, block_in, "Two Body", r"^\w*\s*\*+\s*$"):
+        if block := Block.from_re(line, block_in, two_body_re.start, two_body_re.end):
             for blk_line in block:
                 if REs.PAIR_POT_RES["two_body_spec"].search(blk_line):
                     matches = REs.PAIR_POT_RES["two_body_spec"].finditer(blk_line)
@@ -2477,7 +3353,7 @@ def _process_pair_params(block_in: Block) -> dict[str, dict[str, dict | str]]:
                     labels = ((match["spec"],),)
 
         # Three-body
-        elif block := Block.from_re(line, block_in, "Three Body", r"^\s*\*+\s*$"):
+        elif block := Block.from_re(line, block_in, three_body_re.start, three_body_re.end):
             for blk_line in block:
                 if match := REs.PAIR_POT_RES["three_body_spec"].match(blk_line):
                     labels = (tuple(match["spec"].split()),)
@@ -2536,13 +3412,14 @@ def _process_geom_table(block: Block) -> GeomTable:
 def _process_final_config_block(block_in: Block) -> FinalConfig:
 
     accum: dict[str, Any] = {}
+    cell_re = REs.CASTEP_SECTION_RES["final_configuration.cell"]
+    atoms_re = REs.CASTEP_SECTION_RES["final_configuration.atoms"]
+
     for line in block_in:
-        if block := Block.from_re(line, block_in, r"\s*Unit Cell\s*", REs.EMPTY, n_end=3):
+        if block := Block.from_re(line, block_in, cell_re.start, cell_re.end, n_end=3):
             accum["cell"] = _process_unit_cell(block)
 
-        elif block := Block.from_re(line, block_in,
-                                    gen_table_re("Cell Contents"),
-                                    gen_table_re("", "x+"), n_end=2):
+        elif block := Block.from_re(line, block_in, atoms_re.start, atoms_re.end, n_end=2):
             accum["atoms"] = _process_atreg_block(block)
 
         elif match := re.match(rf"^\s*(?:{REs.MINIMISERS_RE}):"
@@ -2559,6 +3436,7 @@ def _process_final_config_block(block_in: Block) -> FinalConfig:
 def _process_elastic_properties(block: Block) -> ElasticProperties:
     accum: dict[str, float | ThreeVector | SixVector | ThreeByThreeMatrix] = {}
     val: float | ThreeVector | SixVector | ThreeByThreeMatrix | tuple[float, ...]
+    sound_re = REs.CASTEP_SECTION_RES["elastic_properties.speed_of_sound"]
 
     for line in block:
         if "::" in line:
@@ -2569,7 +3447,7 @@ def _process_elastic_properties(block: Block) -> ElasticProperties:
                 val = val[0]
 
             accum[normalise_key(key)] = val
-        elif blk := Block.from_re(line, block, "Speed of Sound", REs.EMPTY):
+        elif blk := Block.from_re(line, block, sound_re.start, sound_re.end):
 
             accum["speed_of_sound"] = cast(ThreeByThreeMatrix,
                                            tuple(to_type(numbers, float)
@@ -2652,10 +3530,11 @@ def _process_deloc_act_space_table(block: Block) -> DelocActiveSpace:
 
 def _process_berry_phase(block: Block) -> dict[str, Any]:
     accum = {}
+    table_re = REs.CASTEP_SECTION_RES["berry_phase.table"]
 
     for line in block:
         if "Ionic contribution to polarisation" in line:
-            table_blk = Block.from_re(line, block, REs.POL_HEADER_RE, "=+", n_end=2)
+            table_blk = Block.from_re(line, block, table_re.start, table_re.end, n_end=2)
             match = REs.POL_HEADER_RE.search(line)
             assert match
             key = normalise_key(match["key"])
@@ -2675,7 +3554,7 @@ def _process_berry_phase(block: Block) -> dict[str, Any]:
             accum[key] = {"units": match["unit"],
                           "val": to_type(match.group("a", "b", "c"), float)}
 
-        elif table_blk := Block.from_re(line, block, REs.POL_HEADER_RE, "=+", n_end=2,
+        elif table_blk := Block.from_re(line, block, table_re.start, table_re.end, n_end=2,
                                         eof_possible=True):
             match = REs.POL_HEADER_RE.search(line)
             assert match
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import re
 from collections import defaultdict
-from typing import TextIO, TypedDict
+from collections.abc import Collection, Iterable, Iterator, Mapping
+from contextlib import suppress
+from functools import cache
+from typing import Any, TextIO, TypedDict
 
-from castep_outputs.utilities.castep_res import ATOMIC_DATA_TAG, TAG_RE, get_numbers
+from castep_outputs.utilities.castep_res import ATOM_NAME_RE, ATOMIC_DATA_TAG, TAG_RE, get_numbers
 from castep_outputs.utilities.constants import FST_D, TAG_ALIASES
 from castep_outputs.utilities.datatypes import AtomIndex, ThreeByThreeMatrix, ThreeVector
 from castep_outputs.utilities.filewrapper import Block, FileWrapper
@@ -70,14 +74,178 @@ class MDGeomTimestepInfo(TypedDict, total=False):
     S: ThreeByThreeMatrix
 
 
-def parse_md_geom_frame(block: Block) -> MDGeomTimestepInfo:
+#: Columns of values in lines as written by CASTEP.
+_VALUE_COLUMNS = (slice(18, 45), slice(45, 72), slice(72, 99))
+
+#: Column of tag marker in lines as written by CASTEP.
+_TAG_COLUMN = 99
+_TAG_MARKER = "  <-- "
+
+#: Tags of data by name.
+_TAG_NAMES = {name: tag for tag, name in TAG_ALIASES.items()}
+
+
+@cache
+def _is_species(spec: str) -> bool:
+    """
+    Whether a string is a (possibly labelled) atom name.
+
+    Parameters
+    ----------
+    spec
+        String to check.
+
+    Returns
+    -------
+    :
+        Whether `spec` is an atom name.
+    """
+    return re.fullmatch(ATOM_NAME_RE, spec) is not None
+
+
+def _fixed_values(line: str) -> list[float] | None:
+    """
+    Read values from the fixed columns written by CASTEP.
+
+    Parameters
+    ----------
+    line
+        Line to read.
+
+    Returns
+    -------
+    :
+        Values in columns, ``None`` if they do not fit the columns.
+    """
+    fields = [field for field in map(line.__getitem__, _VALUE_COLUMNS) if not field.isspace()]
+    # Values overflowing their columns are not separated by a space
+    if any(field[0] != " " for field in fields):
+        return None
+
+    try:
+        return [float(field) for field in fields]
+    except ValueError:
+        return None
+
+
+def _parse_fixed_line(line: str, curr: MDGeomTimestepInfo) -> bool:
+    """
+    Parse a line of a frame from the fixed columns written by CASTEP.
+
+    Parameters
+    ----------
+    line
+        Non-empty line to parse.
+    curr
+        Frame to add data to.
+
+    Returns
+    -------
+    :
+        Whether line was parsed, ``False`` if it is not in the fixed layout.
+
+    Examples
+    --------
+    >>> curr = {"ions": {}}
+    >>> _parse_fixed_line(f"{'Si  1':>18}{1.5:27.16E}{-2.0:27.16E}{0.0:27.16E}  <-- R", curr)
+    True
+    >>> curr
+    {'ions': {('Si', 1): {'R': (1.5, -2.0, 0.0)}}}
+    >>> _parse_fixed_line(" Si 1 1.5 -2.0 0.0 <-- R", curr)
+    False
+    """
+    if not line.startswith(_TAG_MARKER, _TAG_COLUMN):
+        with suppress(ValueError):
+            if "<--" not in line:  # Timestep
+                curr["time"] = float(line)
+                return True
+        return False
+
+    tag = line[_TAG_COLUMN + len(_TAG_MARKER):].rstrip()
+    if not tag.isalpha() or (values := _fixed_values(line)) is None:
+        return False
+
+    label = line[:_VALUE_COLUMNS[0].start]
+    if label.isspace():
+        curr[tag].append(values)
+        return True
+
+    match label.split():
+        case [spec, index] if index.isdecimal() and len(values) == 3 and _is_species(spec):
+            curr["ions"].setdefault((spec, int(index)), {})[tag] = tuple(values)
+            return True
+    return False
+
+
+def _line_tag(line: str) -> str | None:
+    """
+    Find the tag of a line of a frame, without pattern matching.
+
+    Parameters
+    ----------
+    line
+        Non-empty line of frame.
+
+    Returns
+    -------
+    :
+        Tag of line, ``None`` if untagged (i.e. the time).
+
+    Examples
+    --------
+    >>> _line_tag("  1.0  2.0  3.0  <-- E")
+    'E'
+    >>> print(_line_tag("  1.0"))
+    None
+    """
+    if line.startswith(_TAG_MARKER, _TAG_COLUMN):
+        return line[_TAG_COLUMN + len(_TAG_MARKER):].strip()
+
+    _, marker, tag = line.partition("<--")
+    return tag.split(maxsplit=1)[0] if marker and not tag.isspace() else None
+
+
+def _select_tags(fields: Collection[str] | None) -> frozenset[str | None] | None:
+    """
+    Get tags of selected fields.
+
+    Parameters
+    ----------
+    fields
+        Tags or names (e.g. ``"position"``) of fields, ``None`` for all.
+
+    Returns
+    -------
+    :
+        Tags to parse, including the untagged time, ``None`` for all.
+
+    Examples
+    --------
+    >>> _select_tags({"position", "E"}) == {"E", "R", None}
+    True
+    """
+    if fields is None:
+        return None
+    return frozenset({None, *(_TAG_NAMES.get(field, field) for field in fields)})
+
+
+def parse_md_geom_frame(
+    block: Block | Iterable[str],
+    fields: Collection[str] | None = None,
+) -> MDGeomTimestepInfo:
     """
     Parse a single frame of a .md/.geom file.
 
+    Lines in the fixed layout written by CASTEP are read by column,
+    others by pattern matching.
+
     Parameters
     ----------
     block
         Block containing frame of data.
+    fields
+        Tags (e.g. ``"R"``) or names (e.g. ``"position"``) of data to parse,
+        default all. Lines of other tags are skipped. The time is always parsed.
 
     Returns
     -------
@@ -86,9 +254,11 @@ def parse_md_geom_frame(block: Block) -> MDGeomTimestepInfo:
     """
     curr: MDGeomTimestepInfo = defaultdict(list)
     curr["ions"] = {}
+    tags = _select_tags(fields)
 
     for line in block:
-        if not line.strip():
+        if (not line.strip() or (tags is not None and _line_tag(line) not in tags)
+                or _parse_fixed_line(line, curr)):
             pass
         elif not TAG_RE.search(line):  # Timestep
             curr["time"] = to_type(get_numbers(line)[0], float)
@@ -108,6 +278,85 @@ def parse_md_geom_frame(block: Block) -> MDGeomTimestepInfo:
     return curr
 
 
+class MDGeomFrame(Mapping[str, Any]):
+    r"""
+    Frame of a .md/.geom file, parsing each tag when first accessed.
+
+    Provides the same keys as :func:`parse_md_geom_frame`.
+
+    Parameters
+    ----------
+    lines
+        Lines of frame.
+    fields
+        Tags (e.g. ``"R"``) or names (e.g. ``"position"``) of data to include,
+        default all. The time is always included.
+
+    Examples
+    --------
+    >>> frame = MDGeomFrame([
+    ...     "  0.5\n",
+    ...     "  2.0  3.0  4.0  <-- E\n",
+    ...     " Si  1  0.0  0.5  1.0  <-- R\n",
+    ...     " Si  1  0.1  0.2  0.3  <-- V\n",
+    ... ], fields={"energy", "R"})
+    >>> list(frame)
+    ['ions', 'time', 'E', 'energy']
+    >>> frame["energy"]
+    [[2.0, 3.0, 4.0]]
+    >>> frame["ions"]
+    {('Si', 1): {'R': (0.0, 0.5, 1.0), 'position': (0.0, 0.5, 1.0)}}
+    """
+
+    def __init__(self, lines: Iterable[str], fields: Collection[str] | None = None) -> None:
+        tags = _select_tags(fields)
+
+        # Lines by tag, ``None`` for the time
+        self._lines: dict[str | None, list[str]] = {}
+        for line in filter(str.strip, lines):
+            tag = _line_tag(line)
+            if tags is None or tag in tags:
+                self._lines.setdefault(tag, []).append(line)
+
+        # Ion data start with an atom rather than a number
+        self._ion_tags = [tag for tag, tag_lines in self._lines.items()
+                          if tag is not None and tag_lines[0].lstrip()[:1].isalpha()]
+        top_tags = [tag for tag in self._lines if tag is not None and tag not in self._ion_tags]
+
+        self._keys = ["ions", *(["time"] if None in self._lines else []), *top_tags,
+                      *(name for tag, name in TAG_ALIASES.items() if tag in top_tags)]
+        self._data: dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._data:
+            return self._data[key]
+
+        if key not in self._keys:
+            raise KeyError(key)
+
+        if key == "ions":
+            lines = [line for tag in self._ion_tags for line in self._lines[tag]]
+            self._data[key] = parse_md_geom_frame(lines)["ions"]
+        elif key == "time":
+            self._data[key] = parse_md_geom_frame(self._lines[None])["time"]
+        else:
+            tag = _TAG_NAMES.get(key, key)
+            self._data[tag] = parse_md_geom_frame(self._lines[tag])[tag]
+            if tag in TAG_ALIASES:
+                self._data[TAG_ALIASES[tag]] = self._data[tag]
+
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(self._keys)})"
+
+
 def parse_header(md_geom_file: FileWrapper | Block) -> str:
     """Parse header of md/geom file.
 
@@ -142,6 +391,41 @@ def parse_header(md_geom_file: FileWrapper | Block) -> str:
     return comment
 
 
+@file_or_path(mode="r")
+def iter_md_geom_file(
+    md_geom_file: TextIO | FileWrapper | Block,
+    fields: Collection[str] | None = None,
+) -> Iterator[MDGeomTimestepInfo]:
+    """
+    Parse standard .md and .geom files, yielding each frame as it is parsed.
+
+    Parameters
+    ----------
+    md_geom_file
+        Open handle to file to parse.
+    fields
+        Tags (e.g. ``"R"``) or names (e.g. ``"position"``) of data to parse,
+        default all.
+
+    Yields
+    ------
+    MDGeomTimestepInfo
+        Parsed info of each step.
+
+    See Also
+    --------
+    parse_md_geom_file : Parse all frames into a list.
+    """
+    if not isinstance(md_geom_file, (FileWrapper, Block)):
+        md_geom_file = FileWrapper(md_geom_file)
+
+    # Comment currently discarded due to output format.
+    _comment = parse_header(md_geom_file)
+
+    while block := Block.from_re("", md_geom_file, "", "^$", eof_possible=True):
+        yield parse_md_geom_frame(block, fields)
+
+
 @file_or_path(mode="r")
 def parse_md_geom_file(md_geom_file: TextIO | FileWrapper | Block) -> list[MDGeomTimestepInfo]:
     """
@@ -167,12 +451,7 @@ def parse_md_geom_file(md_geom_file: TextIO | FileWrapper | Block) -> list[MDGeo
     if not isinstance(md_geom_file, (FileWrapper, Block)):
         md_geom_file = FileWrapper(md_geom_file)
 
-    # Comment currently discarded due to output format.
-    _comment = parse_header(md_geom_file)
-
-    steps = []
-    while block := Block.from_re("", md_geom_file, "", "^$", eof_possible=True):
-        steps.append(parse_md_geom_frame(block))
+    steps = list(iter_md_geom_file(md_geom_file))
 
     if not steps:
         logger("Invalid or empty md/geom file.", level="error")
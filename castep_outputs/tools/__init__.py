@@ -3,5 +3,7 @@
 For more advanced scripts, see ``castep_outputs_tools``.
 """
 
+from .castep_follower import CastepFollower as CastepFollower
 from .get_generated_files import get_generated_files as get_generated_files
 from .md_geom_parser import MDGeomParser as MDGeomParser
+from .md_statistics import md_statistics as md_statistics
@@ -0,0 +1,133 @@
+"""Incremental parser for growing .castep files."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from io import BytesIO
+from pathlib import Path
+from typing import Any
+
+from castep_outputs.parsers.castep_file_parser import (
+    Filters,
+    finalise_run,
+    parse_castep_chunk,
+)
+from castep_outputs.utilities.filewrapper import Block
+
+
+class CastepFollower:
+    """Incremental parser following a .castep file as it is written.
+
+    Each call to :meth:`update` parses only the data appended since the
+    previous call. Sections which have not yet been completely written
+    are left to be parsed by a later update.
+
+    Parameters
+    ----------
+    castep_file
+        File to follow.
+    filters
+        Parameters to parse.
+    encoding
+        Encoding of file.
+
+    Examples
+    --------
+    .. code-block:: python
+
+       follower = CastepFollower("seedname.castep")
+       while running:
+           runs = follower.update()
+           ...
+       runs = follower.update(final=True)
+    """
+
+    def __init__(
+        self,
+        castep_file: Path | str,
+        filters: Filters = Filters.HIGH,
+        *,
+        encoding: str = "utf-8",
+    ) -> None:
+        self.file = Path(castep_file).expanduser()
+        self.filters = filters
+        self.encoding = encoding
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard parsed data and restart from the beginning of the file."""
+        self._offset = 0
+        self._size = 0
+        self._runs: list[dict[str, Any]] = []
+        self._curr_run: dict[str, Any] = defaultdict(list)
+        self._runs_view: list[dict[str, Any]] | None = None
+
+    @property
+    def offset(self) -> int:
+        """Offset in bytes of the end of the last complete section parsed."""
+        return self._offset
+
+    @property
+    def runs(self) -> list[dict[str, Any]]:
+        """Runs parsed so far.
+
+        Returns
+        -------
+        :
+            Runs as returned by :func:`~castep_outputs.parsers.parse_castep_file`
+            on the parsed part of the file. These share data with the follower
+            and should not be modified.
+        """
+        if self._runs_view is None:  # Parsed since last access
+            self._runs_view = list(self._runs)
+            if self._curr_run:
+                self._runs_view.append(finalise_run(self._curr_run))
+        return list(self._runs_view)
+
+    def update(self, *, final: bool = False) -> list[dict[str, Any]]:
+        """
+        Parse data appended to the file since the last update.
+
+        Parameters
+        ----------
+        final
+            Whether the file is complete. If not, incomplete lines and
+            sections ending at the end of the file are left for the next update.
+
+        Returns
+        -------
+        :
+            Runs parsed so far.
+
+        Raises
+        ------
+        OSError
+            Section incomplete and `final`.
+        StopIteration
+            Section incomplete and `final`.
+        """  # noqa: DOC502
+        size = self.file.stat().st_size
+        if size < self._offset:  # File replaced
+            self.reset()
+        elif size == self._offset or (size == self._size and not final):  # Nothing new
+            return self.runs
+        self._size = size
+
+        with self.file.open("rb") as in_file:
+            in_file.seek(self._offset)
+            raw_lines = BytesIO(in_file.read()).readlines()
+
+            if not final and raw_lines and not raw_lines[-1].endswith(b"\n"):
+                raw_lines.pop()
+
+            lines = (line.decode(self.encoding).replace("\r\n", "\n") for line in raw_lines)
+            block = Block.from_iterable(lines, in_file)
+
+        if not block:
+            return self.runs
+
+        self._curr_run, done = parse_castep_chunk(block, self._runs, self._curr_run,
+                                                  self.filters, final=final)
+        self._runs_view = None
+        self._offset += sum(len(line) for line in raw_lines[:done])
+        return self.runs
@@ -2,21 +2,462 @@
 
 from __future__ import annotations
 
-from collections.abc import Generator, Iterable
+import importlib
+import io
+import os
+import re
+import struct
+import sys
+import time
+from array import array
+from collections import OrderedDict, deque
+from collections.abc import Callable, Collection, Generator, Iterable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import suppress
 from functools import singledispatchmethod
 from pathlib import Path
-from typing import overload
+from typing import TYPE_CHECKING, Any, BinaryIO, NamedTuple, overload
 
 from castep_outputs.parsers.md_geom_file_parser import (
+    MDGeomFrame,
     MDGeomTimestepInfo,
     parse_header,
     parse_md_geom_frame,
 )
-from castep_outputs.utilities.filewrapper import Block, FileWrapper
+from castep_outputs.utilities.compression import open_compressed
+from castep_outputs.utilities.filewrapper import Block, BufferedFileWrapper
 from castep_outputs.utilities.utility import log_factory
 
+if TYPE_CHECKING:
+    from types import ModuleType
 
-class MDGeomParser:
+    import numpy as np
+
+#: Separation between frames, ending at the start of the next frame.
+_FRAME_SEP_RE = re.compile(rb"\n(?:[ \t\r\f\v]*\n)+(?=[ \t\r\f\v]*\S)")
+
+#: Tags of per-ion data.
+_ION_TAGS = frozenset("RVF")
+
+#: Shapes of data of a frame by tag, for files without frames.
+_EMPTY_SHAPES: dict[str | None, tuple[int, ...]] = {
+    "R": (0, 3), "V": (0, 3), "F": (0, 3), "h": (3, 3), "E": (3,),
+}
+
+#: Largest span (in bytes) of file read at once to get nearby frames.
+_COALESCE_BYTES = 1 << 22
+
+#: Identifier of saved frame indices.
+_INDEX_MAGIC = b"CASTMDX1"
+
+#: Header of saved frame indices: magic, file size, file mtime (ns) and number of frames.
+_INDEX_HEADER = struct.Struct("<8sqqq")
+
+
+def _import_numpy() -> ModuleType:
+    """
+    Import NumPy when first needed, as it is slow to import and large.
+
+    Returns
+    -------
+    :
+        NumPy module.
+
+    Raises
+    ------
+    ImportError
+        NumPy is not installed.
+    """
+    try:
+        return importlib.import_module("numpy")
+    except ImportError as err:
+        raise ImportError("Trajectory arrays require numpy.") from err
+
+
+def index_frames(
+    stream: BinaryIO,
+    start: int = 0,
+    start_line: int = 0,
+    chunk_size: int = 1 << 22,
+) -> tuple[array, array]:
+    r"""
+    Find the start of every frame of an md/geom file in one pass.
+
+    Frames are runs of non-blank lines separated by blank lines.
+
+    Parameters
+    ----------
+    stream
+        File to scan, opened in binary mode.
+    start
+        Position (in bytes) to start from, i.e. after the header.
+    start_line
+        Number of lines before `start`.
+    chunk_size
+        Number of bytes to read at once.
+
+    Returns
+    -------
+    offsets : array
+        Position (in bytes) of the start of each frame, followed by the
+        end of the file.
+    lines : array
+        Number of lines before the start of each frame, followed by the
+        total number of lines.
+
+    Examples
+    --------
+    >>> from io import BytesIO
+    >>> offsets, lines = index_frames(BytesIO(b"\n a\n b\n\n  \n c\n\n d"))
+    >>> offsets.tolist(), lines.tolist()
+    ([1, 11, 15, 17], [1, 5, 7, 8])
+    """
+    offsets = array("q")
+    lines = array("q")
+
+    stream.seek(start)
+    buf = b""
+    buf_pos = start  # Position of `buf` in file
+    line = start_line  # Lines before `buf`
+    last = b""
+    first = True
+
+    while chunk := stream.read(chunk_size):
+        buf += chunk
+        last = chunk[-1:]
+        pos = 0
+
+        if first:
+            if not (stripped := buf.lstrip()):
+                continue
+            pos = buf.rfind(b"\n", 0, len(buf) - len(stripped)) + 1
+            line += buf.count(b"\n", 0, pos)
+            offsets.append(buf_pos + pos)
+            lines.append(line)
+            first = False
+
+        for match in _FRAME_SEP_RE.finditer(buf, pos):
+            line += buf.count(b"\n", pos, match.end())
+            pos = match.end()
+            offsets.append(buf_pos + pos)
+            lines.append(line)
+
+        # Separators found end before the last non-blank character,
+        # keep any trailing blank lines as they may precede the next frame
+        keep = len(buf.rstrip())
+        line += buf.count(b"\n", pos, keep)
+        buf_pos += keep
+        buf = buf[keep:]
+
+    offsets.append(buf_pos + len(buf))
+    lines.append(line + buf.count(b"\n") + (last not in {b"", b"\n"}))
+    return offsets, lines
+
+
+def _drop_partial_frame(stream: BinaryIO, offsets: array, lines: array) -> None:
+    r"""
+    Remove last frame from index if not yet followed by a blank line.
+
+    Parameters
+    ----------
+    stream
+        Indexed file, opened in binary mode.
+    offsets, lines
+        Frame index (see :func:`index_frames`), modified in place.
+
+    Notes
+    -----
+    CASTEP writes a blank line after each frame, so a frame without one may
+    still be being written.
+
+    Examples
+    --------
+    >>> from io import BytesIO
+    >>> stream = BytesIO(b" a\n\n b\n")
+    >>> offsets, lines = index_frames(stream)
+    >>> _drop_partial_frame(stream, offsets, lines)
+    >>> offsets.tolist(), lines.tolist()
+    ([0, 4], [0, 2])
+    """
+    if len(offsets) < 2:
+        return
+
+    stream.seek(offsets[-2])
+    data = stream.read(offsets[-1] - offsets[-2])
+    if data[len(data.rstrip()):].count(b"\n") < 2:
+        offsets.pop()
+        lines.pop()
+
+
+def index_path(file: Path) -> Path:
+    """
+    Location of saved frame index of a file.
+
+    Parameters
+    ----------
+    file
+        Indexed md/geom file.
+
+    Returns
+    -------
+    :
+        Path of index.
+
+    Examples
+    --------
+    >>> index_path(Path("seed.md.gz")).name
+    'seed.md.gz.idx'
+    """
+    return file.with_name(f"{file.name}.idx")
+
+
+def _load_index(path: Path, stat: os.stat_result) -> tuple[array, array] | None:
+    """
+    Read saved frame index.
+
+    Parameters
+    ----------
+    path
+        Location of index.
+    stat
+        Status of indexed file.
+
+    Returns
+    -------
+    :
+        Frame offsets and line numbers (see :func:`index_frames`) or ``None`` if
+        missing, invalid or out of date.
+    """
+    try:
+        data = path.read_bytes()
+        magic, size, mtime, n_frames = _INDEX_HEADER.unpack_from(data)
+    except (OSError, struct.error):
+        return None
+
+    n_entries = n_frames + 1
+    if (magic != _INDEX_MAGIC or (size, mtime) != (stat.st_size, stat.st_mtime_ns)
+            or len(data) != _INDEX_HEADER.size + 16 * n_entries):
+        return None
+
+    index = array("q")
+    index.frombytes(data[_INDEX_HEADER.size:])
+    if sys.byteorder == "big":
+        index.byteswap()
+    return index[:n_entries], index[n_entries:]
+
+
+def _save_index(path: Path, stat: os.stat_result, offsets: array, lines: array) -> None:
+    """
+    Write frame index, if possible.
+
+    Parameters
+    ----------
+    path
+        Location of index.
+    stat
+        Status of indexed file.
+    offsets, lines
+        Frame index (see :func:`index_frames`).
+    """
+    index = offsets + lines
+    if sys.byteorder == "big":
+        index.byteswap()
+
+    header = _INDEX_HEADER.pack(_INDEX_MAGIC, stat.st_size, stat.st_mtime_ns, len(offsets) - 1)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with suppress(OSError):
+        tmp.write_bytes(header + index.tobytes())
+        tmp.replace(path)  # Atomic, so concurrent readers never see partial index
+
+
+def _split_lines(data: bytes, encoding: str) -> list[str]:
+    r"""
+    Decode data and split lines as a text-mode file would.
+
+    Parameters
+    ----------
+    data
+        Data to split.
+    encoding
+        Encoding of data.
+
+    Returns
+    -------
+    :
+        Lines of data.
+
+    Examples
+    --------
+    >>> _split_lines(b"a\r\nb\n", "utf-8")
+    ['a\n', 'b\n']
+    """
+    return io.StringIO(data.decode(encoding), newline=None).readlines()
+
+
+class FrameCacheInfo(NamedTuple):
+    """Statistics of cache of parsed frames."""
+
+    #: Number of frames found in cache.
+    hits: int
+    #: Number of frames read as not in cache.
+    misses: int
+    #: Number of frames in cache.
+    frames: int
+    #: Size (in bytes of file) of frames in cache.
+    nbytes: int
+
+
+class _FrameCache:
+    """Least-recently-used cache of parsed frames.
+
+    Parameters
+    ----------
+    max_frames
+        Maximum number of frames, ``None`` for no limit.
+    max_bytes
+        Maximum size (in bytes of file) of frames, ``None`` for no limit.
+    """
+
+    def __init__(self, max_frames: int | None, max_bytes: int | None) -> None:
+        self.max_frames = max_frames
+        self.max_bytes = max_bytes
+        self._frames: OrderedDict[int, tuple[Any, int]] = OrderedDict()
+        self.hits = self.misses = self.nbytes = 0
+
+    def get(self, frame: int) -> Any | None:
+        """Get frame, marking it as most recently used.
+
+        Parameters
+        ----------
+        frame
+            Index of frame.
+
+        Returns
+        -------
+        :
+            Frame or ``None`` if not cached.
+        """
+        if (entry := self._frames.get(frame)) is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._frames.move_to_end(frame)
+        return entry[0]
+
+    def put(self, frame: int, value: Any, nbytes: int) -> None:
+        """Add frame, dropping least recently used frames beyond limits.
+
+        Parameters
+        ----------
+        frame
+            Index of frame.
+        value
+            Frame to cache.
+        nbytes
+            Size of frame.
+        """
+        if self.max_frames == 0 or self.max_bytes == 0:
+            return
+
+        if frame in self._frames:
+            self.nbytes -= self._frames.pop(frame)[1]
+        self._frames[frame] = (value, nbytes)
+        self.nbytes += nbytes
+
+        while ((self.max_frames is not None and len(self._frames) > self.max_frames)
+               or (self.max_bytes is not None and self.nbytes > self.max_bytes)):
+            _, (_, size) = self._frames.popitem(last=False)
+            self.nbytes -= size
+
+    def clear(self) -> None:
+        """Drop all frames and reset statistics."""
+        self._frames.clear()
+        self.hits = self.misses = self.nbytes = 0
+
+    def info(self) -> FrameCacheInfo:
+        """Get statistics.
+
+        Returns
+        -------
+        :
+            Hits, misses and current size.
+        """
+        return FrameCacheInfo(self.hits, self.misses, len(self._frames), self.nbytes)
+
+
+class _FrameChunk(NamedTuple):
+    """Frames of a file to parse in a worker process."""
+
+    #: File to parse.
+    path: str
+    #: Offsets of start and end of each frame.
+    bounds: tuple[tuple[int, int], ...]
+    #: Encoding of file.
+    encoding: str
+    #: Data of each frame if read beforehand (i.e. of compressed files).
+    data: tuple[bytes, ...] | None = None
+
+
+def _read_at(binary: BinaryIO, start: int, end: int) -> bytes:
+    """
+    Read a range of a file, without moving it where possible.
+
+    Parameters
+    ----------
+    binary
+        File to read, opened in binary mode.
+    start
+        Offset of start of range.
+    end
+        Offset of end of range.
+
+    Returns
+    -------
+    :
+        Data read.
+    """
+    if hasattr(os, "pread"):
+        return os.pread(binary.fileno(), end - start, start)
+    binary.seek(start)
+    return binary.read(end - start)
+
+
+def _parse_frame_chunk(
+    chunk: _FrameChunk,
+    func: Callable[[MDGeomTimestepInfo], Any] | None,
+    fields: Collection[str] | None = None,
+) -> list[Any]:
+    """
+    Parse frames of a file in a worker process.
+
+    Parameters
+    ----------
+    chunk
+        Frames to parse.
+    func
+        Function to apply to each parsed frame.
+    fields
+        Data to parse (see :func:`parse_md_geom_frame`), default all.
+
+    Returns
+    -------
+    :
+        Parsed frames, or results of `func`.
+    """
+    data = chunk.data
+    if data is None:
+        with Path(chunk.path).open("rb") as binary:
+            data = tuple(_read_at(binary, start, end) for start, end in chunk.bounds)
+
+    results = []
+    for text in data:
+        frame = parse_md_geom_frame(Block.from_iterable(_split_lines(text, chunk.encoding)), fields)
+        results.append(frame if func is None else func(frame))
+    return results
+
+
+class MDGeomParser:  # noqa: PLR0904
     """Lazy MD/Geom parser.
 
     Implements iterator and getitem approaches for
@@ -26,74 +467,205 @@ class MDGeomParser:
     ----------
     md_geom_file
         File to parse.
+    fields
+        Tags (e.g. ``"R"``) or names (e.g. ``"position"``) of data to read
+        from each frame, default all. Lines of other tags are skipped without
+        being parsed. The time is always read.
+    lazy
+        Whether to return frames as :class:`MDGeomFrame`, which parse each
+        tag only when it is first accessed, rather than parsing them whole.
+    cache_size
+        Maximum number of parsed frames to keep, ``None`` for no limit. By
+        default frames are not kept.
+    cache_bytes
+        Maximum size (in bytes of the file) of parsed frames to keep, ``None``
+        for no limit.
+    cache_index
+        Whether to save the index of frames alongside the file (see
+        :func:`index_path`) and reuse it when the file is reopened. By
+        default nothing is written next to the file.
+
+    Notes
+    -----
+    On opening, the file is scanned once to find the start of every frame
+    (see :func:`index_frames`), so frames may differ in size and any frame
+    is found directly. With `cache_index`, a saved index is only reused if
+    the size and modification time of the file are unchanged. If it cannot
+    be saved (e.g. the directory is read-only) the index is only kept in
+    memory.
+
+    Kept frames are returned again when revisited, rather than reread, and
+    are shared between accesses (see :meth:`cache_info`). Frames requested
+    together (e.g. by slice) are read in a single pass through the file,
+    reading nearby frames at once.
+
+    Frames not yet followed by a blank line are taken to be still being
+    written and are left out. Frames written after opening are found with
+    :meth:`refresh` or :meth:`follow`.
+
+    Compressed files are decompressed as they are read. Without a saved
+    index, opening them decompresses the whole file once.
     """
 
-    def __init__(self, md_geom_file: Path | str) -> None:
+    def __init__(
+        self,
+        md_geom_file: Path | str,
+        *,
+        fields: Collection[str] | None = None,
+        lazy: bool = False,
+        cache_size: int | None = 0,
+        cache_bytes: int | None = None,
+        cache_index: bool = False,
+    ) -> None:
         self._next_frame: int | None
 
         self.file = Path(md_geom_file).expanduser()
+        self.fields = None if fields is None else frozenset(fields)
+        self.lazy = lazy
+        self._cache = _FrameCache(cache_size, cache_bytes)
 
         if not self.file.is_file():
             raise FileNotFoundError(f"Cannot open file ({self.file.absolute()}).")
 
-        self._raw_handle = self.file.open()
-        self._handle = FileWrapper(self._raw_handle)
-        self.logger = log_factory(self._handle)
+        self._open(cache_index=cache_index)
 
-        self.comment = parse_header(self._handle)
+    def _open(self, *, cache_index: bool = False) -> None:
+        """Open file and index its frames.
 
-        self._start = self._handle.tell()
-        self._start_line = self._handle.lineno
+        Parameters
+        ----------
+        cache_index
+            Whether to reuse or save the index alongside the file.
+        """
+        stream = open_compressed(self.file)
+        self._handle = BufferedFileWrapper(stream)
+        self.logger = log_factory(self._handle)
 
-        while next(self._handle).strip():
-            pass
-        self._frame_lines = self._handle.lineno - self._start_line - 1
+        self.comment = parse_header(self._handle)
 
-        self._frame_bytes = self._handle.tell() - self._start
         stat = self.file.stat()
+        index = _load_index(index_path(self.file), stat) if cache_index else None
 
-        len_est = (stat.st_size - self._start) / self._frame_bytes
-
-        if not len_est.is_integer():
-            self.logger(
-                """\
-Number of frames estimate is non-integral (%d).
-This may have been caused by manually modifying the file.
+        if index is None:
+            index = self._scan(self._handle.tell(), self._handle.lineno)
 
-While iteration should work, extracting particular frames may not.
-                """,
-                len_est,
-                level="warning",
-            )
+            if cache_index:
+                _save_index(index_path(self.file), stat, *index)
 
-        self._len = int(len_est)
+        self._offsets, self._lines = index
+        self._size = stat.st_size
+        # Whether file can be read directly by workers
+        self._direct = isinstance(stream, (io.BufferedReader, io.FileIO))
         self._go_to_frame(0)
 
-    @property
-    def next_frame(self) -> int | None:
-        """Get index of next frame to be read, or None if at file end."""
-        return self._next_frame
-
-    def _get_index(self, frame: int) -> int:
-        """Get index of given frame in bytes.
+    def _scan(self, start: int, start_line: int) -> tuple[array, array]:
+        """Index complete frames from `start` to end of file.
 
         Parameters
         ----------
-        frame
-            Frame to compute.
+        start
+            Position (in bytes) to start from.
+        start_line
+            Number of lines before `start`.
+
+        Returns
+        -------
+        :
+            Frame offsets and line numbers (see :func:`index_frames`).
+        """
+        # Scan with underlying file, then return it to where the handle left it
+        stream = self._handle.buffer
+        pos = stream.tell()
+        offsets, lines = index_frames(stream, start, start_line)
+        _drop_partial_frame(stream, offsets, lines)
+        stream.seek(pos)
+        return offsets, lines
+
+    def refresh(self) -> int:
+        """
+        Find frames written since the file was last indexed.
 
         Returns
         -------
         :
-            Position in bytes into file to get given frame.
+            Number of new frames.
+
+        Notes
+        -----
+        Only the file beyond the last complete frame is scanned, and nothing
+        is read if the size of the file is unchanged. Frames already read
+        (and cached) are unaffected. The saved index is not updated.
+
+        If the file has shrunk (i.e. it was truncated or replaced), it is
+        indexed again from the start, the cache is emptied and all of its
+        frames are new.
+        """
+        if (size := self.file.stat().st_size) == self._size:
+            return 0
+
+        if size < self._size:  # File truncated or replaced
+            self._handle.close()
+            self._cache.clear()
+            self._open()
+            return len(self)
+        self._size = size
+
+        n_frames = len(self)
+        offsets, lines = self._scan(self._offsets[-1], self._lines[-1])
+        # End of last frame is now start of next
+        self._offsets[-1:] = offsets
+        self._lines[-1:] = lines
+
+        if self._next_frame is None and len(self) > n_frames:
+            self._next_frame = n_frames
+        return len(self) - n_frames
+
+    def follow(
+        self,
+        interval: float = 1.0,
+        timeout: float | None = None,
+    ) -> Iterator[MDGeomTimestepInfo]:
+        """
+        Get frames from the next frame onwards, waiting for new frames to be written.
+
+        Parameters
+        ----------
+        interval
+            Time (s) between checks for new frames.
+        timeout
+            Time (s) without new frames after which to stop, default never.
+
+        Yields
+        ------
+        MDGeomTimestepInfo
+            Each frame as it is completed.
+
+        See Also
+        --------
+        refresh : Find new frames without waiting.
         """
-        return self._start + (self._frame_bytes * frame)
+        last = time.monotonic()
+        while True:
+            while self._next_frame is not None:
+                yield self.read_next()
+
+            if self.refresh():
+                last = time.monotonic()
+                continue
+
+            if timeout is not None and time.monotonic() - last >= timeout:
+                return
+            time.sleep(interval)
+
+    @property
+    def next_frame(self) -> int | None:
+        """Get index of next frame to be read, or None if at file end."""
+        return self._next_frame
 
     def _go_to_frame(self, frame: int) -> None:
-        """Set file pointer to given index."""
-        ind = self._get_index(frame)
-        self._handle.file.seek(ind)
-        self._handle._lineno = self._start_line + (frame * self._frame_lines)
+        """Set file pointer to start of given frame."""
+        self._handle.seek(self._offsets[frame])
+        self._handle._lineno = self._lines[frame]
         self._next_frame = frame if frame < len(self) else None
 
     def get_frame(self, frame: int) -> MDGeomTimestepInfo:
@@ -113,17 +685,141 @@ While iteration should work, extracting particular frames may not.
         ------
         IndexError
             Requested frame out of range.
+        """  # noqa: DOC502
+        return self._get_frames([frame])[0]
+
+    def _frame_index(self, frame: int) -> int:
+        """Get positive index of frame.
+
+        Parameters
+        ----------
+        frame
+            Index of frame, negative from end.
+
+        Returns
+        -------
+        :
+            Index from start.
+
+        Raises
+        ------
+        IndexError
+            Frame out of range.
         """
         if frame not in range(-len(self), len(self)):
             raise IndexError(f"Cannot get {frame}th frame. File only has {len(self)} frames.")
 
-        if frame < 0:
-            frame = len(self) + frame
+        return frame if frame >= 0 else len(self) + frame
 
-        if frame != self.next_frame:
-            self._go_to_frame(frame)
+    def _get_frames(self, frames: Iterable[int]) -> list[MDGeomTimestepInfo]:
+        """Get frames from cache, or read them in a single pass through the file.
 
-        return self.read_next()
+        Parameters
+        ----------
+        frames
+            Frames to get.
+
+        Returns
+        -------
+        :
+            Parsed frames.
+        """
+        frames = [self._frame_index(frame) for frame in frames]
+
+        found = {}
+        for frame in dict.fromkeys(frames):
+            if (cached := self._cache.get(frame)) is not None:
+                found[frame] = cached
+
+        for frame, lines in self._read_frame_lines(sorted(set(frames) - found.keys())):
+            found[frame] = self._make_frame(lines)
+            self._cache.put(frame, found[frame], self._offsets[frame + 1] - self._offsets[frame])
+
+        if frames:
+            self._next_frame = frames[-1] + 1 if frames[-1] < len(self) - 1 else None
+        return [found[frame] for frame in frames]
+
+    def _read_frame_lines(self, frames: list[int]) -> Iterator[tuple[int, list[str]]]:
+        """Read lines of frames in order, reading nearby frames together.
+
+        Frames less than ``_COALESCE_BYTES`` apart are read at once, without
+        decoding the frames between them.
+
+        Parameters
+        ----------
+        frames
+            Frames to read, in ascending order.
+
+        Yields
+        ------
+        frame : int
+            Frame read.
+        lines : list[str]
+            Lines of frame.
+        """
+        encoding = self._handle.encoding
+        i = 0
+        while i < len(frames):
+            start = self._offsets[frames[i]]
+            j = i + 1
+            while j < len(frames) and self._offsets[frames[j] + 1] - start <= _COALESCE_BYTES:
+                j += 1
+
+            self._go_to_frame(frames[i])
+            data = self._handle.read_bytes(self._offsets[frames[j - 1] + 1] - start)
+            self._next_frame = frames[j - 1] + 1 if frames[j - 1] < len(self) - 1 else None
+
+            for frame in frames[i:j]:
+                text = data[self._offsets[frame] - start:self._offsets[frame + 1] - start]
+                yield frame, _split_lines(text, encoding)
+            i = j
+
+    def _frame_lines(self, frame: int) -> list[str]:
+        """Read lines of frame.
+
+        Parameters
+        ----------
+        frame
+            Frame to read.
+
+        Returns
+        -------
+        :
+            Lines of frame.
+        """
+        ((_, lines),) = self._read_frame_lines([frame])
+        return lines
+
+    def _make_frame(self, lines: list[str]) -> MDGeomTimestepInfo:
+        """Parse frame according to :attr:`fields` and :attr:`lazy`.
+
+        Parameters
+        ----------
+        lines
+            Lines of frame.
+
+        Returns
+        -------
+        :
+            Parsed (or lazy) frame.
+        """
+        if self.lazy:
+            return MDGeomFrame(lines, self.fields)
+        return parse_md_geom_frame(Block.from_iterable(lines), self.fields)
+
+    def cache_info(self) -> FrameCacheInfo:
+        """Get statistics of cache of parsed frames.
+
+        Returns
+        -------
+        :
+            Hits, misses and current size of cache.
+        """
+        return self._cache.info()
+
+    def cache_clear(self) -> None:
+        """Empty cache of parsed frames, and reset its statistics."""
+        self._cache.clear()
 
     def __len__(self) -> int:
         """Get number of frames in file.
@@ -133,7 +829,7 @@ While iteration should work, extracting particular frames may not.
         :
             Number of frames.
         """
-        return self._len
+        return len(self._offsets) - 1
 
     def __iter__(self) -> Generator[MDGeomTimestepInfo, int, None]:
         """Get generator over all frames in system.
@@ -165,11 +861,460 @@ While iteration should work, extracting particular frames may not.
         StopIteration
             No next frame.
         """
-        if not (block := Block.get_lines(self._handle, self._frame_lines, eof_possible=True)):
+        if (frame := self._next_frame) is None:
             raise StopIteration
 
-        self._next_frame = self._next_frame + 1 if self._next_frame < len(self) - 1 else None
-        return parse_md_geom_frame(block)
+        return self.get_frame(frame)
+
+    def _frame_chunks(self, indices: Iterable[int], chunksize: int) -> Iterator[_FrameChunk]:
+        """Group frames to be parsed in worker processes.
+
+        Parameters
+        ----------
+        indices
+            Frames to parse.
+        chunksize
+            Number of frames in each group.
+
+        Yields
+        ------
+        _FrameChunk
+            Group of frames.
+        """
+        path = str(self.file)
+        encoding = self._handle.encoding
+        stream = None if self._direct else open_compressed(self.file)
+
+        bounds = []
+        try:
+            for frame in indices:
+                frame = range(len(self))[frame]
+                bounds.append((self._offsets[frame], self._offsets[frame + 1]))
+                if len(bounds) == chunksize:
+                    yield self._frame_chunk(path, bounds, encoding, stream)
+                    bounds = []
+            if bounds:
+                yield self._frame_chunk(path, bounds, encoding, stream)
+        finally:
+            if stream is not None:
+                stream.close()
+
+    @staticmethod
+    def _frame_chunk(
+        path: str,
+        bounds: list[tuple[int, int]],
+        encoding: str,
+        stream: BinaryIO | None,
+    ) -> _FrameChunk:
+        """Make group of frames, reading data if workers cannot.
+
+        Parameters
+        ----------
+        path
+            File to parse.
+        bounds
+            Offsets of start and end of each frame.
+        encoding
+            Encoding of file.
+        stream
+            Open (decompressed) file to read data from, ``None`` if workers read
+            directly.
+
+        Returns
+        -------
+        :
+            Group of frames.
+        """
+        data = None
+        if stream is not None:
+            data = []
+            for start, end in bounds:
+                stream.seek(start)
+                data.append(stream.read(end - start))
+            data = tuple(data)
+        return _FrameChunk(path, tuple(bounds), encoding, data)
+
+    def map(
+        self,
+        func: Callable[[MDGeomTimestepInfo], Any] | None,
+        frames: slice | Iterable[int] = slice(None),
+        *,
+        workers: int | None = None,
+        chunksize: int = 64,
+    ) -> Iterator[Any]:
+        """
+        Parse frames, and apply a function to each, in parallel.
+
+        Parameters
+        ----------
+        func
+            Function to apply to each parsed frame in the worker process, must be
+            picklable. ``None`` to return parsed frames.
+        frames
+            Frames to parse, default all.
+        workers
+            Number of worker processes, default number of CPUs.
+        chunksize
+            Number of frames sent to a worker at once.
+
+        Yields
+        ------
+        Any
+            Result of each frame, in order of `frames`.
+
+        Notes
+        -----
+        Each worker opens the file itself and reads frames by offset. Frames
+        of compressed files are instead read (and decompressed) by this process.
+        Frames are always parsed whole (limited to :attr:`fields`), even if
+        :attr:`lazy`.
+        Only a few chunks per worker are parsed ahead of those consumed.
+        """
+        workers = workers or os.cpu_count() or 1
+        indices = range(len(self))[frames] if isinstance(frames, slice) else frames
+
+        pending: deque[Future] = deque()
+        with ProcessPoolExecutor(workers) as pool:
+            try:
+                for chunk in self._frame_chunks(indices, chunksize):
+                    pending.append(pool.submit(_parse_frame_chunk, chunk, func, self.fields))
+                    if len(pending) > 2 * workers:
+                        yield from pending.popleft().result()
+
+                while pending:
+                    yield from pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def iter_parallel(
+        self,
+        frames: slice | Iterable[int] = slice(None),
+        *,
+        workers: int | None = None,
+        chunksize: int = 64,
+    ) -> Iterator[MDGeomTimestepInfo]:
+        """
+        Parse frames in parallel.
+
+        Parameters
+        ----------
+        frames
+            Frames to parse, default all.
+        workers
+            Number of worker processes, default number of CPUs.
+        chunksize
+            Number of frames sent to a worker at once.
+
+        Returns
+        -------
+        :
+            Iterator of parsed frames, in order of `frames`.
+
+        See Also
+        --------
+        map : Apply function to parsed frames in parallel.
+        """
+        return self.map(None, frames, workers=workers, chunksize=chunksize)
+
+    @property
+    def ions(self) -> list[tuple[str, int]]:
+        """
+        Ions of first frame, in the order of per-ion arrays.
+
+        Returns
+        -------
+        :
+            Species and index of each ion.
+        """
+        return [(species, int(index))
+                for species, index, *_ in (line.split() for line in self._frame_lines(0)
+                                           if line.rstrip().endswith("<-- R"))]
+
+    @staticmethod
+    def _tag_values(lines: Sequence[str], tag: str | None) -> tuple[list[str], int]:
+        """
+        Get values of lines of a frame with a given tag.
+
+        Parameters
+        ----------
+        lines
+            Lines of frame.
+        tag
+            Tag of lines to read, or ``None`` for the time.
+
+        Returns
+        -------
+        list[str]
+            Values of all tagged lines.
+        int
+            Number of tagged lines.
+        """
+        if tag is None:
+            return lines[0].split(), 1
+
+        suffix = f"<-- {tag}"
+        first = 2 if tag in _ION_TAGS else 0
+        values = []
+        n_rows = 0
+        for line in lines:
+            if line.rstrip().endswith(suffix):
+                values += line.split()[first:-2]
+                n_rows += 1
+        return values, n_rows
+
+    @staticmethod
+    def _tag_shape(values: list[str], n_rows: int, tag: str | None) -> tuple[int, ...]:
+        """
+        Get shape of data of a frame with a given tag.
+
+        Parameters
+        ----------
+        values
+            Values of tagged lines.
+        n_rows
+            Number of tagged lines.
+        tag
+            Tag of lines.
+
+        Returns
+        -------
+        :
+            Shape of data of frame.
+        """
+        if tag in _ION_TAGS or n_rows > 1:
+            return (n_rows, len(values) // max(n_rows, 1))
+        return (len(values),) if len(values) > 1 else ()
+
+    def _tag_array(
+        self,
+        tag: str | None,
+        frames: slice | Iterable[int],
+        out: Path | str | None,
+    ) -> np.ndarray:
+        """
+        Extract data with a given tag from each frame.
+
+        Values are converted straight from the text of each frame,
+        without building the frame as a dict.
+
+        Parameters
+        ----------
+        tag
+            Tag of lines to read (e.g. ``"R"``), or ``None`` for the time.
+        frames
+            Frames to read.
+        out
+            ``.npy`` file to write the array to, and memory-map.
+
+        Returns
+        -------
+        :
+            Data of each frame, of shape ``(n_frames, ...)``.
+
+        Raises
+        ------
+        ValueError
+            Frames have different amounts of data, e.g. different numbers of ions.
+        """
+        np = _import_numpy()
+
+        indices = [self._frame_index(frame) for frame in
+                   (range(len(self))[frames] if isinstance(frames, slice) else frames)]
+
+        def allocate(shape: tuple[int, ...]) -> np.ndarray:
+            shape = (len(indices), *shape)
+            return (np.empty(shape) if out is None else
+                    np.lib.format.open_memmap(out, mode="w+", dtype=float, shape=shape))
+
+        data = None
+        if not indices:  # Shape of first frame, or documented shape if none
+            data = allocate(self._tag_shape(*self._tag_values(self._frame_lines(0), tag), tag)
+                            if len(self) else _EMPTY_SHAPES.get(tag, ()))
+
+        # Read in file order, filling in order requested
+        order = sorted(range(len(indices)), key=indices.__getitem__)
+        for i, (frame, lines) in zip(order, self._read_frame_lines([indices[i] for i in order]),
+                                     strict=True):
+            values, n_rows = self._tag_values(lines, tag)
+
+            if data is None:
+                data = allocate(self._tag_shape(values, n_rows, tag))
+
+            if len(values) != data[i].size:
+                raise ValueError(f"Frame {frame} has {len(values)} values tagged {tag}, "
+                                 f"expected {data[i].size}.")
+
+            data[i] = np.array(values, dtype=float).reshape(data.shape[1:])
+
+        if out is not None:
+            data.flush()
+        return data
+
+    def positions(
+        self,
+        frames: slice | Iterable[int] = slice(None),
+        *,
+        out: Path | str | None = None,
+    ) -> np.ndarray:
+        """
+        Get positions of ions.
+
+        Parameters
+        ----------
+        frames
+            Frames to read, default all.
+        out
+            ``.npy`` file to write the array to, which is then memory-mapped.
+
+        Returns
+        -------
+        :
+            Positions (in file units, Bohr) of shape ``(n_frames, n_ions, 3)``,
+            ions are in the order of :attr:`ions`.
+
+        Notes
+        -----
+        Requires NumPy.
+        """
+        return self._tag_array("R", frames, out)
+
+    def velocities(
+        self,
+        frames: slice | Iterable[int] = slice(None),
+        *,
+        out: Path | str | None = None,
+    ) -> np.ndarray:
+        """
+        Get velocities of ions.
+
+        Parameters
+        ----------
+        frames
+            Frames to read, default all.
+        out
+            ``.npy`` file to write the array to, which is then memory-mapped.
+
+        Returns
+        -------
+        :
+            Velocities (in file units) of shape ``(n_frames, n_ions, 3)``,
+            ions are in the order of :attr:`ions`.
+
+        Notes
+        -----
+        Requires NumPy.
+        """
+        return self._tag_array("V", frames, out)
+
+    def forces(
+        self,
+        frames: slice | Iterable[int] = slice(None),
+        *,
+        out: Path | str | None = None,
+    ) -> np.ndarray:
+        """
+        Get forces on ions.
+
+        Parameters
+        ----------
+        frames
+            Frames to read, default all.
+        out
+            ``.npy`` file to write the array to, which is then memory-mapped.
+
+        Returns
+        -------
+        :
+            Forces (in file units) of shape ``(n_frames, n_ions, 3)``,
+            ions are in the order of :attr:`ions`.
+
+        Notes
+        -----
+        Requires NumPy.
+        """
+        return self._tag_array("F", frames, out)
+
+    def cells(self, frames: slice | Iterable[int] = slice(None)) -> np.ndarray:
+        """
+        Get lattice vectors.
+
+        Parameters
+        ----------
+        frames
+            Frames to read, default all.
+
+        Returns
+        -------
+        :
+            Lattice vectors (in file units, Bohr) of shape ``(n_frames, 3, 3)``.
+
+        Notes
+        -----
+        Requires NumPy.
+        """
+        return self._tag_array("h", frames, None)
+
+    def energies(self, frames: slice | Iterable[int] = slice(None)) -> np.ndarray:
+        """
+        Get energies.
+
+        Parameters
+        ----------
+        frames
+            Frames to read, default all.
+
+        Returns
+        -------
+        :
+            Total energy, hamiltonian and kinetic energy (in file units, Hartree)
+            of shape ``(n_frames, 3)``.
+
+        Notes
+        -----
+        Requires NumPy.
+        """
+        return self._tag_array("E", frames, None)
+
+    def temperatures(self, frames: slice | Iterable[int] = slice(None)) -> np.ndarray:
+        """
+        Get temperatures.
+
+        Parameters
+        ----------
+        frames
+            Frames to read, default all.
+
+        Returns
+        -------
+        :
+            Temperature (in file units) of shape ``(n_frames,)``.
+
+        Notes
+        -----
+        Requires NumPy.
+        """
+        return self._tag_array("T", frames, None)
+
+    def times(self, frames: slice | Iterable[int] = slice(None)) -> np.ndarray:
+        """
+        Get times.
+
+        Parameters
+        ----------
+        frames
+            Frames to read, default all.
+
+        Returns
+        -------
+        :
+            Time (in file units) of shape ``(n_frames,)``.
+
+        Notes
+        -----
+        Requires NumPy.
+        """
+        return self._tag_array(None, frames, None)
 
     @overload
     def __getitem__(self, frame: int) -> MDGeomTimestepInfo: ...
@@ -197,7 +1342,7 @@ While iteration should work, extracting particular frames may not.
 
     @__getitem__.register
     def _(self, frames: Iterable) -> list[MDGeomTimestepInfo]:
-        return [self.get_frame(frame) for frame in frames]
+        return self._get_frames(frames)
 
     @__getitem__.register
     def _(self, frames: slice) -> list[MDGeomTimestepInfo]:
@@ -212,5 +1357,5 @@ While iteration should work, extracting particular frames may not.
     def __str__(self) -> str:
         return f"""\
 File: {self.file}
-Frames: {self._len}
+Frames: {len(self)}
 Next frame: {self._next_frame}"""
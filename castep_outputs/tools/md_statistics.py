@@ -0,0 +1,360 @@
+"""
+Summary statistics of MD trajectories, computed in a single pass.
+
+Steps are reduced as they are parsed, so memory use does not grow with the
+length of the trajectory.
+
+Notes
+-----
+Values are in the units of the source, i.e. atomic units for .md/.geom
+files and the output units (eV, K, Ang) for .castep files.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable, Iterable, Mapping
+from pathlib import Path
+from typing import Any, TypedDict
+
+from castep_outputs.parsers.castep_file_parser import Filters, iter_castep_file
+from castep_outputs.tools.md_geom_parser import MDGeomParser
+from castep_outputs.utilities.compression import uncompressed_name
+
+#: Tags of .md/.geom lines needed for :func:`md_observables`.
+FIELDS = frozenset("ETPhF")
+
+#: Energies of .md/.geom ``E`` lines.
+_ENERGIES = ("potential_energy", "hamilt_energy", "kinetic_energy")
+
+#: Energies, temperature and pressure of .castep MD steps.
+_CASTEP_SCALARS = ("potential_energy", "kinetic_energy", "total_energy", "hamilt_energy",
+                   "temperature", "pressure")
+
+
+class StatisticsSummary(TypedDict):
+    """Summary statistics of a series."""
+
+    #: Number of values.
+    n: int
+    #: Mean.
+    mean: float
+    #: Sample variance.
+    variance: float
+    #: Sample standard deviation.
+    std: float
+    #: Minimum.
+    min: float
+    #: Maximum.
+    max: float
+    #: Standard error of mean estimated from means of blocks of values.
+    error: float
+    #: Number of complete blocks.
+    n_blocks: int
+
+
+class RunningStatistics:
+    """
+    Accumulate statistics of a series one value at a time.
+
+    Mean and variance are updated by Welford's algorithm. Values are also
+    averaged in consecutive blocks, the spread of which estimates the error
+    of the mean of correlated values.
+
+    Parameters
+    ----------
+    block_size
+        Number of values in each block, which should be longer than the
+        correlation time of the series.
+
+    Examples
+    --------
+    >>> stats = RunningStatistics(block_size=2)
+    >>> for value in (1., 2., 3., 4., 5.):
+    ...     stats.add(value)
+    >>> stats.n, stats.mean, stats.variance, stats.min, stats.max
+    (5, 3.0, 2.5, 1.0, 5.0)
+    >>> stats.n_blocks, stats.error
+    (2, 1.0)
+    """
+
+    def __init__(self, block_size: int = 100) -> None:
+        if block_size < 1:
+            raise ValueError(f"Block size must be positive, not {block_size}.")
+
+        self.block_size = block_size
+        self.n = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+        self._block_sum = 0.0
+        self._block_len = 0
+        self.n_blocks = 0
+        self._block_mean = 0.0
+        self._block_m2 = 0.0
+
+    def add(self, value: float) -> None:
+        """
+        Add value to series.
+
+        Parameters
+        ----------
+        value
+            Next value.
+        """
+        self.n += 1
+        delta = value - self.mean
+        self.mean += delta / self.n
+        self._m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+        self._block_sum += value
+        self._block_len += 1
+        if self._block_len == self.block_size:
+            block = self._block_sum / self.block_size
+            self.n_blocks += 1
+            delta = block - self._block_mean
+            self._block_mean += delta / self.n_blocks
+            self._block_m2 += delta * (block - self._block_mean)
+            self._block_sum = 0.0
+            self._block_len = 0
+
+    @property
+    def variance(self) -> float:
+        """
+        Sample variance of values.
+
+        Returns
+        -------
+        :
+            Variance, NaN if fewer than two values.
+        """
+        return self._m2 / (self.n - 1) if self.n > 1 else math.nan
+
+    @property
+    def std(self) -> float:
+        """
+        Sample standard deviation of values.
+
+        Returns
+        -------
+        :
+            Standard deviation, NaN if fewer than two values.
+        """
+        return math.sqrt(self.variance)
+
+    @property
+    def error(self) -> float:
+        """
+        Standard error of mean from means of complete blocks.
+
+        Returns
+        -------
+        :
+            Error, NaN if fewer than two complete blocks.
+        """
+        if self.n_blocks < 2:
+            return math.nan
+        return math.sqrt(self._block_m2 / (self.n_blocks - 1) / self.n_blocks)
+
+    def summary(self) -> StatisticsSummary:
+        """
+        Get statistics of values added so far.
+
+        Returns
+        -------
+        :
+            Summary statistics.
+        """
+        return {
+            "n": self.n,
+            "mean": self.mean,
+            "variance": self.variance,
+            "std": self.std,
+            "min": self.min,
+            "max": self.max,
+            "error": self.error,
+            "n_blocks": self.n_blocks,
+        }
+
+
+def _mean_force(forces: Mapping[tuple[str, int], Iterable[float]]) -> dict[str, float]:
+    """
+    Average magnitude of force on ions of each species.
+
+    Parameters
+    ----------
+    forces
+        Force on each ion.
+
+    Returns
+    -------
+    :
+        Mean force of each species, keyed as ``"force_<species>"``.
+
+    Examples
+    --------
+    >>> _mean_force({("Si", 1): (3., 4., 0.), ("Si", 2): (0., 0., 1.), ("O", 1): (0., 2., 0.)})
+    {'force_Si': 3.0, 'force_O': 2.0}
+    """
+    totals: dict[str, list[float]] = {}
+    for (species, _), force in forces.items():
+        total = totals.setdefault(f"force_{species}", [0.0, 0])
+        total[0] += math.hypot(*force)
+        total[1] += 1
+    return {key: total / count for key, (total, count) in totals.items()}
+
+
+def md_observables(step: Mapping[str, Any]) -> dict[str, float]:
+    """
+    Get energies, temperature, pressure, cell volume and forces of an MD step.
+
+    Parameters
+    ----------
+    step
+        Frame of a .md/.geom file or MD step of a .castep file.
+
+    Returns
+    -------
+    :
+        Values present in `step` of ``potential_energy``, ``hamilt_energy``,
+        ``kinetic_energy``, ``total_energy`` (.castep only), ``temperature``,
+        ``pressure``, ``volume`` and mean magnitude of the force on ions of each
+        species (``force_<species>``).
+    """
+    values = {}
+
+    if "hamilt_energy" in step:  # .castep
+        values.update((key, step[key]) for key in _CASTEP_SCALARS if key in step)
+        if "volume" in (cell := step.get("cell", {})):
+            values["volume"] = cell["volume"]
+        if forces := step.get("forces"):
+            forces = forces.get("non_descript") or next(iter(forces.values()))
+            values.update(_mean_force(forces[-1]))
+        return values
+
+    if "E" in step:
+        values.update(zip(_ENERGIES, step["E"][0], strict=False))
+    if "T" in step:
+        values["temperature"] = step["T"][0][0]
+    if "P" in step:
+        values["pressure"] = step["P"][0][0]
+    if "h" in step:
+        (a, b, c), (d, e, f), (g, h, i) = step["h"]
+        values["volume"] = abs(a * (e * i - f * h) - b * (d * i - f * g) + c * (d * h - e * g))
+    if ions := step.get("ions"):
+        values.update(_mean_force({ion: props["F"] for ion, props in ions.items()
+                                   if "F" in props}))
+    return values
+
+
+class MDStatistics:
+    """
+    Reduce MD steps to summary statistics of their observables.
+
+    Parameters
+    ----------
+    block_size
+        Number of steps in each block averaged to estimate errors.
+    observables
+        Function getting values to summarise from each step.
+
+    See Also
+    --------
+    md_statistics : Summarise a whole trajectory.
+
+    Examples
+    --------
+    >>> reducer = MDStatistics(block_size=1)
+    >>> for temperature in (300., 310.):
+    ...     reducer.update({"T": [[temperature]]})
+    >>> reducer.summary()["temperature"]["mean"]
+    305.0
+    """
+
+    def __init__(
+        self,
+        block_size: int = 100,
+        observables: Callable[[Mapping[str, Any]], Mapping[str, float]] = md_observables,
+    ) -> None:
+        self.block_size = block_size
+        self.observables = observables
+        self.statistics: dict[str, RunningStatistics] = {}
+
+    def update(self, step: Mapping[str, Any]) -> None:
+        """
+        Add observables of step.
+
+        Parameters
+        ----------
+        step
+            Next step.
+        """
+        for name, value in self.observables(step).items():
+            if (stats := self.statistics.get(name)) is None:
+                stats = self.statistics[name] = RunningStatistics(self.block_size)
+            stats.add(value)
+
+    def summary(self) -> dict[str, StatisticsSummary]:
+        """
+        Get statistics of steps added so far.
+
+        Returns
+        -------
+        :
+            Summary statistics of each observable.
+        """
+        return {name: stats.summary() for name, stats in self.statistics.items()}
+
+
+def md_statistics(
+    source: Path | str | Iterable[Mapping[str, Any]],
+    *,
+    block_size: int = 100,
+) -> dict[str, StatisticsSummary]:
+    """
+    Summarise an MD trajectory without holding it in memory.
+
+    Parameters
+    ----------
+    source
+        .md/.geom or .castep file (possibly compressed), or steps, e.g. an
+        :class:`~castep_outputs.tools.md_geom_parser.MDGeomParser` or
+        :func:`~castep_outputs.parsers.md_geom_file_parser.iter_md_geom_file`.
+    block_size
+        Number of steps in each block averaged to estimate errors.
+
+    Returns
+    -------
+    :
+        Summary statistics of each of :func:`md_observables`.
+
+    Notes
+    -----
+    Steps of all runs of a .castep file are included. Only the lines of
+    .md/.geom files in :data:`FIELDS` are parsed, so steps given as an
+    :class:`~castep_outputs.tools.md_geom_parser.MDGeomParser` are best
+    opened with ``fields=FIELDS``.
+
+    Examples
+    --------
+    .. code-block:: python
+
+       stats = md_statistics("seedname.md", block_size=1000)
+       print(stats["temperature"]["mean"], stats["temperature"]["error"])
+    """
+    if isinstance(source, (str, Path)):
+        path = Path(source)
+        if uncompressed_name(path).suffix == ".castep":
+            source = (step for event in iter_castep_file(path, Filters.MD, keys=("md",))
+                      for step in event.value)
+        else:
+            source = MDGeomParser(path, fields=FIELDS)
+
+    reducer = MDStatistics(block_size)
+    for step in source:
+        reducer.update(step)
+    return reducer.summary()
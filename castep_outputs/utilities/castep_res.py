@@ -5,6 +5,7 @@ from __future__ import annotations
 import itertools
 import re
 from collections.abc import Sequence
+from typing import NamedTuple
 
 from .constants import FST_D, MINIMISERS, SHELLS, SND_D
 
@@ -641,3 +642,299 @@ ELASTIC_INTERNAL_STRAIN_RE = re.compile(
     r"(?P<dir>[XYZ])\s+"
     f"{labelled_floats(SND_D)}",
 )
+
+
+class SectionRE(NamedTuple):
+    """Precompiled bounds of a section of a file."""
+
+    #: RegEx searched in line to see if is start of section.
+    start: re.Pattern
+    #: RegEx to verify if section has ended or ``None`` if section is a single line.
+    end: re.Pattern | None = None
+
+    @classmethod
+    def from_bounds(cls, start: Pattern, end: Pattern | None = None) -> SectionRE:
+        r"""
+        Compile the bounds of a section.
+
+        Parameters
+        ----------
+        start
+            RegEx searched in line to see if is start of section.
+        end
+            RegEx to verify if section has ended or ``None`` if section is a single line.
+
+        Returns
+        -------
+        :
+            Compiled section bounds.
+
+        Examples
+        --------
+        >>> bounds = SectionRE.from_bounds("Unit Cell", EMPTY)
+        >>> bounds.start.pattern, bounds.end.pattern
+        ('Unit Cell', '^\\s*$')
+        """
+        return cls(re.compile(start), re.compile(end) if end is not None else None)
+
+
+#: Bounds of sections of .castep files.
+#:
+#: Top-level sections are keyed by their name, sub-sections
+#: by ``"<section>.<sub-section>"``.
+#:
+#: :meta hide-value:
+CASTEP_SECTION_RES: dict[str, SectionRE] = {
+    # System info
+    "build_info": SectionRE.from_bounds(r"^\s*Compiled for", EMPTY),
+    "time_started": SectionRE.from_bounds("Run started"),
+    "finalisation": SectionRE.from_bounds("Initialisation time", f"{EMPTY}|<"),
+    "parallel_efficiency": SectionRE.from_bounds("^Overall parallel efficiency rating"),
+    "continuation": SectionRE.from_bounds("^Reading continuation data"),
+    "warning_block": SectionRE.from_bounds(gen_table_re("", r"\?+"), gen_table_re("", r"\?+")),
+    "warning": SectionRE.from_bounds(
+        re.compile(r"^(?:\s*[^:]+:)?(\s*)warning", re.IGNORECASE),
+    ),
+    "memory_estimate": SectionRE.from_bounds(
+        gen_table_re(r"MEMORY AND SCRATCH[\w\s]+", "[+-]+"),
+        gen_table_re("", "[+-]+"),
+    ),
+    # Parameters
+    "title": SectionRE.from_bounds(gen_table_re("Title", r"\*+")),
+    "options": SectionRE.from_bounds(
+        gen_table_re("[^*]+ Parameters", r"\*+"),
+        gen_table_re("", r"\*+"),
+    ),
+    "options.devel_code": SectionRE.from_bounds("Developer Code", gen_table_re("", r"\*+")),
+    # Species properties
+    "quantisation_axis": SectionRE.from_bounds("Quantisation axis"),
+    "ps_energy": SectionRE.from_bounds(PS_SHELL_RE, EMPTY),
+    "mass": SectionRE.from_bounds("Mass of species in AMU", EMPTY),
+    "electric_quadrupole_moment": SectionRE.from_bounds(
+        "Electric Quadrupole Moment",
+        rf"({EMPTY}|^\s*x+$)",
+    ),
+    "pseudopots": SectionRE.from_bounds("Files used for pseudopotentials", EMPTY),
+    "pspot_detail": SectionRE.from_bounds(
+        gen_table_re("Pseudopotential Report[^|]+", r"\|"),
+        gen_table_re("", "=+"),
+    ),
+    "pspot_debug": SectionRE.from_bounds(
+        r"^\s*(?P<type>AE|PS) eigenvalue nl (?P<nl>\d+) =" + labelled_floats(("eigenvalue",)),
+    ),
+    "pair_params": SectionRE.from_bounds(
+        gen_table_re("PairParams", r"\*+", pre=r"\w*"),
+        EMPTY,
+    ),
+    "pair_params.two_body": SectionRE.from_bounds("Two Body", r"^\w*\s*\*+\s*$"),
+    "pair_params.three_body": SectionRE.from_bounds("Three Body", r"^\s*\*+\s*$"),
+    "dftd": SectionRE.from_bounds("DFT-D parameters", r"^\s*$"),
+    # SCF
+    "scf": SectionRE.from_bounds("SCF loop", "^-+ <-- SCF"),
+    "wvfn_line_min": SectionRE.from_bounds(
+        gen_table_re("WAVEFUNCTION LINE MINIMISATION", "[+-]+", post="<- line"),
+        gen_table_re("", "[+-]+", post="<- line"),
+    ),
+    "occupancies": SectionRE.from_bounds(
+        gen_table_re("Occupancy", r"\|", post="<- occ", whole_line=False),
+        r"Have a nice day\.",
+    ),
+    "bsc": SectionRE.from_bounds(r" with +(\d) +cut-off energies."),
+    "bsc.scf": SectionRE.from_bounds("", "^-+ <-- SCF"),
+    # Energies
+    "final_energy": SectionRE.from_bounds("^Final energy"),
+    "final_basis_set_corrected": SectionRE.from_bounds(
+        "Total energy corrected for finite basis set",
+    ),
+    "est_0k": SectionRE.from_bounds(re.escape("0K energy (E-0.5TS)")),
+    "sedc_correction": SectionRE.from_bounds(r"^\(SEDC\) Total Energy"),
+    "dispersion_corrected": SectionRE.from_bounds("^Dispersion corrected final energy"),
+    "free_energy": SectionRE.from_bounds(
+        rf"^Final free energy \(E-TS\) += +({EXPFNUMBER_RE})",
+    ),
+    "solvation": SectionRE.from_bounds("^ Free energy of solvation"),
+    "spin": SectionRE.from_bounds(f"^(?:{INTEGRATED_SPIN_DENSITY_RE.pattern})"),
+    # Cell and positions
+    "initial_cell": SectionRE.from_bounds(gen_table_re("Unit Cell"), EMPTY),
+    "symmetries": SectionRE.from_bounds(
+        gen_table_re("Symmetry and Constraints"),
+        "Cell constraints are",
+    ),
+    "symmetries.ionic_constraints": SectionRE.from_bounds(
+        r"constraints\.{5}",
+        r"\s*x+\.{4}\s*",
+    ),
+    "tss": SectionRE.from_bounds(gen_table_re("(Reactant|Product)", "x"), gen_table_re("", "x+")),
+    "labelled_positions": SectionRE.from_bounds(
+        r"Fractional coordinates of atoms\s+User-defined",
+        gen_table_re("", "x+"),
+    ),
+    "mixture_positions": SectionRE.from_bounds(
+        r"Mixture\s+Fractional coordinates of atoms",
+        gen_table_re("", "x+"),
+    ),
+    "initial_positions": SectionRE.from_bounds(
+        "Fractional coordinates of atoms",
+        gen_table_re("", "x+"),
+    ),
+    "supercell": SectionRE.from_bounds("Supercell generated"),
+    "initial_velocities": SectionRE.from_bounds(
+        "User Supplied Ionic Velocities",
+        gen_table_re("", "x+"),
+    ),
+    "initial_spins": SectionRE.from_bounds("Initial magnetic", gen_table_re("", "x+")),
+    "target_stress": SectionRE.from_bounds("External pressure/stress", ""),
+    "dedlne": SectionRE.from_bounds(rf"finite basis dEtot\/dlog\(Ecut\) = +({FNUMBER_RE})"),
+    "kpoints": SectionRE.from_bounds("k-Points For BZ Sampling", EMPTY),
+    "kpoints_list": SectionRE.from_bounds(
+        gen_table_re("Number +Fractional coordinates +Weight", r"\+"),
+        gen_table_re("", r"\++"),
+    ),
+    "applied_field": SectionRE.from_bounds("Applied Electric Field"),
+    # Forces and stresses
+    "forces": SectionRE.from_bounds(FORCES_BLOCK_RE, r"^\s*\*+$"),
+    "com_force_removal": SectionRE.from_bounds(
+        "firstd_calculate: removing force on centre of mass",
+        r"^\s*$",
+    ),
+    "stresses": SectionRE.from_bounds(STRESSES_BLOCK_RE, r"^\s*\*+$"),
+    # Phonons and response
+    "phonons": SectionRE.from_bounds("Vibrational Frequencies", gen_table_re("", "=+")),
+    "phonon_symmetry_analysis": SectionRE.from_bounds("Phonon Symmetry Analysis", EMPTY),
+    "phonon_symmetry_analysis.character_table": SectionRE.from_bounds(
+        r"Rep\s+Mul",
+        gen_table_re("[-=]+", r"\+"),
+    ),
+    "dynamical_matrix": SectionRE.from_bounds(
+        gen_table_re("Dynamical matrix"),
+        gen_table_re("", "-+"),
+    ),
+    "raman": SectionRE.from_bounds(
+        gen_table_re("Raman Susceptibility Tensors[^+]*", r"\+"),
+        EMPTY,
+    ),
+    "autosolvation": SectionRE.from_bounds(
+        gen_table_re("AUTOSOLVATION CALCULATION RESULTS", r"\*+"),
+        r"^\s*\*+\s*$",
+    ),
+    "optical_permittivity": SectionRE.from_bounds(r"^\s+Optical Permittivity", r"^ =+$"),
+    "optical_polarisability": SectionRE.from_bounds(r"^\s+Polarisabilit(y|ies)", r"^ =+$"),
+    "nlo": SectionRE.from_bounds(r"^\s+Nonlinear Optical Susceptibility", r"^ =+$"),
+    "atomic_displacements": SectionRE.from_bounds(
+        gen_table_re(r"Atomic Displacement Parameters \(A\*\*2\)"),
+        gen_table_re("", "-+"),
+    ),
+    "thermodynamics": SectionRE.from_bounds(gen_table_re("Thermodynamics"), gen_table_re("", "-+")),
+    # Population analysis
+    "mulliken_popn": SectionRE.from_bounds(
+        gen_table_re(r"Atomic Populations \(Mulliken\)"),
+        gen_table_re("", "=+"),
+    ),
+    "born": SectionRE.from_bounds(gen_table_re("Born Effective Charges"), gen_table_re("", "=+")),
+    "orbital_popn": SectionRE.from_bounds(
+        gen_table_re("Orbital Populations"),
+        gen_table_re("", "-+"),
+    ),
+    "bonds": SectionRE.from_bounds(
+        r"Bond\s+Population(?:\s+Spin)?\s+Length",
+        gen_table_re("", "=+"),
+    ),
+    "hirshfeld": SectionRE.from_bounds(gen_table_re("Hirshfeld Analysis"), gen_table_re("", "=+")),
+    "elf": SectionRE.from_bounds(gen_table_re("ELF grid sample"), gen_table_re("", "-+")),
+    # MD
+    "md": SectionRE.from_bounds("Starting MD iteration", "(finished MD iteration|Finished MD$)"),
+    "md_initial": SectionRE.from_bounds("Starting MD", gen_table_re("", "=+")),
+    "md_summary": SectionRE.from_bounds(gen_table_re("MD Data:", "x"), gen_table_re("", "x+")),
+    # GeomOpt
+    "final_configuration": SectionRE.from_bounds(
+        "Final Configuration",
+        rf"\s*{MINIMISERS_RE}\s*: Final",
+    ),
+    "final_configuration.cell": SectionRE.from_bounds(r"\s*Unit Cell\s*", EMPTY),
+    "final_configuration.atoms": SectionRE.from_bounds(
+        gen_table_re("Cell Contents"),
+        gen_table_re("", "x+"),
+    ),
+    "geom_iteration": SectionRE.from_bounds(
+        rf"Starting {MINIMISERS_RE} iteration\s*\d+\s*\.{{3}}",
+        rf"^=+$|^\s*Finished\s+{MINIMISERS_RE}\s*$",
+    ),
+    "enthalpy": SectionRE.from_bounds(
+        f"(?P<minim>{MINIMISERS_RE}): finished iteration\\s*\\d+\\s*with enthalpy",
+    ),
+    "trial": SectionRE.from_bounds(rf"trial guess \(lambda=\s*({EXPFNUMBER_RE})\)"),
+    "geom_opt_final": SectionRE.from_bounds(
+        re.compile(
+            rf"^\s*(?:{MINIMISERS_RE}):\s*"
+            r"(?P<key>Final [^=]+)=\s*"
+            f"(?P<value>{EXPFNUMBER_RE}).*",
+            re.IGNORECASE,
+        ),
+    ),
+    "minimisation": SectionRE.from_bounds(f"<--( min)? {MINIMISERS_RE}$", r"\+(?:-+\+){4,5}"),
+    "internal_constraints": SectionRE.from_bounds("INTERNAL CONSTRAINTS", EMPTY),
+    "deloc_table": SectionRE.from_bounds(
+        "Message: Generating deloc",
+        "Message: Generation of deloc",
+    ),
+    "deloc_act_space": SectionRE.from_bounds("The size of active space", EMPTY),
+    # Spectral
+    "tddft": SectionRE.from_bounds(
+        gen_table_re("TDDFT excitation energies", r"\+", post="TDDFT"),
+        gen_table_re("=+", r"\+", post="TDDFT"),
+    ),
+    "bs": SectionRE.from_bounds(
+        gen_table_re("(B A N D|Band Structure Calculation)[^+]+", r"\+"),
+        gen_table_re("", "=+"),
+    ),
+    "molecular_dipole": SectionRE.from_bounds(
+        gen_table_re("D I P O L E   O F   M O L E C U L E   I N   S U P E R C E L L", r"\+"),
+        gen_table_re("", "=+"),
+    ),
+    # Magres
+    "chemical_shielding": SectionRE.from_bounds(
+        gen_table_re("Chemical Shielding Tensor", r"\|"),
+        gen_table_re("", "=+"),
+    ),
+    "chemical_shielding_efg": SectionRE.from_bounds(
+        gen_table_re("Chemical Shielding and Electric Field Gradient Tensors", r"\|"),
+        gen_table_re("", "=+"),
+    ),
+    "efg": SectionRE.from_bounds(
+        gen_table_re("Electric Field Gradient Tensor", r"\|"),
+        gen_table_re("", "=+"),
+    ),
+    "j_coupling": SectionRE.from_bounds(
+        gen_table_re("(?:I|Ani)sotropic J-coupling", r"\|"),
+        gen_table_re("", "=+"),
+    ),
+    "hyperfine": SectionRE.from_bounds(
+        gen_table_re("Hyperfine Tensor", r"\|"),
+        gen_table_re("", "=+"),
+    ),
+    # Elastic
+    "elastic_constants": SectionRE.from_bounds(
+        gen_table_re(r"Elastic Constants Tensor \(GPa\)"),
+        gen_table_re("", "=+"),
+    ),
+    "compliance_matrix": SectionRE.from_bounds(
+        gen_table_re(r"Compliance Matrix \(GPa\^-1\)"),
+        gen_table_re("", "=+"),
+    ),
+    "elastic_contribution": SectionRE.from_bounds("Contribution ::", EMPTY),
+    "elastic_properties": SectionRE.from_bounds(
+        gen_table_re("Elastic Properties"),
+        gen_table_re("", "=+"),
+    ),
+    "elastic_properties.speed_of_sound": SectionRE.from_bounds("Speed of Sound", EMPTY),
+    # Berry phase
+    "berry_phase_verbose": SectionRE.from_bounds(
+        r"^\s*Ionic contribution to polarisation",
+        "=+",
+    ),
+    "berry_phase": SectionRE.from_bounds(r"^\s*Polarisation", "=+"),
+    "berry_phase.table": SectionRE.from_bounds(POL_HEADER_RE, "=+"),
+    # Misc
+    "delta_scf": SectionRE.from_bounds("Calculating MODOS weights", r"^\s*$"),
+    # External files are bounded by the parsers available for them (see castep_file_parser)
+}
@@ -0,0 +1,474 @@
+"""Transparent decompression of compressed outputs."""
+
+from __future__ import annotations
+
+import bz2
+import gzip
+import io
+import lzma
+import zlib
+from bisect import bisect_right
+from contextlib import suppress
+from typing import TYPE_CHECKING, BinaryIO
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_ZSTD_TYPE = None
+
+with suppress(ImportError):
+    import zstandard
+    _ZSTD_TYPE = "zstandard"
+
+with suppress(ImportError):
+    from compression import zstd  # Python >= 3.14
+    _ZSTD_TYPE = "stdlib"
+
+
+#: Leading bytes identifying each compression format.
+MAGIC: dict[bytes, str] = {
+    b"\x1f\x8b": "gzip",
+    b"\xfd7zXZ\x00": "xz",
+    b"BZh": "bz2",
+    b"\x28\xb5\x2f\xfd": "zstd",
+}
+
+#: Openers of each compression format (except zstd, which is optional).
+_OPENERS = {"gzip": gzip.open, "xz": lzma.open, "bz2": bz2.open}
+
+#: Suffixes of compressed files.
+COMPRESSED_SUFFIXES = frozenset({".gz", ".xz", ".bz2", ".zst"})
+
+
+def _peek(file: BinaryIO, size: int) -> bytes:
+    """
+    Read leading bytes of `file` without moving it.
+
+    Parameters
+    ----------
+    file
+        File to read.
+    size
+        Number of bytes to read.
+
+    Returns
+    -------
+    :
+        Up to `size` bytes, empty if `file` cannot be peeked.
+    """
+    if hasattr(file, "peek"):
+        return file.peek(size)[:size]
+
+    if not file.seekable():
+        return b""
+
+    pos = file.tell()
+    head = file.read(size)
+    file.seek(pos)
+    return head
+
+
+def detect_compression(file: BinaryIO) -> str | None:
+    """
+    Identify compression of a file from its leading bytes.
+
+    Parameters
+    ----------
+    file
+        File to check, opened in binary mode.
+
+    Returns
+    -------
+    :
+        Compression format (a value of :data:`MAGIC`) or ``None`` if uncompressed.
+
+    Examples
+    --------
+    >>> import gzip
+    >>> from io import BytesIO
+    >>> detect_compression(BytesIO(gzip.compress(b"Hello")))
+    'gzip'
+    >>> print(detect_compression(BytesIO(b"Hello")))
+    None
+    """
+    head = _peek(file, max(map(len, MAGIC)))
+    return next((fmt for magic, fmt in MAGIC.items() if head.startswith(magic)), None)
+
+
+def _check_zstd() -> None:
+    """
+    Check zstd decompression is available.
+
+    Raises
+    ------
+    ImportError
+        Neither :mod:`compression.zstd` nor :mod:`zstandard` is available.
+    """
+    if _ZSTD_TYPE is None:
+        raise ImportError("Reading zstd compressed files requires Python >= 3.14 or zstandard.")
+
+
+def decompress_stream(file: BinaryIO) -> BinaryIO:
+    """
+    Wrap an open file to be decompressed as it is read, if compressed.
+
+    Parameters
+    ----------
+    file
+        File to wrap, opened in binary mode.
+
+    Returns
+    -------
+    :
+        Decompressing stream or `file` if uncompressed.
+
+    Notes
+    -----
+    Closing the stream does not close `file`.
+
+    Examples
+    --------
+    >>> import lzma
+    >>> from io import BytesIO
+    >>> decompress_stream(BytesIO(lzma.compress(b"Hello"))).read()
+    b'Hello'
+    """
+    fmt = detect_compression(file)
+    if fmt == "gzip":
+        return gzip.GzipFile(fileobj=file, mode="rb")
+    if fmt == "xz":
+        return lzma.LZMAFile(file)
+    if fmt == "bz2":
+        return bz2.BZ2File(file)
+    if fmt == "zstd":
+        _check_zstd()
+        if _ZSTD_TYPE == "stdlib":
+            return zstd.ZstdFile(file)
+        return zstandard.ZstdDecompressor().stream_reader(file, closefd=False)
+    return file
+
+
+class IndexedGzipFile(io.BufferedIOBase):
+    r"""
+    Gzip file with random access through checkpoints of decompressor state.
+
+    As the file is read, a copy of the decompressor is stored every
+    `spacing` bytes of decompressed data. Seeking restarts from the nearest
+    preceding checkpoint, so returning to any offset already passed costs at
+    most `spacing` bytes of decompression rather than decompressing from the
+    start of the file.
+
+    Parameters
+    ----------
+    file
+        Gzip compressed file (possibly of several members), opened in
+        binary mode. Closed when this file is closed.
+    spacing
+        Decompressed bytes between checkpoints.
+    chunk_size
+        Compressed bytes to read at once.
+
+    Notes
+    -----
+    Checkpoints are held in memory (around 50 kiB each), as :mod:`zlib` cannot
+    export a decompressor's state. Seeking from the end (e.g. to find the
+    length) decompresses, and so indexes, the whole file.
+
+    Examples
+    --------
+    >>> import gzip
+    >>> from io import BytesIO
+    >>> x = IndexedGzipFile(BytesIO(gzip.compress(b"0123456789" * 10)), spacing=10)
+    >>> x.seek(95)
+    95
+    >>> x.read(3)
+    b'567'
+    >>> x.seek(12), x.read(3)
+    (12, b'234')
+    """
+
+    def __init__(self, file: BinaryIO, spacing: int = 1 << 22, chunk_size: int = 1 << 16) -> None:
+        self._file = file
+        self._spacing = spacing
+        self._chunk_size = chunk_size
+
+        self._decomp = zlib.decompressobj(wbits=31)
+        self._input = b""  # Compressed data read but not yet decompressed
+        self._cpos = 0  # Offset of `_input` in compressed file
+        self._pos = 0
+        self._size: int | None = None
+
+        # Decompressed offset, and compressed offset and decompressor of each checkpoint
+        self._offsets = [0]
+        self._checkpoints = [(0, self._decomp.copy())]
+
+    @property
+    def name(self) -> str:
+        """
+        Name of underlying file.
+
+        Returns
+        -------
+        :
+            Name if name is known otherwise "unknown".
+        """
+        return getattr(self._file, "name", "unknown")
+
+    @property
+    def n_checkpoints(self) -> int:
+        """
+        Number of checkpoints stored.
+
+        Returns
+        -------
+        :
+            Number of points which can be restarted from.
+        """
+        return len(self._offsets)
+
+    def readable(self) -> bool:  # noqa: PLR6301
+        """
+        Whether file can be read.
+
+        Returns
+        -------
+        :
+            Always ``True``.
+        """
+        return True
+
+    def seekable(self) -> bool:  # noqa: PLR6301
+        """
+        Whether file supports random access.
+
+        Returns
+        -------
+        :
+            Always ``True``.
+        """
+        return True
+
+    def fileno(self) -> int:
+        """
+        File descriptor of underlying (compressed) file.
+
+        Returns
+        -------
+        :
+            File descriptor.
+        """
+        return self._file.fileno()
+
+    def tell(self) -> int:
+        """
+        Position into decompressed data.
+
+        Returns
+        -------
+        :
+            Position of file.
+        """
+        return self._pos
+
+    def close(self) -> None:
+        """Close underlying file."""
+        if not self.closed:
+            self._file.close()
+        super().close()
+
+    def _decompress(self, size: int) -> bytes:
+        """
+        Decompress up to `size` bytes from the current position.
+
+        Parameters
+        ----------
+        size
+            Maximum number of bytes to return.
+
+        Returns
+        -------
+        :
+            Decompressed data, empty at end of file.
+
+        Raises
+        ------
+        EOFError
+            File ends before end of compressed data.
+        """
+        while True:
+            if not self._input:
+                self._input = self._file.read(self._chunk_size)
+                if not self._input:
+                    if not self._decomp.eof:
+                        raise EOFError("Compressed file ended before the "
+                                       "end-of-stream marker was reached")
+                    self._size = self._pos
+                    return b""
+
+            if self._decomp.eof:  # Start of next member, ignoring padding
+                stripped = self._input.lstrip(b"\0")
+                self._cpos += len(self._input) - len(stripped)
+                self._input = stripped
+                if not stripped:
+                    continue
+                self._decomp = zlib.decompressobj(wbits=31)
+
+            # Stop at next checkpoint if not yet indexed
+            next_checkpoint = self._offsets[-1] + self._spacing
+            if self._pos < next_checkpoint:
+                size = min(size, next_checkpoint - self._pos)
+
+            fed = self._input
+            data = self._decomp.decompress(fed, size)
+            self._input = (self._decomp.unused_data if self._decomp.eof
+                           else self._decomp.unconsumed_tail)
+            self._cpos += len(fed) - len(self._input)
+
+            if data:
+                self._pos += len(data)
+                if self._pos >= next_checkpoint:
+                    self._offsets.append(self._pos)
+                    self._checkpoints.append((self._cpos, self._decomp.copy()))
+                return data
+
+    def read(self, size: int | None = -1) -> bytes:
+        """
+        Read decompressed data.
+
+        Parameters
+        ----------
+        size
+            Number of bytes to read, negative or ``None`` to read to end of file.
+
+        Returns
+        -------
+        :
+            Data read, only shorter than `size` at end of file.
+        """
+        if size is None or size < 0:
+            size = float("inf")
+
+        chunks = []
+        while size > 0 and (data := self._decompress(min(size, 1 << 22))):
+            chunks.append(data)
+            size -= len(data)
+        return b"".join(chunks)
+
+    def read1(self, size: int = -1) -> bytes:
+        """
+        Read decompressed data, decompressing at most once.
+
+        Parameters
+        ----------
+        size
+            Maximum number of bytes to read, negative to read a chunk.
+
+        Returns
+        -------
+        :
+            Data read, empty at end of file.
+        """
+        if size == 0:
+            return b""
+        return self._decompress(size if size > 0 else 1 << 22)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """
+        Move to `offset`, restarting from the nearest checkpoint if needed.
+
+        Parameters
+        ----------
+        offset
+            Position in decompressed data.
+        whence
+            Reference of `offset` (see :meth:`io.IOBase.seek`).
+
+        Returns
+        -------
+        :
+            New position.
+        """
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            if self._size is None:
+                while self._decompress(1 << 22):
+                    pass
+            offset += self._size
+        offset = max(offset, 0)
+
+        i = bisect_right(self._offsets, offset) - 1
+        pos = self._offsets[i]
+        if offset < self._pos or pos > self._pos:
+            cpos, decomp = self._checkpoints[i]
+            self._file.seek(cpos)
+            self._cpos = cpos
+            self._input = b""
+            self._pos = pos
+            self._decomp = decomp.copy()
+
+        while self._pos < offset and self._decompress(min(offset - self._pos, 1 << 22)):
+            pass
+        return self._pos
+
+
+def open_compressed(path: Path) -> BinaryIO:
+    """
+    Open a file for binary reading, decompressing it if compressed.
+
+    Parameters
+    ----------
+    path
+        File to open.
+
+    Returns
+    -------
+    :
+        Open file, which closes the underlying file when closed.
+
+    Notes
+    -----
+    Compression is detected from the content rather than the name of the file.
+
+    Gzip compressed files are opened as an :class:`IndexedGzipFile`. Random
+    access (seeking backwards) in other compressed files is emulated by
+    decompressing from the start, and zstd compressed files can only be read
+    sequentially unless :mod:`compression.zstd` (Python >= 3.14) is available.
+    """
+    raw = path.open("rb")
+    if (fmt := detect_compression(raw)) is None:
+        return raw
+    if fmt == "gzip":
+        return IndexedGzipFile(raw)
+    raw.close()
+
+    if fmt != "zstd":
+        return _OPENERS[fmt](path, "rb")
+
+    _check_zstd()
+    return zstd.open(path, "rb") if _ZSTD_TYPE == "stdlib" else zstandard.open(path, "rb")
+
+
+def uncompressed_name(path: Path) -> Path:
+    """
+    Remove any compression suffix from a path.
+
+    Parameters
+    ----------
+    path
+        Path to strip.
+
+    Returns
+    -------
+    :
+        Path without a trailing suffix in :data:`COMPRESSED_SUFFIXES`.
+
+    Examples
+    --------
+    >>> from pathlib import Path
+    >>> uncompressed_name(Path("seed.castep.gz")).name
+    'seed.castep'
+    >>> uncompressed_name(Path("seed.castep")).name
+    'seed.castep'
+    """
+    return path.with_suffix("") if path.suffix in COMPRESSED_SUFFIXES else path
@@ -2,42 +2,87 @@
 
 from __future__ import annotations
 
+import os
 import re
+from collections import deque
+from contextlib import suppress
 from io import StringIO
-from typing import TYPE_CHECKING, NoReturn, TextIO, TypeVar, overload
+from typing import TYPE_CHECKING, BinaryIO, NoReturn, TextIO, TypeVar, overload
+
+from castep_outputs.utilities.compression import decompress_stream
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Sequence
+    from mmap import mmap
 
     from castep_outputs.utilities.castep_res import Pattern
 
 
-class FileWrapper:
+def _compiled(pattern: Pattern) -> re.Pattern:
+    """
+    Get compiled form of `pattern`.
+
+    Parameters
+    ----------
+    pattern
+        Pattern to compile.
+
+    Returns
+    -------
+    :
+        `pattern` if already compiled, else compiled `pattern`.
     """
+    return pattern if isinstance(pattern, re.Pattern) else re.compile(pattern)
+
+
+class FileWrapper:
+    r"""
     Convenience file wrapper to add rewind and line number capabilities.
 
+    Lines rewound are kept in a pushback buffer and returned again by
+    `next`, so the underlying file is never queried or moved while reading.
+
     Parameters
     ----------
     file
         File to wrap and control.
+    history
+        Number of lines which may be rewound.
+
+    Examples
+    --------
+    >>> from io import StringIO
+    >>> x = FileWrapper(StringIO("Hello\nThere\nFriend\n"), history=2)
+    >>> next(x), next(x), x.tell()
+    ('Hello\n', 'There\n', 12)
+    >>> x.rewind()
+    >>> x.rewind()
+    >>> x.lineno, x.tell()
+    (0, 0)
+    >>> next(x), x.lineno
+    ('Hello\n', 1)
     """
 
     Self = TypeVar("Self", bound="FileWrapper")
 
-    def __init__(self, file: TextIO) -> None:
+    def __init__(self, file: TextIO, history: int = 1) -> None:
         self._file = file
-        self._pos = 0
+        self._readline = file.readline
         self._lineno = 0
+        self._history: deque[str] = deque(maxlen=history)
+        self._pushback: list[str] = []
 
     def __iter__(self) -> Self:
         return self
 
     def __next__(self) -> str:
         self._lineno += 1
-        self._pos = self.file.tell()
-        nextline = self.file.readline()
-        if not nextline:
+        if self._pushback:
+            nextline = self._pushback.pop()
+        elif not (nextline := self._readline()):
+            self._history.clear()
             raise StopIteration
+        self._history.append(nextline)
         return nextline
 
     def rewind(self) -> None:
@@ -45,16 +90,54 @@ class FileWrapper:
         Rewind file to previous line.
 
         If iterated by `next` (or `for`) can rewind
-        one line.
+        up to ``history`` lines.
 
         Useful for blocks not terminated by a clear
         statement, where we can only check if next line
         does *NOT* match.
         """
-        if self.file.tell() == self._pos:
+        if not self._history:
             return
         self._lineno -= 1
-        self.file.seek(self._pos)
+        self._pushback.append(self._history.pop())
+
+    def seek(self, offset: int) -> None:
+        """
+        Move underlying file to `offset`, discarding any rewound lines.
+
+        Parameters
+        ----------
+        offset
+            Position (as from :meth:`tell`) of the start of a line.
+
+        Notes
+        -----
+        Line number is not updated.
+        """
+        self._history.clear()
+        self._pushback.clear()
+        self.file.seek(offset)
+
+    def _encoded_len(self, line: str) -> int:
+        """
+        Length of `line` as stored in the underlying file.
+
+        Parameters
+        ----------
+        line
+            Line read from file.
+
+        Returns
+        -------
+        :
+            Length in units of the underlying file's :meth:`tell`.
+        """
+        encoding = getattr(self.file, "encoding", None)
+        if encoding is None:  # e.g. StringIO, positions are characters
+            return len(line)
+        # Universal newlines translate "\r\n" to "\n"
+        crlf = getattr(self.file, "newlines", None) == "\r\n" and line.endswith("\n")
+        return len(line.encode(encoding)) + crlf
 
     @property
     def file(self) -> TextIO:
@@ -98,9 +181,9 @@ class FileWrapper:
         Returns
         -------
         :
-            Position of file.
+            Position of file, before any rewound lines.
         """
-        return self.file.tell()
+        return self.file.tell() - sum(map(self._encoded_len, self._pushback))
 
     def close(self) -> None:
         """Close wrapped file, and invalidate self."""
@@ -110,11 +193,339 @@ class FileWrapper:
         self.close()
 
 
+class MappedFileWrapper(FileWrapper):
+    r"""
+    File wrapper reading lines from a buffer of encoded bytes, e.g. a :class:`mmap.mmap`.
+
+    Lines are only decoded when read, so regions of the buffer may be
+    skipped with :meth:`seek` without being decoded or iterated.
+
+    Parameters
+    ----------
+    buffer
+        Encoded data of file.
+    name
+        Name of file.
+    encoding
+        Encoding of file.
+
+    Examples
+    --------
+    >>> x = MappedFileWrapper(b"Hello\r\nThere\nFriend\n")
+    >>> next(x)
+    'Hello\n'
+    >>> x.seek(13)
+    >>> next(x), x.lineno
+    ('Friend\n', 3)
+    """
+
+    def __init__(
+        self,
+        buffer: bytes | mmap,
+        name: str = "unknown",
+        encoding: str = "utf-8",
+    ) -> None:
+        self._file = buffer
+        self._name = name
+        self._encoding = encoding
+        self._lineno = 0
+        self._pos = self._offset = 0
+
+    def __next__(self) -> str:
+        self._lineno += 1
+        self._pos = self._offset
+        end = self.file.find(b"\n", self._offset) + 1 or len(self.file)
+        if end == self._offset:
+            raise StopIteration
+        self._offset = end
+        return self.file[self._pos:end].decode(self._encoding).replace("\r\n", "\n")
+
+    def rewind(self) -> None:
+        """
+        Rewind file to previous line.
+
+        If iterated by `next` (or `for`) can rewind
+        one line.
+        """
+        if self._offset == self._pos:
+            return
+        self._lineno -= 1
+        self._offset = self._pos
+
+    def seek(self, offset: int) -> None:
+        """
+        Move to `offset` without reading the lines skipped.
+
+        Parameters
+        ----------
+        offset
+            Position (in bytes) of the start of a line.
+        """
+        if offset >= self._offset:
+            self._lineno += self.file[self._offset:offset].count(b"\n")
+        else:
+            self._lineno -= self.file[offset:self._offset].count(b"\n")
+        self._pos = self._offset = offset
+
+    @property
+    def name(self) -> str:
+        """
+        Name of underlying file.
+
+        Returns
+        -------
+        :
+            Name of file.
+        """
+        return self._name
+
+    def tell(self) -> int:
+        """Position (in bytes) into file.
+
+        Returns
+        -------
+        :
+            Position of file.
+        """
+        return self._offset
+
+    def close(self) -> None:
+        """Close wrapped buffer if closeable."""
+        if hasattr(self.file, "close"):
+            self.file.close()
+
+
+class BufferedFileWrapper(FileWrapper):
+    r"""
+    File wrapper reading a binary file in large chunks.
+
+    Lines are found in the buffered bytes and each only decoded when read,
+    regions skipped with :meth:`seek` are never decoded. As for
+    :class:`MappedFileWrapper`, ``"\r\n"`` is translated to ``"\n"``.
+
+    Compressed files are detected and decompressed as they are read (see
+    :func:`~castep_outputs.utilities.compression.decompress_stream`).
+
+    Parameters
+    ----------
+    file
+        File to wrap, opened in binary mode.
+    encoding
+        Encoding of file.
+    errors
+        Handling of decoding errors (see :meth:`bytes.decode`).
+    history
+        Number of lines which may be rewound.
+    chunk_size
+        Number of bytes to read at once.
+    fadvise
+        Whether to advise the OS that the file will be read sequentially
+        (only where :func:`os.posix_fadvise` is available).
+
+    Examples
+    --------
+    >>> from io import BytesIO
+    >>> x = BufferedFileWrapper(BytesIO(b"Hello\r\nThere\nFriend\n"), chunk_size=4)
+    >>> next(x), next(x), x.tell()
+    ('Hello\n', 'There\n', 13)
+    >>> x.rewind()
+    >>> x.tell(), x.lineno
+    (7, 1)
+    """
+
+    def __init__(
+        self,
+        file: BinaryIO,
+        encoding: str = "utf-8",
+        errors: str = "strict",
+        history: int = 1,
+        chunk_size: int = 1 << 22,
+        *,
+        fadvise: bool = True,
+    ) -> None:
+        file = decompress_stream(file)
+        self._file = file
+        self._encoding = encoding
+        self._errors = errors
+        self._chunk_size = chunk_size
+        self._lineno = 0
+        self._starts: deque[int] = deque(maxlen=history)
+
+        self._buffer = b""
+        self._buffer_pos = file.tell()
+        self._offset = 0
+        self._cr = False
+
+        # Avoid allocating a full chunk for small files
+        self._read_size = chunk_size
+        with suppress(OSError, ValueError):  # e.g. in-memory file
+            remaining = os.fstat(file.fileno()).st_size - self._buffer_pos
+            self._read_size = max(min(chunk_size, remaining), 1)
+
+            if fadvise and hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+    def _fill(self) -> bool:
+        """
+        Append next chunk of file to buffer.
+
+        Lines already read are dropped, except those which may be rewound.
+
+        Returns
+        -------
+        :
+            Whether any data was read.
+        """
+        chunk = self._file.read(self._read_size)
+        self._read_size = self._chunk_size
+        if not chunk:
+            return False
+
+        keep = self._starts[0] if self._starts else self._offset
+        self._buffer = self._buffer[keep:] + chunk
+        self._buffer_pos += keep
+        self._offset -= keep
+        for i in range(len(self._starts)):
+            self._starts[i] -= keep
+        self._cr = self._cr or b"\r" in chunk
+        return True
+
+    def __next__(self) -> str:
+        self._lineno += 1
+        start = self._offset
+
+        while not (end := self._buffer.find(b"\n", start) + 1):
+            if not self._fill():
+                end = len(self._buffer)
+                break
+            start = self._offset
+
+        if end == self._offset:
+            self._starts.clear()
+            raise StopIteration
+
+        self._starts.append(self._offset)
+        nextline = self._buffer[self._offset:end].decode(self._encoding, self._errors)
+        self._offset = end
+        return nextline.replace("\r\n", "\n") if self._cr else nextline
+
+    def rewind(self) -> None:
+        """
+        Rewind file to previous line.
+
+        If iterated by `next` (or `for`) can rewind
+        up to ``history`` lines.
+        """
+        if not self._starts:
+            return
+        self._lineno -= 1
+        self._offset = self._starts.pop()
+
+    def seek(self, offset: int) -> None:
+        """
+        Move to `offset`, without rereading if within the buffer.
+
+        Parameters
+        ----------
+        offset
+            Position (in bytes) of the start of a line.
+
+        Notes
+        -----
+        Line number is not updated.
+        """
+        self._starts.clear()
+        if 0 <= offset - self._buffer_pos <= len(self._buffer):
+            self._offset = offset - self._buffer_pos
+            return
+
+        self._file.seek(offset)
+        self._buffer = b""
+        self._buffer_pos = offset
+        self._offset = 0
+
+    def read_bytes(self, size: int) -> bytes:
+        r"""
+        Read bytes from the current position, as from a binary file.
+
+        Parameters
+        ----------
+        size
+            Number of bytes to read.
+
+        Returns
+        -------
+        :
+            Undecoded data, only shorter than `size` at end of file.
+
+        Notes
+        -----
+        Line number is not updated and lines read before cannot be rewound.
+
+        Examples
+        --------
+        >>> from io import BytesIO
+        >>> x = BufferedFileWrapper(BytesIO(b"Hello\nThere\nFriend\n"), chunk_size=4)
+        >>> next(x), x.read_bytes(8), next(x)
+        ('Hello\n', b'There\nFr', 'iend\n')
+        """
+        self._starts.clear()
+        data = self._buffer[self._offset:self._offset + size]
+        self._offset += len(data)
+
+        if len(data) < size:
+            more = self._file.read(size - len(data))
+            self._buffer_pos += len(self._buffer) + len(more)
+            self._buffer = b""
+            self._offset = 0
+            data += more
+
+        return data
+
+    @property
+    def buffer(self) -> BinaryIO:
+        """
+        Binary file wrapped.
+
+        Returns
+        -------
+        :
+            Underlying binary file.
+        """
+        return self._file
+
+    @property
+    def encoding(self) -> str:
+        """
+        Encoding of file.
+
+        Returns
+        -------
+        :
+            Encoding used to decode lines.
+        """
+        return self._encoding
+
+    def tell(self) -> int:
+        """Position (in bytes) into file.
+
+        Returns
+        -------
+        :
+            Position of file, before any rewound lines.
+        """
+        return self._buffer_pos + self._offset
+
+
 class Block:
     """
     Data block class returned from :func:`get_block`.
 
     Emulates the properties of both a file, and sequence.
+
+    A block is a view of the lines ``[start, stop)`` of a line buffer.
+    Blocks read from another block share its buffer, so nesting blocks
+    or removing their bounds does not copy any lines.
     """
 
     Self = TypeVar("Self", bound="Block")
@@ -127,7 +538,67 @@ class Block:
 
         self._name = parent.name if hasattr(parent, "name") else "unknown"
         self._i = -1
-        self._data: tuple[str, ...] = ()
+        self._buffer: Sequence[str] = ()
+        self._start = 0
+        self._stop = 0
+
+    def _set_view(self, buffer: Sequence[str], start: int = 0, stop: int | None = None) -> None:
+        """
+        Make block a view of `buffer`.
+
+        Parameters
+        ----------
+        buffer
+            Lines to view.
+        start
+            First line of view.
+        stop
+            End of view (exclusive), defaults to end of `buffer`.
+        """
+        self._buffer = buffer
+        self._start = start
+        self._stop = len(buffer) if stop is None else stop
+
+    def _view_next(self, n_lines: int) -> tuple[Sequence[str], int, int]:
+        """
+        Advance up to `n_lines` lines, returning the view of those lines.
+
+        Parameters
+        ----------
+        n_lines
+            Number of lines to advance.
+
+        Returns
+        -------
+        buffer
+            Shared buffer.
+        start
+            Start of view.
+        stop
+            End of view.
+        """
+        start = min(self._start + self._i + 1, self._stop)
+        stop = min(start + n_lines, self._stop)
+        self._i = stop - self._start - 1
+        return self._buffer, start, stop
+
+    def _current(self, line: str) -> int | None:
+        """
+        Find `line` if it was the last line read from the block.
+
+        Parameters
+        ----------
+        line
+            Line to find.
+
+        Returns
+        -------
+        :
+            Index of `line` in buffer or ``None`` if not last read.
+        """
+        if 0 <= self._i < len(self) and self._buffer[self._start + self._i] is line:
+            return self._start + self._i
+        return None
 
     @classmethod
     def get_lines(
@@ -169,6 +640,14 @@ class Block:
         """
         block = cls(in_file)
 
+        if isinstance(in_file, Block):
+            # Line after block is consumed as when reading from file
+            buffer, start, stop = in_file._view_next(n_lines + 1)
+            if stop - start <= n_lines and not eof_possible:
+                raise OSError(f"Unexpected end of file in {in_file.name}.")
+            block._set_view(buffer, start, min(stop, start + n_lines))
+            return block
+
         data: list[str] = []
         for i, line in enumerate(in_file, 1):
             if i > n_lines:
@@ -180,7 +659,7 @@ class Block:
                     raise OSError(f"Unexpected end of file in {in_file.name}.")
                 raise OSError("Unexpected end of file.")
 
-        block._data = tuple(data)
+        block._set_view(data)
         return block
 
     @classmethod
@@ -225,20 +704,40 @@ class Block:
         Notes
         -----
         Advances `in_file` as it does so.
+
+        `start` and `end` should be precompiled when called in a loop,
+        string patterns are compiled on every call.
         """
         block = cls(in_file)
 
-        if not re.search(start, init_line):
+        if not _compiled(start).search(init_line):
             # Return empty block. (bool -> False)
             return block
 
+        end_search = _compiled(end).search
+
+        if isinstance(in_file, Block) and (first := in_file._current(init_line)) is not None:
+            found = 0
+            for line in in_file:
+                if end_search(line):
+                    found += 1
+                    if found == n_end:
+                        break
+            else:
+                if not eof_possible:
+                    raise OSError(f"Unexpected end of file in {in_file.name}.")
+
+            block._set_view(in_file._buffer, first, in_file._start + min(in_file._i + 1,
+                                                                         len(in_file)))
+            return block
+
         data: list[str] = []
         data.append(init_line)
 
         found = 0
         for line in in_file:
             data.append(line)
-            if re.search(end, line):
+            if end_search(line):
                 found += 1
                 if found == n_end:
                     break
@@ -248,7 +747,7 @@ class Block:
                     raise OSError(f"Unexpected end of file in {in_file.name}.")
                 raise OSError("Unexpected end of file.")
 
-        block._data = tuple(data)
+        block._set_view(data)
         return block
 
     @classmethod
@@ -279,7 +778,7 @@ class Block:
         'Hello\nThere'
         """
         block = cls(parent)
-        block._data = tuple(data)
+        block._set_view(tuple(data))
         return block
 
     def remove_bounds(self, /, fore: int = 1, back: int = 2) -> None:
@@ -297,7 +796,8 @@ class Block:
             Whether to strip trailing line from data.
         """
         self._lineno += fore
-        self._data = self._data[fore : -back if back else None]
+        self._start = min(self._start + fore, self._stop)
+        self._stop = max(self._stop - back, self._start)
 
     def asstringio(self) -> StringIO:
         """
@@ -319,7 +819,7 @@ class Block:
         :
             Block as list of lines.
         """
-        return list(self._data)
+        return list(self._buffer[self._start:self._stop])
 
     def rewind(self) -> None:
         """
@@ -341,29 +841,32 @@ class Block:
         self._i -= 1
 
     def __bool__(self) -> bool:
-        return any(map(str.strip, self._data))
+        return any(map(str.strip, self._buffer[self._start:self._stop]))
 
     def __str__(self) -> str:
-        return "\n".join(self._data)
+        return "\n".join(self._buffer[self._start:self._stop])
 
     def __iter__(self) -> Self:
         return self
 
     def __next__(self) -> str:
         self._i += 1
-        if self._i >= len(self):
+        if self._i >= self._stop - self._start:
             raise StopIteration
-        return self._data[self._i]
+        return self._buffer[self._start + self._i]
 
     def __len__(self) -> int:
-        return len(self._data)
+        return self._stop - self._start
 
     @overload
     def __getitem__(self, key: int) -> str: ...
     @overload
     def __getitem__(self, key: slice) -> tuple[str, ...]: ...
     def __getitem__(self, key):
-        return self._data[key]
+        view = range(self._start, self._stop)[key]
+        if isinstance(view, int):
+            return self._buffer[view]
+        return tuple(map(self._buffer.__getitem__, view))
 
     @property
     def name(self) -> str:
@@ -400,3 +903,76 @@ class Block:
             Block has no internal file holder.
         """
         raise NotImplementedError("Block has no internal file holder.")
+
+
+def skip_block(
+    init_line: str,
+    in_file: TextIO | FileWrapper | Block,
+    start: Pattern,
+    end: Pattern,
+    *,
+    n_end: int = 1,
+    eof_possible: bool = False,
+) -> bool:
+    r"""
+    Check if line is the start of a block and skip past the block if it is.
+
+    Equivalent to :meth:`Block.from_re`, but discards the block's lines
+    rather than storing them.
+
+    Parameters
+    ----------
+    init_line
+        Initial line which may start the block.
+    in_file
+        File handle to read data from.
+    start
+        RegEx matched against `init_line` to see if is start of block.
+    end
+        RegEx to verify if block has ended.
+    n_end
+        Number of times `end` must match before block is skipped.
+    eof_possible
+        Whether it is possible block is ended by EOF.
+
+    Returns
+    -------
+    :
+        Whether a block was skipped.
+
+    Raises
+    ------
+    OSError
+        If EOF reached and ``not eof_possible``.
+
+    Notes
+    -----
+    Advances `in_file` as it does so.
+
+    Examples
+    --------
+    >>> from io import StringIO
+    >>> x = FileWrapper(StringIO('Start\nSkipped\nEnd\nNext\n'))
+    >>> skip_block(next(x), x, "Start", "End")
+    True
+    >>> next(x)
+    'Next\n'
+    """
+    if not _compiled(start).search(init_line):
+        return False
+
+    end_search = _compiled(end).search
+
+    found = 0
+    for line in in_file:
+        if end_search(line):
+            found += 1
+            if found == n_end:
+                break
+    else:
+        if not eof_possible:
+            if hasattr(in_file, "name"):
+                raise OSError(f"Unexpected end of file in {in_file.name}.")
+            raise OSError("Unexpected end of file.")
+
+    return True
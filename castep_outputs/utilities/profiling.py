@@ -0,0 +1,118 @@
+"""Opt-in per-section profiling of .castep parsing."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+
+class SectionStats:
+    """Statistics of a section of a .castep file accumulated over a parse."""
+
+    __slots__ = ("attempts", "bytes", "hits", "lines", "process_time", "read_time")
+
+    def __init__(self) -> None:
+        #: Number of times section was tried against a line.
+        self.attempts = 0
+        #: Number of times section was found.
+        self.hits = 0
+        #: Lines consumed by section (including by its handler).
+        self.lines = 0
+        #: Bytes consumed by section, where reader supports ``tell``.
+        self.bytes = 0
+        #: Wall time (s) spent finding and reading section.
+        self.read_time = 0.0
+        #: Wall time (s) spent processing section.
+        self.process_time = 0.0
+
+
+class ParseProfile:
+    """Per-section statistics collected by :func:`profile_parse`."""
+
+    def __init__(self) -> None:
+        #: Statistics of each section by name.
+        self.sections: defaultdict[str, SectionStats] = defaultdict(SectionStats)
+        #: Number of lines classified which did not start a section.
+        self.dispatch_lines = 0
+        #: Wall time (s) spent classifying lines which did not start a section.
+        self.dispatch_time = 0.0
+
+    def report(self) -> str:
+        """
+        Format statistics as a table, most expensive sections first.
+
+        Returns
+        -------
+        :
+            Statistics table.
+        """
+        header = (f"{'section':<32} {'attempts':>9} {'hits':>7} {'lines':>9} {'bytes':>11} "
+                  f"{'read (s)':>9} {'process (s)':>11}")
+        rows = [header, "-" * len(header)]
+
+        for name, stats in sorted(self.sections.items(),
+                                  key=lambda item: -(item[1].read_time + item[1].process_time)):
+            rows.append(f"{name:<32} {stats.attempts:>9} {stats.hits:>7} {stats.lines:>9} "
+                        f"{stats.bytes:>11} {stats.read_time:>9.4f} {stats.process_time:>11.4f}")
+
+        rows.append(f"{'<unmatched lines>':<32} {'':>9} {'':>7} {self.dispatch_lines:>9} "
+                    f"{'':>11} {self.dispatch_time:>9.4f} {'':>11}")
+        return "\n".join(rows) + "\n"
+
+
+_ACTIVE: ContextVar[ParseProfile | None] = ContextVar("_ACTIVE", default=None)
+
+
+def active_profile() -> ParseProfile | None:
+    """
+    Get the profile being collected.
+
+    Returns
+    -------
+    :
+        Active profile or ``None`` if not profiling.
+    """
+    return _ACTIVE.get()
+
+
+@contextmanager
+def profile_parse() -> Iterator[ParseProfile]:
+    """
+    Collect per-section statistics of .castep files parsed within context.
+
+    Yields
+    ------
+    ParseProfile
+        Statistics, filled in as files are parsed.
+
+    Notes
+    -----
+    Only top-level sections are recorded, sections nested in blocks (e.g.
+    geometry optimisation iterations) count towards the process time of
+    their parent.
+
+    Examples
+    --------
+    .. code-block:: python
+
+       with profile_parse() as profile:
+           parse_castep_file("seedname.castep")
+       print(profile.report())
+    """
+    token = _ACTIVE.set(ParseProfile())
+    try:
+        yield _ACTIVE.get()
+    finally:
+        _ACTIVE.reset(token)
+
+
+@contextmanager
+def suspend_profile() -> Iterator[None]:
+    """Stop recording statistics within context, e.g. for nested parses."""
+    token = _ACTIVE.set(None)
+    try:
+        yield
+    finally:
+        _ACTIVE.reset(token)
@@ -5,10 +5,13 @@ from __future__ import annotations
 import collections.abc
 import fileinput
 import functools
+import inspect
+import locale
 import logging
 import re
 from collections import defaultdict
 from collections.abc import Callable, Iterable, Iterator, Mapping, MutableMapping, Sequence
+from contextlib import contextmanager
 from copy import copy
 from functools import singledispatch, wraps
 from itertools import filterfalse
@@ -28,7 +31,8 @@ from typing import (
     overload,
 )
 
-from castep_outputs.utilities.filewrapper import Block, FileWrapper
+from castep_outputs.utilities.compression import open_compressed
+from castep_outputs.utilities.filewrapper import Block, BufferedFileWrapper, FileWrapper
 
 T = TypeVar("T")
 In = TypeVar("In")
@@ -47,6 +51,15 @@ class Logger(Protocol):
         """Call method for logging methods."""
 
 
+_LOG_LEVELS: dict[str, int] = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+}
+
+
 class ComplexDict(TypedDict):
     """Dict of complex values."""
 
@@ -391,6 +404,55 @@ def add_aliases(
     return out_dict
 
 
+def _no_log(message: str, *args: Any, level: LoggingLevels = "info") -> None:
+    """Discard log message."""
+
+
+def _file_logger(prefix: Callable[[], str]) -> Logger:
+    """
+    Build logging function prefixing messages with file info.
+
+    Enabled levels are determined once, when the logger is built,
+    so logging at disabled levels costs only a set lookup.
+
+    Parameters
+    ----------
+    prefix
+        Function returning current file info.
+
+    Returns
+    -------
+    :
+        Function for logging data.
+    """
+    enabled = frozenset(level for level, num in _LOG_LEVELS.items()
+                        if logging.root.isEnabledFor(num))
+
+    if not enabled:
+        return _no_log
+
+    def log_file(message: str, *args: Any, level: LoggingLevels = "info") -> None:
+        if level in enabled:
+            logging.log(_LOG_LEVELS[level], f"{prefix()}{message}", *args)  # noqa: G004
+
+    return log_file
+
+
+def is_tracing() -> bool:
+    """
+    Whether debug tracing of parsers is enabled.
+
+    Per-line logging in parser loops should be guarded by
+    checking this once before the loop.
+
+    Returns
+    -------
+    :
+        Whether debug messages will be logged.
+    """
+    return logging.root.isEnabledFor(logging.DEBUG)
+
+
 @functools.singledispatch
 def log_factory(file: TextIO | fileinput.FileInput | FileWrapper) -> Logger:
     """
@@ -407,39 +469,24 @@ def log_factory(file: TextIO | fileinput.FileInput | FileWrapper) -> Logger:
         Function for logging data.
     """
     if hasattr(file, "name"):
+        return _file_logger(lambda: f"[{file.name}] ")
 
-        def log_file(message: str, *args: Any, level: LoggingLevels = "info") -> None:
-            getattr(logging, level)(f"[{file.name}] {message}", *args)
-    else:
-
-        def log_file(message: str, *args: Any, level: LoggingLevels = "info") -> None:
-            getattr(logging, level)(message, *args)
-
-    return log_file
+    return _file_logger(lambda: "")
 
 
 @log_factory.register
 def _(file: fileinput.FileInput) -> Logger:
-    def log_file(message: str, *args: Any, level: LoggingLevels = "info") -> None:
-        getattr(logging, level)(f"[{file.filename()}:{file.lineno()}] {message}", *args)
-
-    return log_file
+    return _file_logger(lambda: f"[{file.filename()}:{file.lineno()}] ")
 
 
 @log_factory.register
 def _(file: FileWrapper) -> Logger:
-    def log_file(message: str, *args: Any, level: LoggingLevels = "info") -> None:
-        getattr(logging, level)(f"[{file.name}:{file.lineno}] {message}", *args)
-
-    return log_file
+    return _file_logger(lambda: f"[{file.name}:{file.lineno}] ")
 
 
 @log_factory.register
 def _(file: Block) -> Logger:
-    def log_file(message: str, *args: Any, level: LoggingLevels = "info") -> None:
-        getattr(logging, level)(f"[{file.name}:{file.lineno}] {message}", *args)
-
-    return log_file
+    return _file_logger(lambda: f"[{file.name}:{file.lineno}] ")
 
 
 def _strip_inline_comments(
@@ -628,6 +675,35 @@ def get_only(seq: Sequence[T]) -> T:
     return val
 
 
+@contextmanager
+def _open_text(
+    file: Path,
+    encoding: str | None = None,
+    errors: str | None = None,
+) -> Iterator[BufferedFileWrapper]:
+    """
+    Open (possibly compressed) text file to be read through a :class:`BufferedFileWrapper`.
+
+    Parameters
+    ----------
+    file
+        File to open.
+    encoding
+        Encoding of file, defaults to that of :func:`open`.
+    errors
+        Handling of decoding errors.
+
+    Yields
+    ------
+    BufferedFileWrapper
+        Wrapped file.
+    """
+    with open_compressed(file) as in_file:
+        yield BufferedFileWrapper(in_file,
+                                  encoding or locale.getpreferredencoding(do_setlocale=False),
+                                  errors or "strict")
+
+
 def file_or_path(*, mode: Literal["r", "rb"], **open_kwargs: Any) -> Callable:
     """Decorate to allow a parser to accept either a path or open file.
 
@@ -640,16 +716,37 @@ def file_or_path(*, mode: Literal["r", "rb"], **open_kwargs: Any) -> Callable:
     -------
     :
         Wrapped function able to handle open files or paths invisibly.
+
+    Notes
+    -----
+    If the parser is a generator, the file is held open until it is exhausted.
+
+    Text files are read in large binary chunks by a
+    :class:`~castep_outputs.utilities.filewrapper.BufferedFileWrapper`.
+
+    Compressed files (see :mod:`castep_outputs.utilities.compression`) are
+    decompressed as they are read.
     """
+    def open_file(file: Path) -> IO | BufferedFileWrapper:
+        if mode == "r":
+            return _open_text(file, **open_kwargs)
+        return open_compressed(file)
 
     def inner(
         func: Callable[Concatenate[IO, P], Out],
     ) -> Callable[Concatenate[str | Path | IO, P], Out]:
-        @wraps(func)
-        def wrapped(file: str | Path, *args: P.args, **kwargs: P.kwargs) -> Out:
-            file = Path(file)
-            with file.open(mode, **open_kwargs) as in_file:
-                return func(in_file, *args, **kwargs)
+        if inspect.isgeneratorfunction(func):
+            @wraps(func)
+            def wrapped(file: str | Path, *args: P.args, **kwargs: P.kwargs) -> Out:
+                file = Path(file)
+                with open_file(file) as in_file:
+                    yield from func(in_file, *args, **kwargs)
+        else:
+            @wraps(func)
+            def wrapped(file: str | Path, *args: P.args, **kwargs: P.kwargs) -> Out:
+                file = Path(file)
+                with open_file(file) as in_file:
+                    return func(in_file, *args, **kwargs)
 
         func = singledispatch(func)
         func.register(str, wrapped)
@@ -0,0 +1,42 @@
+"""Test generators of benchmark inputs."""
+
+from collections import ChainMap
+
+import pytest
+
+from benchmarks import generators
+from benchmarks.generators import GENERATORS, generate
+from castep_outputs.bin_parsers import PARSERS as BIN_PARSERS
+from castep_outputs.parsers import PARSERS
+
+ALL_PARSERS = ChainMap(PARSERS, BIN_PARSERS)
+
+
+@pytest.fixture(autouse=True)
+def _small(monkeypatch):
+    """Shrink generated inputs."""
+    for size in ("CASTEP_MD_STEPS", "MD_GEOM_FRAMES", "FMT_GRID", "PHONON_QPOINTS",
+                 "BANDS_KPOINTS", "CST_ESP_GRID", "EPME_BIN_PAIRS"):
+        monkeypatch.setattr(generators, size, 3)
+
+
+@pytest.mark.parametrize("name", GENERATORS)
+def test_generate(name, tmp_path):
+    """Check generated inputs are deterministic, scale and parse."""
+    path = generate(name, tmp_path)
+
+    assert path.read_bytes() == generate(name, tmp_path / "again").read_bytes()
+    assert generate(name, tmp_path, scale=8).stat().st_size > path.stat().st_size
+    assert ALL_PARSERS[name](path)
+
+
+def test_generate_castep_steps(tmp_path):
+    """Check generated castep file contains all MD steps."""
+    (run,) = ALL_PARSERS["castep"](generate("castep", tmp_path, scale=2))
+
+    assert len(run["md"]) == 8
+
+
+def test_generate_md_frames(tmp_path):
+    """Check generated md file contains all frames."""
+    assert len(ALL_PARSERS["md"](generate("md", tmp_path, scale=2))) == 6
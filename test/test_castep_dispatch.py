@@ -0,0 +1,62 @@
+"""Test trigger-based section dispatch of castep parser."""
+
+import re
+from pathlib import Path
+
+import pytest
+
+from castep_outputs.parsers import castep_file_parser
+from castep_outputs.parsers.castep_file_parser import Filters, parse_castep_file
+from castep_outputs.utilities.filewrapper import Block
+
+_DATA_FOLDER = Path(__file__).parent / "data_files"
+
+
+def test_all_sections_triggered():
+    """Check every section can be reached by dispatch."""
+    for section in castep_file_parser._SECTIONS:
+        assert section.triggers, section.name
+        for trig in section.triggers:
+            assert section in castep_file_parser._candidate_sections(trig)
+
+
+@pytest.mark.parametrize("file", sorted(_DATA_FOLDER.glob("*.castep")), ids=lambda x: x.name)
+@pytest.mark.parametrize("filters", (Filters.TESTING, Filters.FULL, Filters.LOW))
+def test_dispatch_matches_exhaustive(file, filters, monkeypatch):
+    """Check trigger dispatch gives identical results to trying every section."""
+    dispatched = parse_castep_file(file, filters=filters)
+
+    monkeypatch.setattr(castep_file_parser, "_candidate_sections",
+                        lambda _: tuple(castep_file_parser._SECTIONS))
+    exhaustive = parse_castep_file(file, filters=filters)
+
+    assert dispatched == exhaustive
+
+
+@pytest.mark.parametrize("file", sorted(_DATA_FOLDER.glob("*.castep")), ids=lambda x: x.name)
+@pytest.mark.parametrize("filters", (Filters.FULL, Filters.LOW))
+def test_only_compiled_patterns(file, filters, monkeypatch):
+    """Check no string patterns are passed to block readers while parsing."""
+    calls = []
+    from_re = Block.from_re.__func__
+    skip_block = castep_file_parser.skip_block
+
+    def check_patterns(start, end):
+        calls.append((start, end))
+        assert isinstance(start, re.Pattern), start
+        assert isinstance(end, re.Pattern), end
+
+    def checked_from_re(cls, init_line, in_file, start, end, **kwargs):
+        check_patterns(start, end)
+        return from_re(cls, init_line, in_file, start, end, **kwargs)
+
+    def checked_skip_block(init_line, in_file, start, end, **kwargs):
+        check_patterns(start, end)
+        return skip_block(init_line, in_file, start, end, **kwargs)
+
+    # Includes calls made by handlers for sub-sections
+    monkeypatch.setattr(Block, "from_re", classmethod(checked_from_re))
+    monkeypatch.setattr(castep_file_parser, "skip_block", checked_skip_block)
+    parse_castep_file(file, filters=filters)
+
+    assert calls
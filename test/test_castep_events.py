@@ -0,0 +1,224 @@
+"""Test streaming of castep file sections."""
+
+import io
+from pathlib import Path
+
+import pytest
+
+from castep_outputs.parsers.castep_file_parser import (
+    Filters,
+    iter_castep_file,
+    parse_castep_file,
+)
+
+_DATA_FOLDER = Path(__file__).parent / "data_files"
+
+_GEOM_OPT = """ LBFGS: finished iteration     0 with enthalpy= -2.29374356E+003 eV
+
+ +-----------+-----------------+-----------------+------------+-----+ <-- LBFGS
+ | Parameter |      value      |    tolerance    |    units   | OK? | <-- LBFGS
+ +-----------+-----------------+-----------------+------------+-----+ <-- LBFGS
+ |  dE/ion   |   0.000000E+000 |   2.500000E-005 |         eV | No  | <-- LBFGS
+ |  |F|max   |   4.266993E-001 |   5.000000E-002 |       eV/A | No  | <-- LBFGS
+ |  |dR|max  |   0.000000E+000 |   1.000000E-003 |          A | No  | <-- LBFGS
+ |   Smax    |   1.278436E+001 |   2.500000E-001 |        GPa | No  | <-- LBFGS
+ +-----------+-----------------+-----------------+------------+-----+ <-- LBFGS
+
+
+================================================================================
+ Starting LBFGS iteration          1 ...
+================================================================================
+
+ +------------+-------------+-------------+-----------------+ <-- min LBFGS
+ |    Step    |   lambda    |   F.delta'  |    enthalpy     | <-- min LBFGS
+ +------------+-------------+-------------+-----------------+ <-- min LBFGS
+ |  previous  |    0.000000 |    0.306114 |    -2293.743561 | <-- min LBFGS
+ +------------+-------------+-------------+-----------------+ <-- min LBFGS
+
+
+--------------------------------------------------------------------------------
+ LBFGS: starting iteration         1 with trial guess (lambda=  1.000000)
+--------------------------------------------------------------------------------
+
++---------------- MEMORY AND SCRATCH DISK ESTIMATES PER PROCESS --------------+
+|                                                     Memory          Disk    |
+| Model and support data                               64.3 MB         0.0 MB |
+| Electronic energy minimisation requirements           4.0 MB         0.0 MB |
+| Geometry minimisation requirements                    4.6 MB         0.0 MB |
+|                                               ----------------------------- |
+| Approx. total storage required per process           72.9 MB         0.0 MB |
+|                                                                             |
+| Requirements will fluctuate during execution and may exceed these estimates |
++-----------------------------------------------------------------------------+
+
+
+                           -------------------------------
+                                      Unit Cell
+                           -------------------------------
+        Real Lattice(A)              Reciprocal Lattice(1/A)
+     4.6386363     0.0000000     0.0000000        1.354532869   0.000000000   0.000000000
+     0.0000000     4.6386363     0.0000000        0.000000000   1.354532869   0.000000000
+     0.0000000     0.0000000     2.9814282        0.000000000   0.000000000   2.107441421
+
+                       Lattice parameters(A)       Cell Angles
+                    a =      4.638636          alpha =   90.000000
+                    b =      4.638636          beta  =   90.000000
+                    c =      2.981428          gamma =   90.000000
+
+                Current cell volume =            64.151231 A**3
+                            density =             2.489923 amu/A**3
+                                    =             4.134614 g/cm^3
+
+                           -------------------------------
+                                     Cell Contents
+                           -------------------------------
+
+            xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+            x  Element         Atom        Fractional coordinates of atoms  x
+            x                 Number           u          v          w      x
+            x---------------------------------------------------------------x
+            x  O                 1         0.299872   0.299872  -0.000000   x
+            x  Ti                1         0.000000   0.000000   0.000000   x
+            xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+
+
+------------------------------------------------------------------------ <-- SCF
+SCF loop      Energy                           Energy gain       Timer   <-- SCF
+                                               per atom          (sec)   <-- SCF
+------------------------------------------------------------------------ <-- SCF
+Initial  -2.29119717E+003                                         26.80  <-- SCF
+      1  -2.29452355E+003                    5.54395796E-001      27.00  <-- SCF
+      2  -2.29463448E+003                    1.84884599E-002      27.57  <-- SCF
+------------------------------------------------------------------------ <-- SCF
+
+Final energy =  -2293.681052478     eV
+(energy not corrected for finite basis set)
+
+
+ ******************************** Symmetrised Forces ********************************
+ *                                                                                  *
+ *                           Cartesian components (eV/A)                            *
+ * -------------------------------------------------------------------------------- *
+ *                         x                    y                    z              *
+ *                                                                                  *
+ * O               1      0.29759              0.29759             -0.00000         *
+ * Ti              1      0.00000              0.00000              0.00000         *
+ *                                                                                  *
+ ************************************************************************************
+
+ *********** Symmetrised Stress Tensor ***********
+ *                                               *
+ *          Cartesian components (GPa)           *
+ * --------------------------------------------- *
+ *             x             y             z     *
+ *                                               *
+ *  x     -1.624594      0.000000      0.000000  *
+ *  y      0.000000     -1.624594      0.000000  *
+ *  z      0.000000      0.000000     -0.176493  *
+ *                                               *
+ *  Pressure:    1.1419                          *
+ *                                               *
+ *************************************************
+
+ +------------+-------------+-------------+-----------------+ <-- min LBFGS
+ |    Step    |   lambda    |   F.delta'  |    enthalpy     | <-- min LBFGS
+ +------------+-------------+-------------+-----------------+ <-- min LBFGS
+ |  previous  |    0.000000 |    0.306114 |    -2293.743561 | <-- min LBFGS
+ | trial step |    1.000000 |   -0.064103 |    -2293.757852 | <-- min LBFGS
+ +------------+-------------+-------------+-----------------+ <-- min LBFGS
+
+ LBFGS: finished iteration     1 with enthalpy= -2.29375785E+003 eV
+
+ +-----------+-----------------+-----------------+------------+-----+ <-- TPSD
+ | Parameter |      value      |    tolerance    |    units   | OK? | <-- TPSD
+ +-----------+-----------------+-----------------+------------+-----+ <-- TPSD
+ |  dE/ion   |   0.000000E+000 |   2.000000E-005 |         eV | Yes | <-- TPSD
+ |  |F|max   |   0.000000E+000 |   5.000000E-002 |       eV/A | Yes | <-- TPSD
+ |  |dR|max  |   0.000000E+000 |   1.000000E-003 |          A | Yes | <-- TPSD
+ |   Smax    |   0.000000E+000 |   1.000000E-001 |        GPa | Yes | <-- TPSD
+ +-----------+-----------------+-----------------+------------+-----+ <-- TPSD
+
+ BFGS: Geometry optimization completed successfully.
+
+================================================================================
+ BFGS: Final Configuration:
+================================================================================
+
+                           -------------------------------
+                                      Unit Cell
+                           -------------------------------
+        Real Lattice(A)              Reciprocal Lattice(1/A)
+     2.3372228     0.0000000     0.0000000        2.688312529   0.000000000   0.000000000
+     0.0000000     2.3372228     0.0000000        0.000000000   2.688312529   0.000000000
+     0.0000000     0.0000000     2.3372228        0.000000000   0.000000000   2.688312529
+
+                       Lattice parameters(A)       Cell Angles
+                    a =      2.337223          alpha =   90.000000
+                    b =      2.337223          beta  =   90.000000
+                    c =      2.337223          gamma =   90.000000
+
+                Current cell volume =            12.767337 A**3
+                            density =             8.748104 amu/A**3
+                                    =            14.526569 g/cm^3
+
+                           -------------------------------
+                                     Cell Contents
+                           -------------------------------
+
+            xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+            x  Element         Atom        Fractional coordinates of atoms  x
+            x                 Number           u          v          w      x
+            x---------------------------------------------------------------x
+            x  Si                1        -0.006190  -0.000628  -0.000628   x
+            x  Si                2         0.246190   0.250628   0.250628   x
+            xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+
+
+ BFGS: Final Enthalpy     = -2.17004345E+002 eV
+ BFGS: Final <frequency>  unchanged from initial value
+ BFGS: Final bulk modulus =     392.40598 GPa
+"""
+
+
+@pytest.mark.parametrize("file", sorted(_DATA_FOLDER.glob("*.castep")), ids=lambda x: x.name)
+def test_event_runs(file):
+    """Check events are assigned to the runs of a full parse."""
+    full = parse_castep_file(file, Filters.FULL)
+    events = list(iter_castep_file(file, Filters.FULL))
+
+    assert {event.run for event in events} == set(range(len(full)))
+    for event in events:
+        assert event.key in full[event.run]
+
+
+def test_md_steps():
+    """Check each MD step is yielded separately and in order."""
+    file = _DATA_FOLDER / "si8-md.castep"
+    full = parse_castep_file(file, Filters.MD)
+    steps = [value for _, key, value in iter_castep_file(file, Filters.MD) if key == "md"]
+
+    assert all(len(step) == 1 for step in steps)
+    assert [step[0] for step in steps] == full[0]["md"]
+
+
+def test_lazy():
+    """Check sections are yielded before the file is read to the end."""
+    with (_DATA_FOLDER / "si8-md.castep").open(encoding="utf-8") as file:
+        events = iter_castep_file(file, Filters.MD)
+        next(events)
+        assert file.read()
+
+
+@pytest.mark.parametrize("keys", [None, {"geom_opt"}])
+def test_geom_opt(keys):
+    """Check geometry iterations streamed match those of a full parse."""
+    full = parse_castep_file(io.StringIO(_GEOM_OPT))[0]["geom_opt"]
+    events = [value for _, key, value in iter_castep_file(io.StringIO(_GEOM_OPT), keys=keys)
+              if key == "geom_opt"]
+
+    assert [it for value in events for it in value.get("iterations", [])] == full["iterations"]
+
+    final = {}
+    for value in events:
+        final.update(value.get("final_configuration", {}))
+    assert final == full["final_configuration"]
@@ -0,0 +1,76 @@
+"""Test incremental parsing of growing castep files."""
+
+from pathlib import Path
+
+import pytest
+
+from castep_outputs.parsers.castep_file_parser import Filters, parse_castep_file
+from castep_outputs.tools import CastepFollower
+
+_DATA_FOLDER = Path(__file__).parent / "data_files"
+
+
+@pytest.mark.parametrize("file", sorted(_DATA_FOLDER.glob("*.castep")), ids=lambda x: x.name)
+@pytest.mark.parametrize("filters", (Filters.HIGH, Filters.TESTING))
+def test_follow(file, filters, tmp_path):
+    """Check following a file written in chunks matches parsing the whole file."""
+    data = file.read_bytes()
+    live = tmp_path / file.name
+    live.write_bytes(b"")
+
+    follower = CastepFollower(live, filters)
+    for start in range(0, len(data), 4099):
+        with live.open("ab") as out_file:
+            out_file.write(data[start:start + 4099])
+        follower.update()
+
+    assert follower.update(final=True) == parse_castep_file(file, filters)
+
+
+def test_half_written_block(tmp_path):
+    """Check incomplete blocks are left for later updates."""
+    data = (_DATA_FOLDER / "si8-md.castep").read_text(encoding="utf-8")
+    cut = data.index("SCF loop") + 100
+    live = tmp_path / "si8-md.castep"
+    live.write_text(data[:cut], encoding="utf-8")
+
+    follower = CastepFollower(live, Filters.HIGH)
+    runs = follower.update()
+    assert "scf" not in runs[0]
+    assert follower.offset < len(data[:data.index("SCF loop")].encode())
+
+    live.write_text(data, encoding="utf-8")
+    assert follower.update(final=True) == parse_castep_file(live, Filters.HIGH)
+
+
+def test_replaced_file(tmp_path):
+    """Check truncated files are parsed again from the start."""
+    file = _DATA_FOLDER / "si8-md.castep"
+    live = tmp_path / "si8-md.castep"
+    live.write_bytes(file.read_bytes())
+
+    follower = CastepFollower(live, Filters.HIGH)
+    follower.update(final=True)
+
+    live.write_bytes(file.read_bytes()[:1000])
+    follower.update()
+    live.write_bytes(file.read_bytes())
+
+    assert follower.update(final=True) == parse_castep_file(file, Filters.HIGH)
+
+
+def test_unchanged_file(tmp_path, monkeypatch):
+    """Check polling an unchanged file does not parse it again."""
+    file = _DATA_FOLDER / "si8-md.castep"
+    live = tmp_path / "si8-md.castep"
+    live.write_bytes(file.read_bytes())
+
+    follower = CastepFollower(live, Filters.HIGH)
+    runs = follower.update()
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("File parsed again")
+
+    monkeypatch.setattr(Path, "open", fail)
+    assert follower.update() == runs
+    assert follower.runs[-1] is runs[-1]
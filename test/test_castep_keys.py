@@ -0,0 +1,45 @@
+"""Test projection of parsed castep files to requested keys."""
+
+from pathlib import Path
+
+import pytest
+
+from castep_outputs.parsers.castep_file_parser import (
+    Filters,
+    iter_castep_file,
+    parse_castep_file,
+)
+
+_DATA_FOLDER = Path(__file__).parent / "data_files"
+_KEYS = ({"energies", "forces", "stresses"}, {"geom_opt"}, {"md"}, {"constraints"})
+
+
+def _project(runs, keys):
+    return [proj for run in runs if (proj := {key: run[key] for key in keys if key in run})]
+
+
+@pytest.mark.parametrize("file", sorted(_DATA_FOLDER.glob("*.castep")), ids=lambda x: x.name)
+def test_keys(file):
+    """Check projected parse matches full parse restricted to keys."""
+    full = parse_castep_file(file, Filters.FULL)
+
+    for keys in _KEYS:
+        assert parse_castep_file(file, Filters.FULL, keys=keys) == _project(full, keys)
+
+
+def test_keys_runs():
+    """Check projection applies to selected runs."""
+    file = _DATA_FOLDER / "test.castep"
+    full = parse_castep_file(file, Filters.FULL)
+
+    assert (parse_castep_file(file, Filters.FULL, runs=-1, keys={"initial_cell"})
+            == _project(full[-1:], {"initial_cell"}))
+
+
+def test_keys_events():
+    """Check only requested keys are yielded."""
+    file = _DATA_FOLDER / "si8-md.castep"
+
+    keys = {event.key for event in iter_castep_file(file, Filters.FULL, keys={"md"})}
+
+    assert keys == {"md"}
@@ -0,0 +1,51 @@
+"""Test locating sections of memory-mapped castep files."""
+
+from io import BytesIO, StringIO
+from pathlib import Path
+
+import pytest
+
+from castep_outputs.parsers.castep_file_parser import (
+    Filters,
+    _candidate_sections,
+    _locate_sections,
+    index_sections,
+    parse_castep_file,
+)
+
+_DATA_FOLDER = Path(__file__).parent / "data_files"
+_FILES = sorted(_DATA_FOLDER.glob("*.castep"))
+
+
+@pytest.mark.parametrize("file", _FILES, ids=lambda x: x.name)
+def test_index_sections(file):
+    """Check exactly the lines which may start a section are found."""
+    expected = []
+    pos = 0
+    with file.open("rb") as in_file:
+        for line in in_file:
+            if _candidate_sections(line.decode()):
+                expected.append(pos)
+            pos += len(line)
+
+        assert index_sections(in_file) == tuple(expected)
+
+
+def test_locate_chunked():
+    """Check lines are found identically when scanned in small chunks."""
+    data = (_DATA_FOLDER / "si8-md.castep").read_bytes()
+
+    assert list(_locate_sections(data, chunk_size=100)) == list(_locate_sections(data))
+
+
+def test_index_sections_in_memory():
+    """Check sections are found in unmappable files."""
+    assert index_sections(BytesIO(b"Banner\n Final energy = 1\n 2 3\n")) == (7,)
+
+
+@pytest.mark.parametrize("file", _FILES, ids=lambda x: x.name)
+def test_mapped_parse(file):
+    """Check jumping between sections matches reading every line."""
+    text = StringIO(file.read_text(encoding="utf-8"))
+
+    assert parse_castep_file(file, Filters.TESTING) == parse_castep_file(text, Filters.TESTING)
@@ -4269,6 +4269,18 @@ Peak Memory Use     = 1703440 kB
         'total_time': 334.62}
 
 
+def test_unknown_external_file():
+    test_text = io.StringIO("""
+<BEGIN foo>
+Final energy, E             =  1.0     eV
+Final energy, E             =  2.0     eV
+""")
+
+    test_dict = parse_castep_file(test_text, filters=Filters.TESTING)[0]
+
+    assert test_dict == {"energies": {"final_energy": (1.0, 2.0)}}
+
+
 castep_path = os.environ.get("CASTEP_ROOT")
 castep_tests = (
     Path(castep_path).glob("Test/**/benchmark.out.*") if castep_path is not None else (Path.cwd(),)
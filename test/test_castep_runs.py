@@ -0,0 +1,87 @@
+"""Test selection of runs from multi-run castep files."""
+
+from io import StringIO
+from pathlib import Path
+
+import pytest
+
+from castep_outputs.parsers.castep_file_parser import Filters, index_runs, parse_castep_file
+
+_DATA_FOLDER = Path(__file__).parent / "data_files"
+_MULTI_RUN = _DATA_FOLDER / "test.castep"
+
+
+@pytest.fixture(scope="module")
+def full_parse():
+    return parse_castep_file(_MULTI_RUN, Filters.FULL)
+
+
+def test_index_runs(full_parse):
+    """Check one offset is found per run."""
+    with _MULTI_RUN.open("rb") as file:
+        offsets = index_runs(file)
+
+        assert len(offsets) == len(full_parse)
+        for offset in offsets[1:]:
+            file.seek(offset)
+            assert "Compiled for" in file.readline().decode()
+
+
+@pytest.mark.parametrize("runs", (-1, 0, [1, 0], slice(1, None), slice(None, None, -1)),
+                         ids=str)
+def test_select_runs(full_parse, runs):
+    """Check selected runs are parsed identically to a full parse."""
+    if isinstance(runs, slice):
+        expected = full_parse[runs]
+    elif isinstance(runs, int):
+        expected = [full_parse[runs]]
+    else:
+        expected = [full_parse[ind] for ind in runs]
+
+    assert parse_castep_file(_MULTI_RUN, Filters.FULL, runs=runs) == expected
+
+
+def test_select_runs_unseekable(full_parse):
+    """Check runs are selected from in-memory files."""
+    text = StringIO(_MULTI_RUN.read_text(encoding="utf-8"))
+
+    assert parse_castep_file(text, Filters.FULL, runs=[-1]) == full_parse[-1:]
+
+
+def test_select_missing_run():
+    """Check selecting a run not in file raises."""
+    with pytest.raises(IndexError):
+        parse_castep_file(_MULTI_RUN, runs=[5])
+
+
+@pytest.mark.parametrize("runs", (None, [-1, 0]), ids=str)
+def test_parallel_runs(full_parse, runs):
+    """Check runs parsed in parallel match a serial parse."""
+    expected = full_parse if runs is None else [full_parse[ind] for ind in runs]
+
+    assert parse_castep_file(_MULTI_RUN, Filters.FULL, runs=runs, workers=2) == expected
+
+
+@pytest.mark.parametrize("seekable", (True, False))
+def test_select_filtered_out_run(tmp_path, seekable):
+    """Check runs with no data under filters are counted but omitted."""
+    lines = _MULTI_RUN.read_text(encoding="utf-8").splitlines(keepends=True)
+    second = next(i for i, line in enumerate(lines) if i > 100 and "Compiled for" in line)
+    # Build info and start time only, so empty under LOW
+    empty_run = lines[second:second + 8]
+    text = "".join((*lines[:second], *empty_run, *lines[second:]))
+
+    file = tmp_path / "filtered.castep"
+    file.write_text(text, encoding="utf-8")
+
+    def select(runs):
+        return parse_castep_file(file if seekable else StringIO(text), Filters.LOW, runs=runs)
+
+    with file.open("rb") as binary:
+        assert len(index_runs(binary)) == 3
+
+    full = parse_castep_file(file, Filters.LOW)
+    assert len(full) == 2
+
+    assert select(1) == []
+    assert select([2, 0]) == [full[1], full[0]]
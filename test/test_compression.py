@@ -0,0 +1,102 @@
+"""Test transparent decompression of compressed outputs."""
+
+import bz2
+import gzip
+import lzma
+import random
+from io import SEEK_END, BytesIO
+from pathlib import Path
+
+import pytest
+
+from castep_outputs.cli.castep_outputs_main import ALL_PARSERS, parse_single
+from castep_outputs.parsers.castep_file_parser import parse_castep_file
+from castep_outputs.tools.md_geom_parser import MDGeomParser
+from castep_outputs.utilities.compression import _ZSTD_TYPE, IndexedGzipFile
+
+DATA_FOLDER = Path(__file__).parent / "data_files"
+
+COMPRESSORS = {".gz": gzip.compress, ".xz": lzma.compress, ".bz2": bz2.compress}
+
+if _ZSTD_TYPE == "stdlib":
+    from compression import zstd
+    COMPRESSORS[".zst"] = zstd.compress
+elif _ZSTD_TYPE == "zstandard":
+    import zstandard
+    COMPRESSORS[".zst"] = zstandard.compress
+
+
+def _compress(path: Path, directory: Path, suffix: str) -> Path:
+    out = directory / (path.name + suffix)
+    out.write_bytes(COMPRESSORS[suffix](path.read_bytes()))
+    return out
+
+
+@pytest.mark.parametrize("suffix", COMPRESSORS)
+@pytest.mark.parametrize("parser", [parser for parser in ALL_PARSERS
+                                    if (DATA_FOLDER / f"test.{parser}").is_file()])
+def test_parse_compressed(parser, suffix, tmp_path):
+    """Check compressed files parse as uncompressed, detected by name."""
+    plain = DATA_FOLDER / f"test.{parser}"
+    compressed = _compress(plain, tmp_path, suffix)
+
+    assert parse_single(compressed, testing=True) == parse_single(plain, testing=True)
+
+
+@pytest.mark.parametrize("suffix", [".gz", ".xz"])
+def test_compressed_workers(suffix, tmp_path):
+    """Check runs of compressed files are parsed in workers."""
+    plain = DATA_FOLDER / "test.castep"
+    compressed = _compress(plain, tmp_path, suffix)
+
+    assert (parse_castep_file(compressed, runs=[0], workers=2)
+            == parse_castep_file(plain, runs=[0]))
+
+
+def test_compressed_md_geom(tmp_path):
+    """Check lazy parser reads compressed files."""
+    plain = DATA_FOLDER / "si8-md.md"
+    compressed = _compress(plain, tmp_path, ".gz")
+
+    parser = MDGeomParser(compressed)
+
+    assert len(parser) == 3
+    assert parser[2] == MDGeomParser(plain)[2]
+    assert parser[0] == MDGeomParser(plain)[0]
+    assert list(parser.iter_parallel(workers=2)) == list(parser)
+
+
+@pytest.fixture
+def gzip_data():
+    """Data of several gzip members with padding."""
+    rng = random.Random(0)
+    data = bytes(rng.randrange(32) for _ in range(100_000))
+    compressed = gzip.compress(data[:60_000]) + b"\0" * 4 + gzip.compress(data[60_000:])
+    return data, compressed
+
+
+def test_indexed_gzip(gzip_data):
+    """Check random access matches the decompressed data."""
+    data, compressed = gzip_data
+    reader = IndexedGzipFile(BytesIO(compressed), spacing=10_000, chunk_size=1_000)
+
+    assert reader.seek(0, SEEK_END) == len(data)
+    assert reader.n_checkpoints == 11
+
+    rng = random.Random(1)
+    for _ in range(50):
+        offset = rng.randrange(len(data))
+        assert reader.seek(offset) == offset
+        assert reader.read(1000) == data[offset:offset + 1000]
+
+    reader.seek(-10, SEEK_END)
+    assert reader.read() == data[-10:]
+
+
+def test_indexed_gzip_truncated(gzip_data):
+    """Check truncated files are reported."""
+    _, compressed = gzip_data
+    reader = IndexedGzipFile(BytesIO(compressed[:-10]))
+
+    with pytest.raises(EOFError):
+        reader.read()
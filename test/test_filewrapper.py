@@ -0,0 +1,126 @@
+"""Test file wrappers and views of Block."""
+
+from io import StringIO
+
+import pytest
+
+from castep_outputs.utilities.filewrapper import Block, BufferedFileWrapper, FileWrapper
+
+LINES = ["Hello\n", "Thére\n", "Friend\n", "End"]
+
+
+@pytest.fixture(params=["\n", "\r\n"], ids=["lf", "crlf"])
+def text_file(request, tmp_path):
+    """Write lines with given line ending."""
+    path = tmp_path / "lines.txt"
+    path.write_bytes("".join(LINES).replace("\n", request.param).encode("utf-8"))
+    return path
+
+
+def test_positions(text_file):
+    """Check tell after rewinds matches position of unwrapped file."""
+    with text_file.open(encoding="utf-8") as raw:
+        expected = [raw.tell()]
+        while raw.readline():
+            expected.append(raw.tell())
+
+    with text_file.open(encoding="utf-8") as raw:
+        wrapper = FileWrapper(raw, history=len(LINES))
+        assert [next(wrapper) for _ in LINES] == LINES
+
+        for lineno in range(len(LINES), 0, -1):
+            wrapper.rewind()
+            assert wrapper.lineno == lineno - 1
+            assert wrapper.tell() == expected[lineno - 1]
+
+        assert next(wrapper) == LINES[0]
+
+
+def test_rewind_limit():
+    """Check only `history` lines can be rewound."""
+    wrapper = FileWrapper(StringIO("".join(LINES)))
+    next(wrapper)
+    next(wrapper)
+    wrapper.rewind()
+    wrapper.rewind()
+
+    assert wrapper.lineno == 1
+    assert next(wrapper) == LINES[1]
+
+
+def test_rewind_eof():
+    """Check rewinding after end of file does nothing."""
+    wrapper = FileWrapper(StringIO("".join(LINES)))
+    assert list(wrapper) == LINES
+
+    wrapper.rewind()
+
+    with pytest.raises(StopIteration):
+        next(wrapper)
+
+
+def test_seek():
+    """Check seek discards rewound lines."""
+    wrapper = FileWrapper(StringIO("".join(LINES)))
+    next(wrapper)
+    wrapper.rewind()
+    wrapper.seek(len(LINES[0]))
+
+    assert next(wrapper) == LINES[1]
+    wrapper.rewind()
+    assert wrapper.tell() == len(LINES[0])
+
+
+def test_block_views():
+    """Check blocks read from blocks share lines with their parent."""
+    parent = Block.from_iterable(["Start\n", "a\n", "b\n", "End\n", "c\n", "d\n", "e\n"])
+    child = Block.from_re(next(parent), parent, "Start", "End")
+
+    assert child.aslist() == ["Start\n", "a\n", "b\n", "End\n"]
+    assert child._buffer is parent._buffer
+
+    child.remove_bounds(1, 1)
+    assert child.aslist() == ["a\n", "b\n"]
+    assert child[-1] == "b\n"
+    assert child[::-1] == ("b\n", "a\n")
+    assert str(child) == "a\n\nb\n"
+
+    # Line following lines read is consumed as for files
+    lines = Block.get_lines(parent, 1)
+    assert lines.aslist() == ["c\n"]
+    assert next(parent) == "e\n"
+
+    with pytest.raises(OSError, match="Unexpected end of file"):
+        Block.get_lines(parent, 1)
+
+
+def test_block_view_unread_line():
+    """Check initial lines not read from parent are kept."""
+    parent = Block.from_iterable(["a\n", "End\n"])
+    child = Block.from_re("Start\n", parent, "Start", "End")
+
+    assert child.aslist() == ["Start\n", "a\n", "End\n"]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1 << 20])
+def test_buffered(text_file, chunk_size):
+    """Check buffered reading matches text mode at any chunk size."""
+    with text_file.open(encoding="utf-8") as raw:
+        expected = [raw.tell()]
+        while raw.readline():
+            expected.append(raw.tell())
+
+    with text_file.open("rb") as raw:
+        wrapper = BufferedFileWrapper(raw, history=2, chunk_size=chunk_size)
+        for lineno, line in enumerate(LINES, 1):
+            assert next(wrapper) == line
+            assert wrapper.tell() == expected[lineno]
+
+        wrapper.rewind()
+        wrapper.rewind()
+        assert wrapper.tell() == expected[2]
+        assert next(wrapper) == LINES[2]
+
+        wrapper.seek(expected[1])
+        assert next(wrapper) == LINES[1]
+        assert list(wrapper) == LINES[2:]
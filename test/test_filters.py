@@ -6,6 +6,7 @@ import pytest
 
 from castep_outputs import parse_castep_file
 from castep_outputs.parsers.castep_file_parser import Filters
+from castep_outputs.utilities.filewrapper import Block
 
 _DATA_FOLDER = Path(__file__).parent / "data_files"
 _TEST_FILE = _DATA_FOLDER / "test.castep"
@@ -42,5 +43,26 @@ def test_filter_none():
     assert not data
 
 
+@pytest.mark.parametrize("filters,stored", (
+    (Filters.LOW, False),
+    (Filters.FULL, True),
+))
+def test_filtered_blocks_skipped(filters, stored, monkeypatch):
+    """Check blocks excluded by filters are skipped rather than read into a Block."""
+    starts = []
+    from_re = Block.from_re.__func__
+
+    def recording_from_re(cls, init_line, *args, **kwargs):
+        if block := from_re(cls, init_line, *args, **kwargs):
+            starts.append(init_line)
+        return block
+
+    monkeypatch.setattr(Block, "from_re", classmethod(recording_from_re))
+    parse_castep_file(_DATA_FOLDER / "si8-md.castep", filters=filters)
+
+    assert any("SCF loop" in line for line in starts) is stored
+    assert any("Starting MD" in line for line in starts) is stored
+
+
 if __name__ == "__main__":
     pytest.main()
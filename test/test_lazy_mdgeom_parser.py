@@ -1,8 +1,13 @@
+import re
+from io import StringIO
+from operator import itemgetter
 from pathlib import Path
 
 import pytest
 
-from castep_outputs.tools.md_geom_parser import MDGeomParser
+from castep_outputs.parsers.md_geom_file_parser import parse_md_geom_file
+from castep_outputs.tools import md_geom_parser
+from castep_outputs.tools.md_geom_parser import MDGeomParser, index_frames, index_path
 
 
 
@@ -83,3 +88,240 @@ def test_getitem(parser):
 
     with pytest.raises(IndexError):
         parser[3]
+
+
+@pytest.fixture
+def variable_file(tmp_path):
+    """File with frames of different sizes."""
+    lines = FILE.read_text().splitlines(keepends=True)
+    # Drop ion from second frame, widen number and add blank lines after it
+    lines = lines[:48] + lines[49:56] + lines[57:64] + lines[65:]
+    lines[5] = lines[5].replace("-3.1437669498903556E+001", "-3.1437669498903556E+0001")
+    lines.insert(62, "   \n")
+    path = tmp_path / "variable.md"
+    path.write_text("".join(lines))
+    return path
+
+
+def test_variable_frames(variable_file):
+    """Check frames of different sizes are found."""
+    # Full parser expects single empty lines between frames
+    text = re.sub(r"\n(?:[ ]*\n)+", "\n\n", variable_file.read_text())
+    expected = parse_md_geom_file(StringIO(text))
+    parser = MDGeomParser(variable_file)
+
+    assert len(parser) == 3
+    assert [len(frame["ions"]) for frame in parser] == [8, 7, 8]
+    assert parser[2] == expected[2]
+    assert parser[0] == expected[0]
+    assert list(parser) == expected
+
+
+def test_index_saved(variable_file, monkeypatch):
+    """Check index is reused unless file changes."""
+    MDGeomParser(variable_file)
+    assert not index_path(variable_file).exists()
+
+    MDGeomParser(variable_file, cache_index=True)
+    assert index_path(variable_file).is_file()
+
+    def fail(*_args):
+        raise AssertionError("Index rebuilt")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(md_geom_parser, "index_frames", fail)
+        assert len(MDGeomParser(variable_file, cache_index=True)) == 3
+
+    variable_file.write_text(FILE.read_text())
+    assert MDGeomParser(variable_file, cache_index=True)[1] == MDGeomParser(FILE)[1]
+
+
+def test_index_frames_chunks(variable_file):
+    """Check index is independent of chunk size."""
+    with variable_file.open("rb") as in_file:
+        expected = index_frames(in_file, 37, 4)
+        for chunk_size in (1, 7, 100):
+            assert index_frames(in_file, 37, 4, chunk_size=chunk_size) == expected
+
+
+def test_arrays(parser, tmp_path):
+    """Check arrays match parsed frames."""
+    np = pytest.importorskip("numpy")
+    frames = list(parser)
+    ions = parser.ions
+
+    assert len(ions) == 8
+    assert ions[0] == ("Si", 1)
+
+    for method, key in (("positions", "R"), ("velocities", "V"), ("forces", "F")):
+        expected = [[frame["ions"][ion][key] for ion in ions] for frame in frames]
+        np.testing.assert_allclose(getattr(parser, method)(), expected)
+
+    np.testing.assert_allclose(parser.cells(), [frame["h"] for frame in frames])
+    np.testing.assert_allclose(parser.energies(), [frame["E"][0] for frame in frames])
+    np.testing.assert_allclose(parser.temperatures(), [frame["T"][0][0] for frame in frames])
+    np.testing.assert_allclose(parser.times(), [frame["time"] for frame in frames])
+
+    assert parser.positions(slice(1, None)).shape == (2, 8, 3)
+    np.testing.assert_array_equal(parser.forces([2, 0]), parser.forces()[[2, 0]])
+
+    cached = parser.velocities(out=tmp_path / "v.npy")
+    np.testing.assert_array_equal(np.load(tmp_path / "v.npy"), cached)
+
+
+def test_arrays_empty(parser, tmp_path):
+    """Check empty selections keep the shape of frames."""
+    pytest.importorskip("numpy")
+
+    assert parser.positions(slice(0, 0)).shape == (0, 8, 3)
+    assert parser.cells([]).shape == (0, 3, 3)
+    assert parser.energies([]).shape == (0, 3)
+    assert parser.times([]).shape == (0,)
+
+    path = tmp_path / "empty.md"
+    path.write_bytes(FILE.read_bytes()[:parser._offsets[0]])
+    empty = MDGeomParser(path)
+    assert len(empty) == 0
+    assert empty.positions().shape == (0, 0, 3)
+    assert empty.cells().shape == (0, 3, 3)
+
+
+def test_arrays_variable(variable_file):
+    """Check frames with different ions cannot be stacked."""
+    pytest.importorskip("numpy")
+    parser = MDGeomParser(variable_file)
+
+    assert parser.positions([0, 2]).shape == (2, 8, 3)
+    with pytest.raises(ValueError, match="Frame 1 has 21 values tagged R"):
+        parser.positions()
+
+
+@pytest.mark.parametrize("chunksize", [1, 2, 64])
+def test_parallel(variable_file, chunksize):
+    """Check frames parsed in workers match and are in order."""
+    parser = MDGeomParser(variable_file)
+    frames = list(parser)
+
+    assert list(parser.iter_parallel(workers=2, chunksize=chunksize)) == frames
+    assert list(parser.map(itemgetter("time"), [2, 0, -2], workers=2, chunksize=chunksize)) == [
+        frames[2]["time"], frames[0]["time"], frames[1]["time"],
+    ]
+
+
+def test_fields(parser):
+    """Check only selected fields are parsed."""
+    full = list(parser)
+    selected = MDGeomParser(FILE, fields={"position", "E"})
+
+    for frame, expected in zip(selected, full, strict=True):
+        assert set(frame) == {"ions", "time", "E", "energy"}
+        assert frame["E"] == expected["E"]
+        assert frame["time"] == expected["time"]
+        for ion, props in frame["ions"].items():
+            assert props == {"R": expected["ions"][ion]["R"],
+                             "position": expected["ions"][ion]["R"]}
+
+    assert list(selected.map(None, workers=2)) == list(selected)
+
+
+@pytest.mark.parametrize("fields", [None, {"R", "T"}])
+def test_lazy_frames(fields):
+    """Check lazy frames match parsed frames and are parsed when accessed."""
+    parser = MDGeomParser(FILE, fields=fields)
+    lazy = MDGeomParser(FILE, fields=fields, lazy=True)
+
+    frame = lazy[1]
+    assert frame["T"] == parser[1]["temperature"]
+    assert "ions" not in frame._data
+
+    assert list(lazy) == list(parser)
+    assert list(frame) == list(parser[1])
+
+
+def test_cache(variable_file):
+    """Check frames are kept up to limits and reused."""
+    parser = MDGeomParser(variable_file, cache_size=2)
+    sizes = [end - start for start, end in zip(parser._offsets, parser._offsets[1:])]
+
+    first = parser[0]
+    assert parser[0] is first
+    parser[1]
+    parser[2]
+    assert parser.cache_info() == (1, 3, 2, sizes[1] + sizes[2])
+    assert parser[0] is not first
+    assert parser[0] == first
+
+    parser.cache_clear()
+    assert parser.cache_info() == (0, 0, 0, 0)
+
+    by_bytes = MDGeomParser(variable_file, cache_size=None, cache_bytes=max(sizes))
+    list(by_bytes)
+    assert by_bytes.cache_info() == (0, 3, 1, sizes[2])
+    assert by_bytes[[2, 0]] == [parser[2], first]
+    assert by_bytes.cache_info() == (1, 4, 1, sizes[0])
+
+    uncached = MDGeomParser(variable_file)
+    assert uncached[0] is not uncached[0]
+    assert uncached.cache_info() == (0, 2, 0, 0)
+
+
+@pytest.mark.parametrize("coalesce", [1, 1 << 22])
+def test_strided(variable_file, monkeypatch, coalesce):
+    """Check frames requested together are read as when read singly."""
+    monkeypatch.setattr(md_geom_parser, "_COALESCE_BYTES", coalesce)
+    parser = MDGeomParser(variable_file)
+    expected = [parser.get_frame(i) for i in range(len(parser))]
+
+    assert parser[::2] == expected[::2]
+    assert parser.next_frame is None
+    assert parser[[2, 0, 2, 1]] == [expected[2], expected[0], expected[2], expected[1]]
+    assert parser.next_frame == 2
+    assert parser.read_next() == expected[2]
+    assert parser[::-1] == expected[::-1]
+
+
+def test_refresh(tmp_path):
+    """Check frames are found as they are written, and partial frames are left out."""
+    data = FILE.read_bytes()
+    full = MDGeomParser(FILE)
+    expected = list(full)
+    offsets = full._offsets
+    path = tmp_path / "running.md"
+
+    path.write_bytes(data[:offsets[1] - 1])  # Missing blank line after frame
+    parser = MDGeomParser(path)
+    assert len(parser) == 0
+    assert list(parser.follow(interval=0, timeout=0)) == []
+
+    with path.open("ab") as out_file:
+        out_file.write(data[offsets[1] - 1:offsets[1] + 100])
+        out_file.flush()
+        assert parser.refresh() == 1
+        assert parser.refresh() == 0
+        assert list(parser) == expected[:1]
+        assert parser.next_frame is None
+
+        out_file.write(data[offsets[1] + 100:])
+    assert parser.refresh() == 2
+    assert parser.next_frame == 1
+    assert list(parser.follow(interval=0, timeout=0)) == expected[1:]
+    assert parser[0] == expected[0]
+
+
+def test_refresh_truncated(tmp_path):
+    """Check truncated files are indexed again from the start."""
+    data = FILE.read_bytes()
+    full = MDGeomParser(FILE)
+    expected = list(full)
+    offsets = full._offsets
+    path = tmp_path / "running.md"
+
+    path.write_bytes(data)
+    parser = MDGeomParser(path, cache_size=None)
+    assert list(parser) == expected
+
+    path.write_bytes(data[:offsets[2]])
+    assert parser.refresh() == 2
+    assert parser.next_frame == 0
+    assert parser.cache_info().frames == 0
+    assert list(parser) == expected[:2]
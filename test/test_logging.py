@@ -0,0 +1,61 @@
+"""Test parser logging."""
+
+import logging
+from pathlib import Path
+
+from castep_outputs.parsers.castep_file_parser import parse_castep_file
+from castep_outputs.utilities.utility import is_tracing, log_factory
+
+_DATA_FOLDER = Path(__file__).parent / "data_files"
+
+
+class _CountingFile:
+    """File-like with name access counted."""
+
+    def __init__(self):
+        self.accessed = 0
+
+    @property
+    def name(self):
+        self.accessed += 1
+        return "counted"
+
+
+def test_disabled_level_not_formatted(caplog):
+    """Check messages at disabled levels are dropped without being formatted."""
+    caplog.set_level(logging.WARNING)
+    file = _CountingFile()
+    logger = log_factory(file)
+    file.accessed = 0
+
+    logger("Hidden %s", "debug", level="debug")
+    logger("Hidden %s", "info")
+    assert file.accessed == 0
+    assert not caplog.records
+
+    logger("Shown %s", "warning", level="warning")
+    assert file.accessed == 1
+    assert caplog.records[0].getMessage() == "[counted] Shown warning"
+
+
+def test_trace_disabled(caplog):
+    """Check no per-line tracing without debug logging."""
+    caplog.set_level(logging.INFO)
+    assert not is_tracing()
+
+    parse_castep_file(_DATA_FOLDER / "si8-md.castep")
+
+    assert caplog.records
+    assert all(rec.levelno > logging.DEBUG for rec in caplog.records)
+
+
+def test_trace_enabled(caplog):
+    """Check lines are traced with debug logging."""
+    caplog.set_level(logging.DEBUG)
+    assert is_tracing()
+
+    parse_castep_file(_DATA_FOLDER / "si8-md.castep")
+
+    traced = [rec.getMessage() for rec in caplog.records if rec.levelno == logging.DEBUG]
+    assert traced
+    assert traced[0].startswith(f"[{_DATA_FOLDER / 'si8-md.castep'}:1] ")
@@ -1,4 +1,6 @@
 import io
+from pathlib import Path
+
 import pytest
 
 from castep_outputs.parsers.md_geom_file_parser import parse_header, parse_md_geom_file
@@ -134,3 +136,17 @@ def test_md_geom_no_header(caplog):
 
     for rec in caplog.records:
         assert "Non-standard md/geom file: missing header." in rec.message
+
+
+def test_fixed_columns():
+    """Check lines in CASTEP's fixed layout parse as those matched by pattern."""
+    aligned = (Path(__file__).parent / "data_files" / "test.md").read_text()
+    # Shift values out of fixed columns, and mix aligned and shifted lines
+    shifted = "\n".join(" ".join(line.split()) for line in aligned.splitlines())
+    mixed = "\n".join(line if i % 2 else " ".join(line.split())
+                      for i, line in enumerate(aligned.splitlines()))
+
+    expected = parse_md_geom_file(io.StringIO(shifted))
+
+    assert parse_md_geom_file(io.StringIO(aligned)) == expected
+    assert parse_md_geom_file(io.StringIO(mixed)) == expected
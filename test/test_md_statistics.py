@@ -0,0 +1,82 @@
+"""Test streaming statistics of MD trajectories."""
+
+import math
+import random
+import shutil
+import statistics
+from pathlib import Path
+
+import pytest
+
+from castep_outputs.parsers.md_geom_file_parser import iter_md_geom_file, parse_md_geom_file
+from castep_outputs.tools.md_geom_parser import MDGeomParser
+from castep_outputs.tools.md_statistics import (
+    FIELDS,
+    MDStatistics,
+    RunningStatistics,
+    md_statistics,
+)
+
+DATA_FOLDER = Path(__file__).parent / "data_files"
+
+# Atomic units of .md files in units of .castep files
+HARTREE = 27.211386  # eV
+BOHR_RADIUS = 0.52917721  # Ang
+
+
+@pytest.mark.parametrize("block_size", [1, 7, 100])
+def test_running_statistics(block_size):
+    """Check accumulated statistics match those of the whole series."""
+    rng = random.Random(0)
+    values = [rng.gauss(10, 2) for _ in range(250)]
+    stats = RunningStatistics(block_size)
+    for value in values:
+        stats.add(value)
+
+    assert stats.n == len(values)
+    assert stats.mean == pytest.approx(statistics.fmean(values))
+    assert stats.variance == pytest.approx(statistics.variance(values))
+    assert (stats.min, stats.max) == (min(values), max(values))
+
+    blocks = [statistics.fmean(values[i:i + block_size])
+              for i in range(0, len(values) - block_size + 1, block_size)]
+    assert stats.n_blocks == len(blocks)
+    assert stats.error == pytest.approx(statistics.stdev(blocks) / math.sqrt(len(blocks)))
+
+
+def test_running_statistics_empty():
+    """Check undefined statistics are NaN."""
+    stats = RunningStatistics()
+    stats.add(1.0)
+
+    assert math.isnan(stats.variance)
+    assert math.isnan(stats.error)
+
+    with pytest.raises(ValueError, match="Block size must be positive"):
+        RunningStatistics(0)
+
+
+def test_md_statistics(tmp_path):
+    """Check sources of the same trajectory give the same statistics."""
+    path = shutil.copy(DATA_FOLDER / "si8-md.md", tmp_path)
+    md = md_statistics(path, block_size=1)
+    castep = md_statistics(DATA_FOLDER / "si8-md.castep", block_size=1)
+
+    assert md == md_statistics(MDGeomParser(path, fields=FIELDS), block_size=1)
+    assert md.keys() == {"potential_energy", "hamilt_energy", "kinetic_energy",
+                         "temperature", "volume", "force_Si"}
+    assert md["temperature"]["n"] == castep["temperature"]["n"] == 3
+    assert md["potential_energy"]["mean"] * HARTREE == pytest.approx(
+        castep["potential_energy"]["mean"], rel=1e-5)
+    assert md["force_Si"]["max"] * HARTREE / BOHR_RADIUS == pytest.approx(
+        castep["force_Si"]["max"], rel=1e-3)
+
+
+def test_md_statistics_frames():
+    """Check streamed frames are reduced as parsed frames."""
+    reducer = MDStatistics(block_size=1)
+    for frame in parse_md_geom_file(DATA_FOLDER / "test.md"):
+        reducer.update(frame)
+
+    assert md_statistics(iter_md_geom_file(DATA_FOLDER / "test.md"), block_size=1) == \
+        reducer.summary()
@@ -0,0 +1,48 @@
+"""Test per-section profiling of castep parsing."""
+
+from pathlib import Path
+
+from castep_outputs.parsers.castep_file_parser import Filters, parse_castep_file
+from castep_outputs.utilities.profiling import active_profile, profile_parse
+
+_DATA_FOLDER = Path(__file__).parent / "data_files"
+_MD_FILE = _DATA_FOLDER / "si8-md.castep"
+
+
+def test_profile():
+    """Check statistics are collected for sections found."""
+    with profile_parse() as profile:
+        assert active_profile() is profile
+        parse_castep_file(_MD_FILE, Filters.FULL)
+
+    assert active_profile() is None
+
+    md = profile.sections["md"]
+    assert md.hits == 2
+    assert md.attempts >= md.hits
+    assert md.lines > md.hits
+    assert md.bytes > 0
+    assert md.process_time > 0
+
+    total_lines = sum(stats.lines for stats in profile.sections.values())
+    assert total_lines + profile.dispatch_lines <= len(_MD_FILE.read_text().splitlines())
+    assert profile.sections["build_info"].hits == 1
+    assert "<unmatched lines>" in profile.report()
+
+
+def test_profile_nested():
+    """Check sections of nested blocks are not recorded."""
+    with profile_parse() as profile:
+        data = parse_castep_file(_MD_FILE, Filters.FULL)
+
+    # Forces of MD steps are parsed from nested blocks
+    assert all("forces" in step for step in data[0]["md"])
+    assert profile.sections["forces"].hits == 1
+
+
+def test_profile_unchanged():
+    """Check profiling does not change parsed data."""
+    with profile_parse():
+        profiled = parse_castep_file(_MD_FILE, Filters.FULL)
+
+    assert profiled == parse_castep_file(_MD_FILE, Filters.FULL)